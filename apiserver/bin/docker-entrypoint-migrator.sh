@@ -3,4 +3,5 @@ set -e
 
 python manage.py wait_for_db $1
 
-python manage.py migrate $1
\ No newline at end of file
+python manage.py migrate $1
+python manage.py rebuild_issue_rollups --missing
@@ -1,13 +1,21 @@
 # Django imports
+from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Q
 
 # Third party imports
 from rest_framework import authentication
 from rest_framework.exceptions import AuthenticationFailed
 
 # Module imports
-from plane.db.models import APIToken
+from plane.bgtasks.api_token_task import API_TOKEN_LAST_USED_KEY
+from plane.db.models import APIToken, User
+from plane.settings.redis import redis_client
+from plane.utils.exception_logger import log_exception
+
+# Verified tokens and their users are cached and dropped from the cache
+# whenever they are saved or deleted, the timeout only bounds entries that
+# raced a revocation
+API_TOKEN_CACHE_TIMEOUT = 60
 
 
 class APIKeyAuthentication(authentication.BaseAuthentication):
@@ -22,20 +30,54 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
     def get_api_token(self, request):
         return request.headers.get(self.auth_header_name)
 
-    def validate_api_token(self, token):
+    def get_verified_token(self, token):
+        cache_key = APIToken.cache_key(token)
+        api_token = cache.get(cache_key)
+        if api_token is None:
+            api_token = (
+                APIToken.objects.filter(token=token, is_active=True)
+                .values("id", "user_id", "expired_at", "is_service")
+                .first()
+            )
+            if api_token is None:
+                raise AuthenticationFailed("Given API token is not valid")
+            cache.set(cache_key, api_token, API_TOKEN_CACHE_TIMEOUT)
+        return api_token
+
+    def get_token_user(self, user_id):
+        cache_key = APIToken.user_cache_key(user_id)
+        user = cache.get(cache_key)
+        if user is None:
+            try:
+                user = User.objects.get(pk=user_id)
+            except User.DoesNotExist:
+                raise AuthenticationFailed("Given API token is not valid")
+            cache.set(cache_key, user, API_TOKEN_CACHE_TIMEOUT)
+        return user
+
+    def record_last_used(self, api_token_id):
+        # Coalesced in redis and written in bulk by flush_api_token_last_used,
+        # so authenticating never writes to the database
         try:
-            api_token = APIToken.objects.get(
-                Q(Q(expired_at__gt=timezone.now()) | Q(expired_at__isnull=True)),
-                token=token,
-                is_active=True,
+            redis_client().hset(
+                API_TOKEN_LAST_USED_KEY, str(api_token_id), timezone.now().isoformat()
             )
-        except APIToken.DoesNotExist:
+        except Exception as e:
+            log_exception(e)
+
+    def validate_api_token(self, token):
+        api_token = self.get_verified_token(token)
+
+        # The expiry is checked on every request, cached tokens included
+        if (
+            api_token["expired_at"] is not None
+            and api_token["expired_at"] <= timezone.now()
+        ):
             raise AuthenticationFailed("Given API token is not valid")
 
-        # save api token last used
-        api_token.last_used = timezone.now()
-        api_token.save(update_fields=["last_used"])
-        return (api_token.user, api_token.token)
+        user = self.get_token_user(api_token["user_id"])
+        self.record_last_used(api_token["id"])
+        return (user, api_token)
 
     def authenticate(self, request):
         token = self.get_api_token(request=request)
@@ -43,5 +85,7 @@ class APIKeyAuthentication(authentication.BaseAuthentication):
             return None
 
         # Validate the API token
-        user, token = self.validate_api_token(token)
+        user, api_token = self.validate_api_token(token)
+        # Kept on the request for the throttles of the view
+        request.api_token = api_token
         return user, token
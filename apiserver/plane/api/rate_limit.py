@@ -1,9 +1,14 @@
-from rest_framework.throttling import SimpleRateThrottle
+# Django imports
+from django.conf import settings
 
+# Module imports
+from plane.utils.rate_limit import RedisRateThrottle
 
-class ApiKeyRateThrottle(SimpleRateThrottle):
+
+class ApiKeyRateThrottle(RedisRateThrottle):
     scope = "api_key"
-    rate = "60/minute"
+    rate = settings.API_KEY_RATE_LIMIT
+    burst = settings.API_KEY_RATE_BURST
 
     def get_cache_key(self, request, view):
         # Retrieve the API key from the request header
@@ -17,67 +22,30 @@ class ApiKeyRateThrottle(SimpleRateThrottle):
     def allow_request(self, request, view):
         allowed = super().allow_request(request, view)
 
-        if allowed:
-            now = self.timer()
-            # Calculate the remaining limit and reset time
-            history = self.cache.get(self.key, [])
-
-            # Remove old histories
-            while history and history[-1] <= now - self.duration:
-                history.pop()
-
-            # Calculate the requests
-            num_requests = len(history)
-
-            # Check available requests
-            available = self.num_requests - num_requests
-
-            # Unix timestamp for when the rate limit will reset
-            reset_time = int(now + self.duration)
-
+        if allowed and hasattr(self, "tokens"):
             # Add headers
-            request.META["X-RateLimit-Remaining"] = max(0, available)
-            request.META["X-RateLimit-Reset"] = reset_time
+            request.META["X-RateLimit-Remaining"] = self.remaining()
+            request.META["X-RateLimit-Reset"] = self.reset_time()
 
         return allowed
 
 
-class ServiceTokenRateThrottle(SimpleRateThrottle):
+class ServiceTokenRateThrottle(ApiKeyRateThrottle):
     scope = "service_token"
-    rate = "300/minute"
+    rate = settings.SERVICE_TOKEN_RATE_LIMIT
+    burst = settings.SERVICE_TOKEN_RATE_BURST
 
-    def get_cache_key(self, request, view):
-        # Retrieve the API key from the request header
-        api_key = request.headers.get("X-Api-Key")
-        if not api_key:
-            return None  # Allow the request if there's no API key
 
-        # Use the API key as part of the cache key
-        return f"{self.scope}:{api_key}"
-
-    def allow_request(self, request, view):
-        allowed = super().allow_request(request, view)
-
-        if allowed:
-            now = self.timer()
-            # Calculate the remaining limit and reset time
-            history = self.cache.get(self.key, [])
-
-            # Remove old histories
-            while history and history[-1] <= now - self.duration:
-                history.pop()
+class WorkspaceRateThrottle(RedisRateThrottle):
+    """Quota shared by all the API tokens used against a workspace"""
 
-            # Calculate the requests
-            num_requests = len(history)
+    scope = "workspace_api"
+    rate = settings.WORKSPACE_API_RATE_LIMIT
+    burst = settings.WORKSPACE_API_RATE_BURST
 
-            # Check available requests
-            available = self.num_requests - num_requests
-
-            # Unix timestamp for when the rate limit will reset
-            reset_time = int(now + self.duration)
-
-            # Add headers
-            request.META["X-RateLimit-Remaining"] = max(0, available)
-            request.META["X-RateLimit-Reset"] = reset_time
+    def get_cache_key(self, request, view):
+        slug = view.kwargs.get("slug")
+        if not slug or not request.headers.get("X-Api-Key"):
+            return None
 
-        return allowed
+        return f"{self.scope}:{slug}"
@@ -7,7 +7,6 @@ from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import IntegrityError
 from django.urls import resolve
 from django.utils import timezone
-from plane.db.models.api import APIToken
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -17,7 +16,11 @@ from rest_framework.views import APIView
 
 # Module imports
 from plane.api.middleware.api_authentication import APIKeyAuthentication
-from plane.api.rate_limit import ApiKeyRateThrottle, ServiceTokenRateThrottle
+from plane.api.rate_limit import (
+    ApiKeyRateThrottle,
+    ServiceTokenRateThrottle,
+    WorkspaceRateThrottle,
+)
 from plane.utils.exception_logger import log_exception
 from plane.utils.paginator import BasePaginator
 
@@ -48,18 +51,15 @@ class BaseAPIView(TimezoneMixin, APIView, BasePaginator):
 
     def get_throttles(self):
         throttle_classes = []
-        api_key = self.request.headers.get("X-Api-Key")
+        # Set by the api key authentication from the cached token
+        api_token = getattr(self.request, "api_token", None)
 
-        if api_key:
-            service_token = APIToken.objects.filter(
-                token=api_key, is_service=True
-            ).first()
-
-            if service_token:
-                throttle_classes.append(ServiceTokenRateThrottle())
-                return throttle_classes
+        if api_token and api_token.get("is_service"):
+            throttle_classes.append(ServiceTokenRateThrottle())
+            return throttle_classes
 
         throttle_classes.append(ApiKeyRateThrottle())
+        throttle_classes.append(WorkspaceRateThrottle())
 
         return throttle_classes
 
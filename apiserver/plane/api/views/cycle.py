@@ -659,10 +659,13 @@ class CycleIssueAPIEndpoint(BaseAPIView):
         updated_records = []
         update_cycle_issue_activity = []
         # Iterate over each cycle_issue in cycle_issues
+        now = timezone.now()
         for cycle_issue in cycle_issues:
             old_cycle_id = cycle_issue.cycle_id
-            # Update the cycle_issue's cycle_id
+            # Update the cycle_issue's cycle_id, bulk updates skip auto_now so
+            # the change feed is told about the transfer explicitly
             cycle_issue.cycle_id = cycle_id
+            cycle_issue.updated_at = now
             # Add the modified cycle_issue to the records_to_update list
             updated_records.append(cycle_issue)
             # Record the update activity
@@ -675,7 +678,9 @@ class CycleIssueAPIEndpoint(BaseAPIView):
             )
 
         # Update the cycle issues
-        CycleIssue.objects.bulk_update(updated_records, ["cycle_id"], batch_size=100)
+        CycleIssue.objects.bulk_update(
+            updated_records, ["cycle_id", "updated_at"], batch_size=100
+        )
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -1138,8 +1143,11 @@ class TransferCycleIssueAPIEndpoint(BaseAPIView):
 
         updated_cycles = []
         update_cycle_issue_activity = []
+        now = timezone.now()
         for cycle_issue in cycle_issues:
+            # Bulk updates skip auto_now, stamped for the change feed
             cycle_issue.cycle_id = new_cycle_id
+            cycle_issue.updated_at = now
             updated_cycles.append(cycle_issue)
             update_cycle_issue_activity.append(
                 {
@@ -1150,7 +1158,7 @@ class TransferCycleIssueAPIEndpoint(BaseAPIView):
             )
 
         cycle_issues = CycleIssue.objects.bulk_update(
-            updated_cycles, ["cycle_id"], batch_size=100
+            updated_cycles, ["cycle_id", "updated_at"], batch_size=100
         )
 
         # Capture Issue Activity
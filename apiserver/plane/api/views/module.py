@@ -414,6 +414,8 @@ class ModuleIssueAPIEndpoint(BaseAPIView):
                         }
                     )
                     module_issue[0].module_id = module_id
+                    # Bulk updates skip auto_now, stamped for the change feed
+                    module_issue[0].updated_at = timezone.now()
                     records_to_update.append(module_issue[0])
             else:
                 record_to_create.append(
@@ -431,7 +433,9 @@ class ModuleIssueAPIEndpoint(BaseAPIView):
             record_to_create, batch_size=10, ignore_conflicts=True
         )
 
-        ModuleIssue.objects.bulk_update(records_to_update, ["module"], batch_size=10)
+        ModuleIssue.objects.bulk_update(
+            records_to_update, ["module", "updated_at"], batch_size=10
+        )
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -1,10 +1,11 @@
-from plane.db.models import WorkspaceMember, ProjectMember
 from functools import wraps
 from rest_framework.response import Response
 from rest_framework import status
 
 from enum import Enum
 
+from .membership import get_memberships
+
 
 class ROLE(Enum):
     ADMIN = 20
@@ -29,23 +30,15 @@ def allow_permission(allowed_roles, level="PROJECT", creator=False, model=None):
                 role.value if isinstance(role, ROLE) else role for role in allowed_roles
             ]
 
-            # Check role permissions
+            # Check role permissions, the roles are resolved once per request
+            memberships = get_memberships(request, kwargs["slug"])
             if level == "WORKSPACE":
-                if WorkspaceMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
+                if memberships.has_workspace_role(allowed_role_values):
                     return view_func(instance, request, *args, **kwargs)
             else:
-                if ProjectMember.objects.filter(
-                    member=request.user,
-                    workspace__slug=kwargs["slug"],
-                    project_id=kwargs["project_id"],
-                    role__in=allowed_role_values,
-                    is_active=True,
-                ).exists():
+                if memberships.has_project_role(
+                    kwargs["project_id"], allowed_role_values
+                ):
                     return view_func(instance, request, *args, **kwargs)
 
             # Return permission denied if no conditions are met
@@ -0,0 +1,82 @@
+# Python imports
+from functools import cached_property
+
+# Django imports
+from django.db.models import Q
+
+# Module imports
+from plane.db.models import ProjectMember, WorkspaceMember
+
+GUEST = 5
+
+
+class Memberships:
+    """Roles of a user in a workspace and its projects.
+
+    Each level is loaded with a single query the first time it is needed, the
+    permission decorators and the queryset builders of the same request share
+    the instance returned by get_memberships.
+    """
+
+    def __init__(self, user, slug):
+        self.user = user
+        self.slug = slug
+
+    @cached_property
+    def workspace_role(self):
+        return (
+            WorkspaceMember.objects.filter(
+                member=self.user, workspace__slug=self.slug, is_active=True
+            )
+            .values_list("role", flat=True)
+            .first()
+        )
+
+    @cached_property
+    def projects(self):
+        """Role and guest visibility of every active project membership"""
+        project_members = ProjectMember.objects.filter(
+            member=self.user, workspace__slug=self.slug, is_active=True
+        ).values_list("project_id", "role", "project__guest_view_all_features")
+        return {
+            str(project_id): (role, guest_view_all_features)
+            for project_id, role, guest_view_all_features in project_members
+        }
+
+    def has_workspace_role(self, roles):
+        return self.workspace_role in roles
+
+    def has_project_role(self, project_id, roles):
+        membership = self.projects.get(str(project_id))
+        return membership is not None and membership[0] in roles
+
+    def project_ids(self):
+        """Projects the user is an active member of"""
+        return list(self.projects.keys())
+
+    def issue_filter(self, prefix=""):
+        """Issues the user can see, guests without access to all the features
+        of a project only see the issues they created"""
+        full_access, created_only = [], []
+        for project_id, (role, guest_view_all_features) in self.projects.items():
+            if role > GUEST or (role == GUEST and guest_view_all_features):
+                full_access.append(project_id)
+            elif role == GUEST:
+                created_only.append(project_id)
+
+        return Q(**{f"{prefix}project_id__in": full_access}) | Q(
+            **{
+                f"{prefix}project_id__in": created_only,
+                f"{prefix}created_by": self.user,
+            }
+        )
+
+
+def get_memberships(request, slug):
+    """Memberships of the request user, resolved once per request"""
+    memberships = getattr(request, "_memberships", None)
+    if memberships is None:
+        memberships = request._memberships = {}
+    if slug not in memberships:
+        memberships[slug] = Memberships(request.user, slug)
+    return memberships[slug]
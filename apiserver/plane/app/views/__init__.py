@@ -108,6 +108,7 @@ from .issue.base import (
     BulkDeleteIssuesEndpoint,
     DeletedIssuesListViewSet,
     IssuePaginatedViewSet,
+    IssueSyncViewSet,
     IssueDetailEndpoint,
     IssueBulkUpdateDateEndpoint,
 )
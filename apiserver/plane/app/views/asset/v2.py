@@ -4,6 +4,7 @@ import uuid
 # Django imports
 from django.conf import settings
 from django.http import HttpResponseRedirect
+from django.utils.cache import patch_cache_control
 from django.utils import timezone
 
 # Third party imports
@@ -469,10 +470,14 @@ class StaticFileAssetEndpoint(BaseAPIView):
 
         # Get the presigned URL
         storage = S3Storage(request=request)
-        # Generate a presigned URL to share an S3 object
-        signed_url = storage.generate_presigned_url(object_name=asset.asset.name)
+        # Reuse the URL signed for the asset, browsers may keep the redirect
+        signed_url, max_age = storage.generate_static_presigned_url(
+            object_name=asset.asset.name
+        )
         # Redirect to the signed URL
-        return HttpResponseRedirect(signed_url)
+        response = HttpResponseRedirect(signed_url)
+        patch_cache_control(response, public=True, max_age=max_age)
+        return response
 
 
 class AssetRestoreEndpoint(BaseAPIView):
@@ -4,8 +4,6 @@ import pytz
 
 
 # Django imports
-from django.contrib.postgres.aggregates import ArrayAgg
-from django.contrib.postgres.fields import ArrayField
 from django.db.models import (
     Case,
     CharField,
@@ -14,16 +12,14 @@ from django.db.models import (
     F,
     Func,
     OuterRef,
-    Prefetch,
     Q,
-    UUIDField,
     Value,
     When,
     Sum,
     FloatField,
 )
 from django.db import models
-from django.db.models.functions import Coalesce, Cast, Concat
+from django.db.models.functions import Cast, Concat
 from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
 
@@ -43,17 +39,16 @@ from plane.db.models import (
     UserFavorite,
     CycleUserProperties,
     Issue,
-    Label,
-    User,
     Project,
     ProjectMember,
 )
 from plane.utils.analytics_plot import burndown_plot
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.bgtasks.recent_visited_task import record_recent_visit
 
 # Module imports
 from .. import BaseAPIView, BaseViewSet
 from plane.bgtasks.webhook_task import model_activity
+from plane.utils.issue_rollup import rollup_annotations
 from plane.utils.timezone_converter import (
     convert_utc_to_project_timezone,
     convert_to_utc,
@@ -98,43 +93,9 @@ class CycleViewSet(BaseViewSet):
             )
             .filter(project__archived_at__isnull=True)
             .select_related("project", "workspace", "owned_by")
-            .prefetch_related(
-                Prefetch(
-                    "issue_cycle__issue__assignees",
-                    queryset=User.objects.only(
-                        "avatar_asset", "first_name", "id"
-                    ).distinct(),
-                )
-            )
-            .prefetch_related(
-                Prefetch(
-                    "issue_cycle__issue__labels",
-                    queryset=Label.objects.only("name", "color", "id").distinct(),
-                )
-            )
             .annotate(is_favorite=Exists(favorite_subquery))
             .annotate(
-                total_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group="completed",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                        issue_cycle__deleted_at__isnull=True,
-                    ),
-                )
+                **rollup_annotations("total_issues", "completed_issues", "assignee_ids")
             )
             .annotate(
                 status=Case(
@@ -156,21 +117,6 @@ class CycleViewSet(BaseViewSet):
                     output_field=CharField(),
                 )
             )
-            .annotate(
-                assignee_ids=Coalesce(
-                    ArrayAgg(
-                        "issue_cycle__issue__assignees__id",
-                        distinct=True,
-                        filter=~Q(issue_cycle__issue__assignees__id__isnull=True)
-                        & (
-                            Q(
-                                issue_cycle__issue__issue_assignee__deleted_at__isnull=True
-                            )
-                        ),
-                    ),
-                    Value([], output_field=ArrayField(UUIDField())),
-                )
-            )
             .order_by("-is_favorite", "name")
             .distinct()
         )
@@ -460,7 +406,7 @@ class CycleViewSet(BaseViewSet):
         datetime_fields = ["start_date", "end_date"]
         data = user_timezone_converter(data, datetime_fields, project.timezone)
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="cycle",
             entity_identifier=pk,
@@ -1000,8 +946,11 @@ class TransferCycleIssueEndpoint(BaseAPIView):
 
         updated_cycles = []
         update_cycle_issue_activity = []
+        now = timezone.now()
         for cycle_issue in cycle_issues:
+            # Bulk updates skip auto_now, stamped for the change feed
             cycle_issue.cycle_id = new_cycle_id
+            cycle_issue.updated_at = now
             updated_cycles.append(cycle_issue)
             update_cycle_issue_activity.append(
                 {
@@ -1012,7 +961,7 @@ class TransferCycleIssueEndpoint(BaseAPIView):
             )
 
         cycle_issues = CycleIssue.objects.bulk_update(
-            updated_cycles, ["cycle_id"], batch_size=100
+            updated_cycles, ["cycle_id", "updated_at"], batch_size=100
         )
 
         # Capture Issue Activity
@@ -1073,133 +1022,33 @@ class CycleUserPropertiesEndpoint(BaseAPIView):
 class CycleProgressEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def get(self, request, slug, project_id, cycle_id):
-        aggregate_estimates = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                issue_cycle__cycle_id=cycle_id,
-                issue_cycle__deleted_at__isnull=True,
-                workspace__slug=slug,
-                project_id=project_id,
-            )
-            .annotate(value_as_float=Cast("estimate_point__value", FloatField()))
-            .aggregate(
-                backlog_estimate_point=Sum(
-                    Case(
-                        When(state__group="backlog", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                unstarted_estimate_point=Sum(
-                    Case(
-                        When(state__group="unstarted", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                started_estimate_point=Sum(
-                    Case(
-                        When(state__group="started", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                cancelled_estimate_point=Sum(
-                    Case(
-                        When(state__group="cancelled", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                completed_estimate_points=Sum(
-                    Case(
-                        When(state__group="completed", then="value_as_float"),
-                        default=Value(0),
-                        output_field=FloatField(),
-                    )
-                ),
-                total_estimate_points=Sum(
-                    "value_as_float", default=Value(0), output_field=FloatField()
-                ),
-            )
-        )
-
-        backlog_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="backlog",
-        ).count()
-
-        unstarted_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="unstarted",
-        ).count()
-
-        started_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="started",
-        ).count()
-
-        cancelled_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="cancelled",
-        ).count()
-
-        completed_issues = Issue.issue_objects.filter(
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            workspace__slug=slug,
-            project_id=project_id,
-            state__group="completed",
-        ).count()
+        state_groups = ["backlog", "unstarted", "started", "cancelled", "completed"]
+        points = Q(estimate_point__estimate__type="points")
+        value_as_float = Cast("estimate_point__value", FloatField())
 
-        total_issues = Issue.issue_objects.filter(
+        # Issue counts and estimate points of every state group in one pass
+        progress = Issue.issue_objects.filter(
             issue_cycle__cycle_id=cycle_id,
             issue_cycle__deleted_at__isnull=True,
             workspace__slug=slug,
             project_id=project_id,
-        ).count()
-
-        return Response(
-            {
-                "backlog_estimate_points": aggregate_estimates["backlog_estimate_point"]
-                or 0,
-                "unstarted_estimate_points": aggregate_estimates[
-                    "unstarted_estimate_point"
-                ]
-                or 0,
-                "started_estimate_points": aggregate_estimates["started_estimate_point"]
-                or 0,
-                "cancelled_estimate_points": aggregate_estimates[
-                    "cancelled_estimate_point"
-                ]
-                or 0,
-                "completed_estimate_points": aggregate_estimates[
-                    "completed_estimate_points"
-                ]
-                or 0,
-                "total_estimate_points": aggregate_estimates["total_estimate_points"],
-                "backlog_issues": backlog_issues,
-                "total_issues": total_issues,
-                "completed_issues": completed_issues,
-                "cancelled_issues": cancelled_issues,
-                "started_issues": started_issues,
-                "unstarted_issues": unstarted_issues,
+        ).aggregate(
+            total_issues=Count("id"),
+            total_estimate_points=Sum(value_as_float, filter=points, default=0),
+            **{
+                f"{group}_issues": Count("id", filter=Q(state__group=group))
+                for group in state_groups
+            },
+            **{
+                f"{group}_estimate_points": Sum(
+                    value_as_float, filter=points & Q(state__group=group), default=0
+                )
+                for group in state_groups
             },
-            status=status.HTTP_200_OK,
         )
 
+        return Response(progress, status=status.HTTP_200_OK)
+
 
 class CycleAnalyticsEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
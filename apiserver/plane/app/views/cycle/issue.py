@@ -257,10 +257,13 @@ class CycleIssueViewSet(BaseViewSet):
         updated_records = []
         update_cycle_issue_activity = []
         # Iterate over each cycle_issue in cycle_issues
+        now = timezone.now()
         for cycle_issue in cycle_issues:
             old_cycle_id = cycle_issue.cycle_id
-            # Update the cycle_issue's cycle_id
+            # Update the cycle_issue's cycle_id, bulk updates skip auto_now so
+            # the change feed is told about the transfer explicitly
             cycle_issue.cycle_id = cycle_id
+            cycle_issue.updated_at = now
             # Add the modified cycle_issue to the records_to_update list
             updated_records.append(cycle_issue)
             # Record the update activity
@@ -273,7 +276,9 @@ class CycleIssueViewSet(BaseViewSet):
             )
 
         # Update the cycle issues
-        CycleIssue.objects.bulk_update(updated_records, ["cycle_id"], batch_size=100)
+        CycleIssue.objects.bulk_update(
+            updated_records, ["cycle_id", "updated_at"], batch_size=100
+        )
         # Capture Issue Activity
         issue_activity.delay(
             type="cycle.activity.created",
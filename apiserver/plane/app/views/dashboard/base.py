@@ -44,6 +44,7 @@ from plane.db.models import (
     WorkspaceMember,
     CycleIssue,
 )
+from plane.app.permissions import get_memberships
 from plane.utils.issue_filters import issue_filters
 
 # Module imports
@@ -51,122 +52,32 @@ from .. import BaseAPIView
 
 
 def dashboard_overview_stats(self, request, slug):
-    assigned_issues = (
-        Issue.issue_objects.filter(
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            workspace__slug=slug,
-            assignees__in=[request.user],
-        )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
-        .count()
-    )
-
-    pending_issues_count = (
-        Issue.issue_objects.filter(
-            ~Q(state__group__in=["completed", "cancelled"]),
-            target_date__lt=timezone.now().date(),
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            workspace__slug=slug,
-            assignees__in=[request.user],
-        )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
-        .count()
-    )
-
-    created_issues_count = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            created_by_id=request.user.id,
-        )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
-        .count()
+    # Issues visible to the user as per the project roles of the request
+    issues = Issue.issue_objects.filter(
+        get_memberships(request, slug).issue_filter(), workspace__slug=slug
     )
 
-    completed_issues_count = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            assignees__in=[request.user],
-            state__group="completed",
-        )
-        .filter(
-            Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=True,
-            )
-            | Q(
-                project__project_projectmember__role=5,
-                project__guest_view_all_features=False,
-                created_by=self.request.user,
-            )
-            |
-            # For other roles (role < 5), show all issues
-            Q(project__project_projectmember__role__gt=5),
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-        )
-        .count()
+    # All the counters are computed in a single pass over the issues, the
+    # assignee join multiplies the rows so the issues are counted distinct
+    assigned = Q(assignees__in=[request.user])
+    counts = issues.aggregate(
+        assigned_issues_count=Count("id", filter=assigned, distinct=True),
+        pending_issues_count=Count(
+            "id",
+            filter=assigned
+            & ~Q(state__group__in=["completed", "cancelled"])
+            & Q(target_date__lt=timezone.now().date()),
+            distinct=True,
+        ),
+        completed_issues_count=Count(
+            "id", filter=assigned & Q(state__group="completed"), distinct=True
+        ),
+        created_issues_count=Count(
+            "id", filter=Q(created_by_id=request.user.id), distinct=True
+        ),
     )
 
-    return Response(
-        {
-            "assigned_issues_count": assigned_issues,
-            "pending_issues_count": pending_issues_count,
-            "completed_issues_count": completed_issues_count,
-            "created_issues_count": created_issues_count,
-        },
-        status=status.HTTP_200_OK,
-    )
+    return Response(counts, status=status.HTTP_200_OK)
 
 
 def dashboard_assigned_issues(self, request, slug):
@@ -177,8 +88,7 @@ def dashboard_assigned_issues(self, request, slug):
     assigned_issues = (
         Issue.issue_objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__member=request.user,
-            project__project_projectmember__is_active=True,
+            project_id__in=get_memberships(request, slug).project_ids(),
             assignees__in=[request.user],
         )
         .filter(**filters)
@@ -357,8 +267,7 @@ def dashboard_created_issues(self, request, slug):
     created_issues = (
         Issue.issue_objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__member=request.user,
-            project__project_projectmember__is_active=True,
+            project_id__in=get_memberships(request, slug).project_ids(),
             created_by=request.user,
         )
         .filter(**filters)
@@ -516,16 +425,13 @@ def dashboard_issues_by_state_groups(self, request, slug):
     state_order = ["backlog", "unstarted", "started", "completed", "cancelled"]
     extra_filters = {}
 
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug, member=request.user, role=5, is_active=True
-    ).exists():
+    if get_memberships(request, slug).workspace_role == 5:
         extra_filters = {"created_by": request.user}
 
     issues_by_state_groups = (
         Issue.issue_objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
+            project_id__in=get_memberships(request, slug).project_ids(),
             assignees__in=[request.user],
         )
         .filter(**filters, **extra_filters)
@@ -553,16 +459,13 @@ def dashboard_issues_by_priority(self, request, slug):
     priority_order = ["urgent", "high", "medium", "low", "none"]
     extra_filters = {}
 
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug, member=request.user, role=5, is_active=True
-    ).exists():
+    if get_memberships(request, slug).workspace_role == 5:
         extra_filters = {"created_by": request.user}
 
     issues_by_priority = (
         Issue.issue_objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
+            project_id__in=get_memberships(request, slug).project_ids(),
             assignees__in=[request.user],
         )
         .filter(**filters, **extra_filters)
@@ -589,8 +492,7 @@ def dashboard_recent_activity(self, request, slug):
     queryset = IssueActivity.objects.filter(
         ~Q(field__in=["comment", "vote", "reaction", "draft"]),
         workspace__slug=slug,
-        project__project_projectmember__member=request.user,
-        project__project_projectmember__is_active=True,
+        project_id__in=get_memberships(request, slug).project_ids(),
         project__archived_at__isnull=True,
         actor=request.user,
     ).select_related("actor", "workspace", "issue", "project")[:8]
@@ -604,8 +506,7 @@ def dashboard_recent_projects(self, request, slug):
     project_ids = (
         IssueActivity.objects.filter(
             workspace__slug=slug,
-            project__project_projectmember__member=request.user,
-            project__project_projectmember__is_active=True,
+            project_id__in=get_memberships(request, slug).project_ids(),
             project__archived_at__isnull=True,
             actor=request.user,
         )
@@ -619,8 +520,7 @@ def dashboard_recent_projects(self, request, slug):
     # Fetch additional projects only if needed
     if len(unique_project_ids) < 4:
         additional_projects = Project.objects.filter(
-            project_projectmember__member=request.user,
-            project_projectmember__is_active=True,
+            id__in=get_memberships(request, slug).project_ids(),
             archived_at__isnull=True,
             workspace__slug=slug,
         ).exclude(id__in=unique_project_ids)
@@ -19,7 +19,7 @@ from plane.app.serializers import (
     EstimateReadSerializer,
 )
 from plane.utils.cache import invalidate_cache
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import bulk_issue_activity
 
 
 def generate_random_name(length=10):
@@ -217,20 +217,20 @@ class EstimatePointEndpoint(BaseViewSet):
                 workspace__slug=slug,
                 estimate_point_id=estimate_point_id,
             )
-            for issue in issues:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps(
+            activity_events = [
+                {
+                    "type": "issue.activity.updated",
+                    "requested_data": json.dumps(
                         {
                             "estimate_point": (
                                 str(new_estimate_id) if new_estimate_id else None
                             )
                         }
                     ),
-                    actor_id=str(request.user.id),
-                    issue_id=issue.id,
-                    project_id=str(project_id),
-                    current_instance=json.dumps(
+                    "actor_id": str(request.user.id),
+                    "issue_id": str(issue.id),
+                    "project_id": str(project_id),
+                    "current_instance": json.dumps(
                         {
                             "estimate_point": (
                                 str(issue.estimate_point_id)
@@ -239,23 +239,27 @@ class EstimatePointEndpoint(BaseViewSet):
                             )
                         }
                     ),
-                    epoch=int(timezone.now().timestamp()),
-                )
-                issues.update(estimate_point_id=new_estimate_id)
+                    "epoch": int(timezone.now().timestamp()),
+                }
+                for issue in issues
+            ]
+            issues.update(estimate_point_id=new_estimate_id)
+            if activity_events:
+                bulk_issue_activity.delay(events=activity_events)
         else:
             issues = Issue.objects.filter(
                 project_id=project_id,
                 workspace__slug=slug,
                 estimate_point_id=estimate_point_id,
             )
-            for issue in issues:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps({"estimate_point": None}),
-                    actor_id=str(request.user.id),
-                    issue_id=issue.id,
-                    project_id=str(project_id),
-                    current_instance=json.dumps(
+            activity_events = [
+                {
+                    "type": "issue.activity.updated",
+                    "requested_data": json.dumps({"estimate_point": None}),
+                    "actor_id": str(request.user.id),
+                    "issue_id": str(issue.id),
+                    "project_id": str(project_id),
+                    "current_instance": json.dumps(
                         {
                             "estimate_point": (
                                 str(issue.estimate_point_id)
@@ -264,8 +268,12 @@ class EstimatePointEndpoint(BaseViewSet):
                             )
                         }
                     ),
-                    epoch=int(timezone.now().timestamp()),
-                )
+                    "epoch": int(timezone.now().timestamp()),
+                }
+                for issue in issues
+            ]
+            if activity_events:
+                bulk_issue_activity.delay(events=activity_events)
 
         # delete the estimate point
         old_estimate_point = EstimatePoint.objects.filter(pk=estimate_point_id).first()
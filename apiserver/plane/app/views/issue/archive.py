@@ -18,7 +18,7 @@ from plane.app.serializers import (
     IssueSerializer,
     IssueDetailSerializer,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import bulk_issue_activity, issue_activity
 from plane.db.models import (
     Issue,
     FileAsset,
@@ -311,6 +311,7 @@ class BulkArchiveIssuesEndpoint(BaseAPIView):
             workspace__slug=slug, project_id=project_id, pk__in=issue_ids
         ).select_related("state")
         bulk_archive_issues = []
+        activity_events = []
         for issue in issues:
             if issue.state.group not in ["completed", "cancelled"]:
                 return Response(
@@ -320,25 +321,32 @@ class BulkArchiveIssuesEndpoint(BaseAPIView):
                     },
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            issue_activity.delay(
-                type="issue.activity.updated",
-                requested_data=json.dumps(
-                    {"archived_at": str(timezone.now().date()), "automation": False}
-                ),
-                actor_id=str(request.user.id),
-                issue_id=str(issue.id),
-                project_id=str(project_id),
-                current_instance=json.dumps(
-                    IssueSerializer(issue).data, cls=DjangoJSONEncoder
-                ),
-                epoch=int(timezone.now().timestamp()),
-                notification=True,
-                origin=request.META.get("HTTP_ORIGIN"),
+            activity_events.append(
+                {
+                    "type": "issue.activity.updated",
+                    "requested_data": json.dumps(
+                        {"archived_at": str(timezone.now().date()), "automation": False}
+                    ),
+                    "actor_id": str(request.user.id),
+                    "issue_id": str(issue.id),
+                    "project_id": str(project_id),
+                    "current_instance": json.dumps(
+                        IssueSerializer(issue).data, cls=DjangoJSONEncoder
+                    ),
+                    "epoch": int(timezone.now().timestamp()),
+                    "notification": True,
+                }
             )
             issue.archived_at = timezone.now().date()
             bulk_archive_issues.append(issue)
         Issue.objects.bulk_update(bulk_archive_issues, ["archived_at"])
 
+        # Log all the activities in one task
+        if activity_events:
+            bulk_issue_activity.delay(
+                events=activity_events, origin=request.META.get("HTTP_ORIGIN")
+            )
+
         return Response(
             {"archived_at": str(timezone.now().date())}, status=status.HTTP_200_OK
         )
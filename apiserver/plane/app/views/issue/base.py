@@ -1,10 +1,12 @@
 # Python imports
 import json
+from datetime import datetime, timedelta, timezone as dt_timezone
 
 # Django imports
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
 from django.db.models import (
     Exists,
     F,
@@ -33,7 +35,7 @@ from plane.app.serializers import (
     IssueUserPropertySerializer,
     IssueSerializer,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import bulk_issue_activity, issue_activity
 from plane.db.models import (
     Issue,
     FileAsset,
@@ -44,6 +46,9 @@ from plane.db.models import (
     Project,
     ProjectMember,
     CycleIssue,
+    IssueAssignee,
+    IssueLabel,
+    ModuleIssue,
 )
 from plane.utils.grouper import (
     issue_group_values,
@@ -55,7 +60,7 @@ from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
 from .. import BaseAPIView, BaseViewSet
 from plane.utils.timezone_converter import user_timezone_converter
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.bgtasks.recent_visited_task import record_recent_visit
 from plane.utils.global_paginator import paginate
 from plane.bgtasks.webhook_task import model_activity
 
@@ -127,7 +132,7 @@ class IssueListEndpoint(BaseAPIView):
             queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by
         )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=project_id,
             entity_name="project",
@@ -254,7 +259,7 @@ class IssueViewSet(BaseViewSet):
             queryset=issue_queryset, group_by=group_by, sub_group_by=sub_group_by
         )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=project_id,
             entity_name="project",
@@ -558,7 +563,7 @@ class IssueViewSet(BaseViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             entity_name="issue",
             entity_identifier=pk,
@@ -712,10 +717,34 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
             workspace__slug=slug, project_id=project_id, pk__in=issue_ids
         )
 
-        total_issues = len(issues)
+        deleted_issue_ids = [
+            str(issue_id) for issue_id in issues.values_list("id", flat=True)
+        ]
+        total_issues = len(deleted_issue_ids)
 
         issues.delete()
 
+        # Log the deletes like single ones, this also refreshes the rollups
+        # of the cycles and modules the issues were in
+        epoch = int(timezone.now().timestamp())
+        if deleted_issue_ids:
+            bulk_issue_activity.delay(
+                events=[
+                    {
+                        "type": "issue.activity.deleted",
+                        "requested_data": json.dumps({"issue_id": issue_id}),
+                        "actor_id": str(request.user.id),
+                        "issue_id": issue_id,
+                        "project_id": str(project_id),
+                        "current_instance": {},
+                        "epoch": epoch,
+                        "notification": True,
+                    }
+                    for issue_id in deleted_issue_ids
+                ],
+                origin=request.META.get("HTTP_ORIGIN"),
+            )
+
         return Response(
             {"message": f"{total_issues} issues were deleted"},
             status=status.HTTP_200_OK,
@@ -739,6 +768,35 @@ class DeletedIssuesListViewSet(BaseAPIView):
 
 
 class IssuePaginatedViewSet(BaseViewSet):
+    required_fields = [
+        "id",
+        "name",
+        "state_id",
+        "state__group",
+        "sort_order",
+        "completed_at",
+        "estimate_point",
+        "priority",
+        "start_date",
+        "target_date",
+        "sequence_id",
+        "project_id",
+        "parent_id",
+        "cycle_id",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "updated_by",
+        "is_draft",
+        "archived_at",
+        "module_ids",
+        "label_ids",
+        "assignee_ids",
+        "link_count",
+        "attachment_count",
+        "sub_issues_count",
+    ]
+
     def get_queryset(self):
         workspace_slug = self.kwargs.get("slug")
         project_id = self.kwargs.get("project_id")
@@ -780,6 +838,45 @@ class IssuePaginatedViewSet(BaseViewSet):
             )
         ).distinct()
 
+    def annotate_relation_ids(self, queryset):
+        return queryset.annotate(
+            label_ids=Coalesce(
+                ArrayAgg(
+                    "labels__id",
+                    distinct=True,
+                    filter=Q(
+                        ~Q(labels__id__isnull=True)
+                        & Q(label_issue__deleted_at__isnull=True)
+                    ),
+                ),
+                Value([], output_field=ArrayField(UUIDField())),
+            ),
+            assignee_ids=Coalesce(
+                ArrayAgg(
+                    "assignees__id",
+                    distinct=True,
+                    filter=Q(
+                        ~Q(assignees__id__isnull=True)
+                        & Q(assignees__member_project__is_active=True)
+                        & Q(issue_assignee__deleted_at__isnull=True)
+                    ),
+                ),
+                Value([], output_field=ArrayField(UUIDField())),
+            ),
+            module_ids=Coalesce(
+                ArrayAgg(
+                    "issue_module__module_id",
+                    distinct=True,
+                    filter=Q(
+                        ~Q(issue_module__module_id__isnull=True)
+                        & Q(issue_module__module__archived_at__isnull=True)
+                        & Q(issue_module__deleted_at__isnull=True)
+                    ),
+                ),
+                Value([], output_field=ArrayField(UUIDField())),
+            ),
+        )
+
     def process_paginated_result(self, fields, results, timezone):
         paginated_data = results.values(*fields)
 
@@ -798,34 +895,7 @@ class IssuePaginatedViewSet(BaseViewSet):
         updated_at = request.GET.get("updated_at__gt", None)
 
         # required fields
-        required_fields = [
-            "id",
-            "name",
-            "state_id",
-            "state__group",
-            "sort_order",
-            "completed_at",
-            "estimate_point",
-            "priority",
-            "start_date",
-            "target_date",
-            "sequence_id",
-            "project_id",
-            "parent_id",
-            "cycle_id",
-            "created_at",
-            "updated_at",
-            "created_by",
-            "updated_by",
-            "is_draft",
-            "archived_at",
-            "module_ids",
-            "label_ids",
-            "assignee_ids",
-            "link_count",
-            "attachment_count",
-            "sub_issues_count",
-        ]
+        required_fields = list(self.required_fields)
 
         if str(is_description_required).lower() == "true":
             required_fields.append("description_html")
@@ -856,43 +926,7 @@ class IssuePaginatedViewSet(BaseViewSet):
             base_queryset = base_queryset.filter(updated_at__gt=updated_at)
             queryset = queryset.filter(updated_at__gt=updated_at)
 
-        queryset = queryset.annotate(
-            label_ids=Coalesce(
-                ArrayAgg(
-                    "labels__id",
-                    distinct=True,
-                    filter=Q(
-                        ~Q(labels__id__isnull=True)
-                        & Q(label_issue__deleted_at__isnull=True)
-                    ),
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-            assignee_ids=Coalesce(
-                ArrayAgg(
-                    "assignees__id",
-                    distinct=True,
-                    filter=Q(
-                        ~Q(assignees__id__isnull=True)
-                        & Q(assignees__member_project__is_active=True)
-                        & Q(issue_assignee__deleted_at__isnull=True)
-                    ),
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-            module_ids=Coalesce(
-                ArrayAgg(
-                    "issue_module__module_id",
-                    distinct=True,
-                    filter=Q(
-                        ~Q(issue_module__module_id__isnull=True)
-                        & Q(issue_module__module__archived_at__isnull=True)
-                        & Q(issue_module__deleted_at__isnull=True)
-                    ),
-                ),
-                Value([], output_field=ArrayField(UUIDField())),
-            ),
-        )
+        queryset = self.annotate_relation_ids(queryset)
 
         paginated_data = paginate(
             base_queryset=base_queryset,
@@ -906,6 +940,179 @@ class IssuePaginatedViewSet(BaseViewSet):
         return Response(paginated_data, status=status.HTTP_200_OK)
 
 
+# Sync tokens are the microseconds since the epoch of the last change sent
+SYNC_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+# Timestamps are taken before the statements writing them start, the lag
+# covers that gap and the clock drift between the api servers
+SYNC_LAG = timedelta(seconds=2)
+SYNC_PAGE_SIZE = 500
+SYNC_MAX_PAGE_SIZE = 1000
+
+
+def encode_sync_token(value):
+    return str((value - SYNC_EPOCH) // timedelta(microseconds=1))
+
+
+def decode_sync_token(token):
+    return SYNC_EPOCH + timedelta(microseconds=int(token))
+
+
+def sync_upper_bound():
+    """Latest change time a token can be handed out for.
+
+    A transaction still running can commit changes stamped after its start at
+    any time, so the bound is held back to the start of the oldest open
+    transaction on the database however long it runs.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT min(xact_start) FROM pg_stat_activity
+            WHERE datname = current_database() AND pid <> pg_backend_pid()
+            AND backend_type = 'client backend'
+            """
+        )
+        (oldest,) = cursor.fetchone()
+    now = timezone.now()
+    return (min(now, oldest) if oldest else now) - SYNC_LAG
+
+
+class IssueSyncViewSet(IssuePaginatedViewSet):
+    """Change feed of the issues of a project.
+
+    Returns the issues changed since the sync token along with tombstones for
+    the issues deleted, archived or otherwise hidden and for the labels,
+    assignees, cycles and modules removed from issues. Pages are cut on change
+    timestamps, the returned token is passed back until `has_more` is false.
+    Tokens never move past the start of a transaction still open, changes
+    committed late are sent on a later sync instead of being skipped.
+    """
+
+    # Relations reported when removed, as (model, related field)
+    sync_relations = {
+        "labels": (IssueLabel, "label_id"),
+        "assignees": (IssueAssignee, "assignee_id"),
+        "cycles": (CycleIssue, "cycle_id"),
+        "modules": (ModuleIssue, "module_id"),
+    }
+
+    def sync_sources(self, slug, project_id, created_by=None):
+        """Issue ids and change timestamps of the issues and their relations"""
+        filters = {"workspace__slug": slug, "project_id": project_id}
+        issue_scope = {"created_by": created_by} if created_by else {}
+        relation_scope = {"issue__created_by": created_by} if created_by else {}
+        return [
+            Issue.all_objects.filter(**filters, **issue_scope)
+            .values_list("id", "updated_at")
+            .order_by(),
+            *[
+                model.all_objects.filter(**filters, **relation_scope)
+                .values_list("issue_id", "updated_at")
+                .order_by()
+                for model, _ in self.sync_relations.values()
+            ],
+        ]
+
+    @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
+    def list(self, request, slug, project_id):
+        try:
+            after = request.GET.get("sync_token")
+            after = decode_sync_token(after) if after else None
+            page_size = max(
+                1,
+                min(
+                    int(request.GET.get("per_page", SYNC_PAGE_SIZE)), SYNC_MAX_PAGE_SIZE
+                ),
+            )
+        except (ValueError, OverflowError):
+            return Response(
+                {"error": "Invalid sync token"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        project = Project.objects.get(pk=project_id, workspace__slug=slug)
+        created_by = (
+            request.user
+            if ProjectMember.objects.filter(
+                workspace__slug=slug,
+                project_id=project_id,
+                member=request.user,
+                role=5,
+                is_active=True,
+            ).exists()
+            and not project.guest_view_all_features
+            else None
+        )
+
+        # Without a token the client has nothing to tombstone, only the
+        # visible issues are sent
+        if after is None:
+            sources = [
+                Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
+                .values_list("id", "updated_at")
+                .order_by()
+            ]
+            if created_by:
+                sources = [sources[0].filter(created_by=created_by)]
+        else:
+            sources = [
+                source.filter(updated_at__gt=after)
+                for source in self.sync_sources(slug, project_id, created_by)
+            ]
+
+        upper = sync_upper_bound()
+        sources = [source.filter(updated_at__lte=upper) for source in sources]
+
+        # The page ends on the timestamp of its last change, every change
+        # sharing that timestamp is sent with it so none is skipped
+        changes = list(
+            sources[0].union(*sources[1:]).order_by("updated_at")[: page_size + 1]
+        )
+        has_more = len(changes) > page_size
+        if has_more:
+            upper = changes[page_size - 1][1]
+            sources = [source.filter(updated_at__lte=upper) for source in sources]
+            changes = list(sources[0].union(*sources[1:]))
+        issue_ids = {issue_id for issue_id, _ in changes}
+
+        required_fields = list(self.required_fields)
+        if str(request.GET.get("description", "false")).lower() == "true":
+            required_fields.append("description_html")
+
+        issues = self.get_queryset().filter(pk__in=issue_ids)
+        if created_by:
+            issues = issues.filter(created_by=created_by)
+        issues = self.process_paginated_result(
+            required_fields,
+            self.annotate_relation_ids(issues),
+            request.user.user_timezone,
+        )
+
+        removed = {}
+        if after is not None:
+            for key, (model, field) in self.sync_relations.items():
+                relations = model.all_objects.filter(
+                    workspace__slug=slug,
+                    project_id=project_id,
+                    deleted_at__isnull=False,
+                    updated_at__gt=after,
+                    updated_at__lte=upper,
+                )
+                if created_by:
+                    relations = relations.filter(issue__created_by=created_by)
+                removed[key] = list(relations.values("issue_id", field))
+
+        return Response(
+            {
+                "sync_token": encode_sync_token(max(upper, after or SYNC_EPOCH)),
+                "has_more": has_more,
+                "issues": issues,
+                "deleted_issues": list(issue_ids - {issue["id"] for issue in issues}),
+                "removed": removed,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class IssueDetailEndpoint(BaseAPIView):
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
     def get(self, request, slug, project_id):
@@ -1019,6 +1226,7 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
         issues = list(Issue.objects.filter(id__in=issue_ids))
         issues_dict = {str(issue.id): issue for issue in issues}
         issues_to_update = []
+        activity_events = []
 
         for update in updates:
             issue_id = update["id"]
@@ -1039,31 +1247,39 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
                 )
 
             if start_date:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps({"start_date": update.get("start_date")}),
-                    current_instance=json.dumps({"start_date": str(issue.start_date)}),
-                    issue_id=str(issue_id),
-                    actor_id=str(request.user.id),
-                    project_id=str(project_id),
-                    epoch=epoch,
+                activity_events.append(
+                    {
+                        "type": "issue.activity.updated",
+                        "requested_data": json.dumps(
+                            {"start_date": update.get("start_date")}
+                        ),
+                        "current_instance": json.dumps(
+                            {"start_date": str(issue.start_date)}
+                        ),
+                        "issue_id": str(issue_id),
+                        "actor_id": str(request.user.id),
+                        "project_id": str(project_id),
+                        "epoch": epoch,
+                    }
                 )
                 issue.start_date = start_date
                 issues_to_update.append(issue)
 
             if target_date:
-                issue_activity.delay(
-                    type="issue.activity.updated",
-                    requested_data=json.dumps(
-                        {"target_date": update.get("target_date")}
-                    ),
-                    current_instance=json.dumps(
-                        {"target_date": str(issue.target_date)}
-                    ),
-                    issue_id=str(issue_id),
-                    actor_id=str(request.user.id),
-                    project_id=str(project_id),
-                    epoch=epoch,
+                activity_events.append(
+                    {
+                        "type": "issue.activity.updated",
+                        "requested_data": json.dumps(
+                            {"target_date": update.get("target_date")}
+                        ),
+                        "current_instance": json.dumps(
+                            {"target_date": str(issue.target_date)}
+                        ),
+                        "issue_id": str(issue_id),
+                        "actor_id": str(request.user.id),
+                        "project_id": str(project_id),
+                        "epoch": epoch,
+                    }
                 )
                 issue.target_date = target_date
                 issues_to_update.append(issue)
@@ -1071,6 +1287,10 @@ class IssueBulkUpdateDateEndpoint(BaseAPIView):
         # Bulk update issues
         Issue.objects.bulk_update(issues_to_update, ["start_date", "target_date"])
 
+        # Log all the activities in one task
+        if activity_events:
+            bulk_issue_activity.delay(events=activity_events)
+
         return Response(
             {"message": "Issues updated successfully"}, status=status.HTTP_200_OK
         )
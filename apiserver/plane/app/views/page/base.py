@@ -38,7 +38,7 @@ from plane.utils.error_codes import ERROR_CODES
 from ..base import BaseAPIView, BaseViewSet
 from plane.bgtasks.page_transaction_task import page_transaction
 from plane.bgtasks.page_version_task import page_version
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.bgtasks.recent_visited_task import record_recent_visit
 
 
 def unarchive_archive_page_and_descendants(page_id, archived_at):
@@ -225,7 +225,7 @@ class PageViewSet(BaseViewSet):
             ).values_list("entity_identifier", flat=True)
             data = PageDetailSerializer(page).data
             data["issue_ids"] = issue_ids
-            recent_visited_task.delay(
+            record_recent_visit(
                 slug=slug,
                 entity_name="page",
                 entity_identifier=pk,
@@ -7,6 +7,7 @@ from plane.db.models import PageVersion
 from ..base import BaseAPIView
 from plane.app.serializers import PageVersionSerializer, PageVersionDetailSerializer
 from plane.app.permissions import allow_permission, ROLE
+from plane.utils.page_version import PAGE_VERSION_LIMIT, page_version_description
 
 
 class PageVersionEndpoint(BaseAPIView):
@@ -18,12 +19,25 @@ class PageVersionEndpoint(BaseAPIView):
             page_version = PageVersion.objects.get(
                 workspace__slug=slug, page_id=page_id, pk=pk
             )
+            # Rebuild the description of versions stored as deltas
+            (page_version.description_html, page_version.description_binary) = (
+                page_version_description(page_version)
+            )
             # Serialize the page version
             serializer = PageVersionDetailSerializer(page_version)
             return Response(serializer.data, status=status.HTTP_200_OK)
-        # Return all page versions
-        page_versions = PageVersion.objects.filter(
-            workspace__slug=slug, page_id=page_id
+        # Return all page versions, the snapshots kept for the deltas excluded
+        page_versions = (
+            PageVersion.objects.filter(workspace__slug=slug, page_id=page_id)
+            .defer(
+                "description_html",
+                "description_binary",
+                "description_stripped",
+                "description_json",
+                "html_data",
+                "binary_data",
+            )
+            .order_by("-last_saved_at")[:PAGE_VERSION_LIMIT]
         )
         # Serialize the page versions
         serializer = PageVersionSerializer(page_versions, many=True)
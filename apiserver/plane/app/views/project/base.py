@@ -38,9 +38,13 @@ from plane.db.models import (
     Workspace,
     WorkspaceMember,
 )
-from plane.utils.cache import cache_response
+from plane.utils.cache import (
+    cache_response,
+    invalidate_cache_tags,
+    invalidate_public_board_cache,
+)
 from plane.bgtasks.webhook_task import model_activity
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.bgtasks.recent_visited_task import record_recent_visit
 from plane.utils.exception_logger import log_exception
 
 
@@ -241,7 +245,7 @@ class ProjectViewSet(BaseViewSet):
                 {"error": "Project does not exist"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=pk,
             entity_name="project",
@@ -350,6 +354,9 @@ class ProjectViewSet(BaseViewSet):
                     origin=request.META.get("HTTP_ORIGIN"),
                 )
 
+                # The creator is a member of the project now
+                invalidate_cache_tags(workspace=slug)
+
                 serializer = ProjectListSerializer(project)
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -437,6 +444,7 @@ class ProjectViewSet(BaseViewSet):
                     slug=slug,
                     origin=request.META.get("HTTP_ORIGIN"),
                 )
+                invalidate_cache_tags(workspace=slug, project=pk)
                 serializer = ProjectListSerializer(project)
                 return Response(serializer.data, status=status.HTTP_200_OK)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -475,10 +483,14 @@ class ProjectViewSet(BaseViewSet):
 
             # Delete the project members
             DeployBoard.objects.filter(project_id=pk, workspace__slug=slug).delete()
+            invalidate_public_board_cache([pk])
 
             # Delete the user favorite
             UserFavorite.objects.filter(project_id=pk, workspace__slug=slug).delete()
 
+            # Drop the cached responses listing the project
+            invalidate_cache_tags(workspace=slug, project=pk)
+
             return Response(status=status.HTTP_204_NO_CONTENT)
         else:
             return Response(
@@ -494,6 +506,7 @@ class ProjectArchiveUnarchiveEndpoint(BaseAPIView):
         project.archived_at = timezone.now()
         project.save()
         UserFavorite.objects.filter(workspace__slug=slug, project=project_id).delete()
+        invalidate_cache_tags(workspace=slug, project=project_id)
         return Response(
             {"archived_at": str(project.archived_at)}, status=status.HTTP_200_OK
         )
@@ -503,6 +516,7 @@ class ProjectArchiveUnarchiveEndpoint(BaseAPIView):
         project = Project.objects.get(pk=project_id, workspace__slug=slug)
         project.archived_at = None
         project.save()
+        invalidate_cache_tags(workspace=slug, project=project_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
@@ -27,6 +27,7 @@ from plane.db.models import (
     WorkspaceMember,
     IssueUserProperty,
 )
+from plane.utils.cache import invalidate_cache_tags, invalidate_group_values_cache
 
 
 class ProjectInvitationsViewset(BaseViewSet):
@@ -177,6 +178,10 @@ class UserProjectInvitationsViewset(BaseViewSet):
             ignore_conflicts=True,
         )
 
+        # The bulk writes skip the signals invalidating the cached members
+        invalidate_group_values_cache(workspace.id, *project_ids)
+        invalidate_cache_tags(workspace=slug)
+
         return Response(
             {"message": "Projects joined successfully"}, status=status.HTTP_201_CREATED
         )
@@ -239,6 +244,8 @@ class ProjectJoinEndpoint(BaseAPIView):
                     project_member.role = project_member.role
                     project_member.save()
 
+                invalidate_cache_tags(workspace=slug, project=project_id)
+
                 return Response(
                     {"message": "Project Invitation Accepted"},
                     status=status.HTTP_200_OK,
@@ -18,6 +18,7 @@ from plane.app.permissions import (
 
 from plane.db.models import Project, ProjectMember, IssueUserProperty, WorkspaceMember
 from plane.bgtasks.project_add_user_email_task import project_add_user_email
+from plane.utils.cache import invalidate_cache_tags, invalidate_group_values_cache
 from plane.utils.host import base_host
 from plane.app.permissions.base import allow_permission, ROLE
 
@@ -154,6 +155,11 @@ class ProjectMemberViewSet(BaseViewSet):
             bulk_issue_props, batch_size=10, ignore_conflicts=True
         )
 
+        # The bulk writes skip the signals invalidating the cached members
+        invalidate_group_values_cache(project.workspace_id, project_id)
+        # The workspace lists of the new members include the project now
+        invalidate_cache_tags(workspace=slug, project=project_id)
+
         project_members = ProjectMember.objects.filter(
             project_id=project_id,
             member_id__in=[member.get("member_id") for member in members],
@@ -270,6 +276,7 @@ class ProjectMemberViewSet(BaseViewSet):
 
         project_member.is_active = False
         project_member.save()
+        invalidate_cache_tags(workspace=slug, project=project_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @allow_permission([ROLE.ADMIN, ROLE.MEMBER, ROLE.GUEST])
@@ -298,6 +305,7 @@ class ProjectMemberViewSet(BaseViewSet):
         # Deactivate the user
         project_member.is_active = False
         project_member.save()
+        invalidate_cache_tags(workspace=slug, project=project_id)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
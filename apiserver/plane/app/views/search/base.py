@@ -22,7 +22,9 @@ from plane.db.models import (
     Page,
     IssueView,
     ProjectPage,
+    ProjectMember,
 )
+from plane.utils.issue_search import search_filter, search_rank
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -30,6 +32,15 @@ class GlobalSearchEndpoint(BaseAPIView):
     also show related workspace if found
     """
 
+    def member_projects(self, slug):
+        """Active projects of the workspace the user is a member of"""
+        return ProjectMember.objects.filter(
+            member=self.request.user,
+            is_active=True,
+            project__archived_at__isnull=True,
+            workspace__slug=slug,
+        ).values("project_id")
+
     def filter_workspaces(self, query, slug, project_id, workspace_search):
         fields = ["name"]
         q = Q()
@@ -67,80 +78,71 @@ class GlobalSearchEndpoint(BaseAPIView):
                 sequences = re.findall(r"\b\d+\b", query)
                 for sequence_id in sequences:
                     q |= Q(**{"sequence_id": sequence_id})
+            elif field == "name":
+                q |= search_filter(query, field)
             else:
                 q |= Q(**{f"{field}__icontains": query})
 
         issues = Issue.issue_objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
+            q, project_id__in=Subquery(self.member_projects(slug)), workspace__slug=slug
         )
 
         if workspace_search == "false" and project_id:
             issues = issues.filter(project_id=project_id)
 
-        return issues.distinct().values(
-            "name",
-            "id",
-            "sequence_id",
-            "project__identifier",
-            "project_id",
-            "workspace__slug",
-        )[:100]
+        return (
+            issues.annotate(search_rank=search_rank(query))
+            .order_by("-search_rank", "-created_at")
+            .values(
+                "name",
+                "id",
+                "sequence_id",
+                "project__identifier",
+                "project_id",
+                "workspace__slug",
+            )[:100]
+        )
 
     def filter_cycles(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         cycles = Cycle.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
+            search_filter(query),
+            project_id__in=Subquery(self.member_projects(slug)),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
             cycles = cycles.filter(project_id=project_id)
 
-        return cycles.distinct().values(
-            "name", "id", "project_id", "project__identifier", "workspace__slug"
+        return (
+            cycles.annotate(search_rank=search_rank(query))
+            .order_by("-search_rank", "-created_at")
+            .values(
+                "name", "id", "project_id", "project__identifier", "workspace__slug"
+            )
         )
 
     def filter_modules(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         modules = Module.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
+            search_filter(query),
+            project_id__in=Subquery(self.member_projects(slug)),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
             modules = modules.filter(project_id=project_id)
 
-        return modules.distinct().values(
-            "name", "id", "project_id", "project__identifier", "workspace__slug"
+        return (
+            modules.annotate(search_rank=search_rank(query))
+            .order_by("-search_rank", "-created_at")
+            .values(
+                "name", "id", "project_id", "project__identifier", "workspace__slug"
+            )
         )
 
     def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         pages = (
             Page.objects.filter(
-                q,
+                search_filter(query),
                 projects__project_projectmember__member=self.request.user,
                 projects__project_projectmember__is_active=True,
                 projects__archived_at__isnull=True,
@@ -175,8 +177,13 @@ class GlobalSearchEndpoint(BaseAPIView):
                 project_id=project_id
             )
 
-        return pages.distinct().values(
-            "name", "id", "project_ids", "project_identifiers", "workspace__slug"
+        return (
+            pages.annotate(search_rank=search_rank(query))
+            .order_by("-search_rank", "-created_at")
+            .distinct()
+            .values(
+                "name", "id", "project_ids", "project_identifiers", "workspace__slug"
+            )
         )
 
     def filter_views(self, query, slug, project_id, workspace_search):
@@ -32,6 +32,7 @@ from plane.db.models import (
     Session,
 )
 from plane.license.models import Instance, InstanceAdmin
+from plane.utils.cache import invalidate_cache_tags, invalidate_group_values_cache
 from plane.utils.paginator import BasePaginator
 from plane.authentication.utils.host import user_ip
 from plane.bgtasks.user_deactivation_email_task import user_deactivation_email
@@ -144,6 +145,19 @@ class UserEndpoint(BaseViewSet):
             workspaces_to_deactivate, ["is_active"], batch_size=100
         )
 
+        # The bulk updates skip the signals invalidating the cached members
+        for workspace in workspaces_to_deactivate:
+            invalidate_group_values_cache(
+                workspace.workspace_id,
+                *[
+                    project.project_id
+                    for project in projects_to_deactivate
+                    if project.workspace_id == workspace.workspace_id
+                ],
+            )
+        # Cached responses of the user in every workspace
+        invalidate_cache_tags(user=user.id)
+
         # Delete all workspace invites
         WorkspaceMemberInvite.objects.filter(email=user.email).delete()
 
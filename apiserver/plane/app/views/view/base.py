@@ -33,7 +33,7 @@ from plane.utils.grouper import (
 from plane.utils.issue_filters import issue_filters
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import GroupedOffsetPaginator, SubGroupedOffsetPaginator
-from plane.bgtasks.recent_visited_task import recent_visited_task
+from plane.bgtasks.recent_visited_task import record_recent_visit
 from .. import BaseViewSet
 from plane.db.models import UserFavorite
 
@@ -106,7 +106,7 @@ class WorkspaceViewViewSet(BaseViewSet):
     def retrieve(self, request, slug, pk):
         issue_view = self.get_queryset().filter(pk=pk).first()
         serializer = IssueViewSerializer(issue_view)
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=None,
             entity_name="view",
@@ -435,7 +435,7 @@ class IssueViewViewSet(BaseViewSet):
             )
 
         serializer = IssueViewSerializer(issue_view)
-        recent_visited_task.delay(
+        record_recent_visit(
             slug=slug,
             project_id=project_id,
             entity_name="view",
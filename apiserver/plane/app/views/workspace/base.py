@@ -38,6 +38,7 @@ from plane.app.permissions import ROLE, allow_permission
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_cookie
+from plane.utils.cache import invalidate_cache_tags
 from plane.utils.constants import RESTRICTED_WORKSPACE_SLUGS
 from plane.license.utils.instance_value import get_configuration_value
 
@@ -142,11 +143,15 @@ class WorkSpaceViewSet(BaseViewSet):
 
     @allow_permission([ROLE.ADMIN], level="WORKSPACE")
     def partial_update(self, request, *args, **kwargs):
-        return super().partial_update(request, *args, **kwargs)
+        response = super().partial_update(request, *args, **kwargs)
+        invalidate_cache_tags(workspace=kwargs.get("slug"))
+        return response
 
     @allow_permission([ROLE.ADMIN], level="WORKSPACE")
     def destroy(self, request, *args, **kwargs):
-        return super().destroy(request, *args, **kwargs)
+        response = super().destroy(request, *args, **kwargs)
+        invalidate_cache_tags(workspace=kwargs.get("slug"))
+        return response
 
 
 class UserWorkSpacesEndpoint(BaseAPIView):
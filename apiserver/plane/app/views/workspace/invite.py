@@ -25,7 +25,11 @@ from plane.app.views.base import BaseAPIView
 from plane.bgtasks.event_tracking_task import workspace_invite_event
 from plane.bgtasks.workspace_invitation_task import workspace_invitation
 from plane.db.models import User, Workspace, WorkspaceMember, WorkspaceMemberInvite
-from plane.utils.cache import invalidate_cache, invalidate_cache_directly
+from plane.utils.cache import (
+    invalidate_cache,
+    invalidate_cache_directly,
+    invalidate_group_values_cache,
+)
 
 from .. import BaseViewSet
 
@@ -290,6 +294,10 @@ class UserWorkspaceInvitationsViewSet(BaseViewSet):
             ignore_conflicts=True,
         )
 
+        # The bulk writes skip the signals invalidating the cached members
+        for invitation in workspace_invitations:
+            invalidate_group_values_cache(invitation.workspace_id)
+
         # Delete joined workspace invites
         workspace_invitations.delete()
 
@@ -17,7 +17,11 @@ from plane.app.serializers import (
 )
 from plane.app.views.base import BaseAPIView
 from plane.db.models import Project, ProjectMember, WorkspaceMember, DraftIssue
-from plane.utils.cache import invalidate_cache
+from plane.utils.cache import (
+    invalidate_cache,
+    invalidate_cache_tags,
+    invalidate_group_values_cache,
+)
 
 from .. import BaseViewSet
 
@@ -79,6 +83,7 @@ class WorkSpaceMemberViewSet(BaseViewSet):
 
         if serializer.is_valid():
             serializer.save()
+            invalidate_cache_tags(workspace=slug)
             return Response(serializer.data, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -130,12 +135,17 @@ class WorkSpaceMemberViewSet(BaseViewSet):
             )
 
         # Deactivate the users from the projects where the user is part of
-        _ = ProjectMember.objects.filter(
+        project_members = ProjectMember.objects.filter(
             workspace__slug=slug, member_id=workspace_member.member_id, is_active=True
-        ).update(is_active=False)
+        )
+        project_ids = list(project_members.values_list("project_id", flat=True))
+        _ = project_members.update(is_active=False)
+        # The update skips the signals invalidating the cached members
+        invalidate_group_values_cache(workspace_member.workspace_id, *project_ids)
 
         workspace_member.is_active = False
         workspace_member.save()
+        invalidate_cache_tags(workspace=slug)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @invalidate_cache(
@@ -191,13 +201,18 @@ class WorkSpaceMemberViewSet(BaseViewSet):
             )
 
         # # Deactivate the users from the projects where the user is part of
-        _ = ProjectMember.objects.filter(
+        project_members = ProjectMember.objects.filter(
             workspace__slug=slug, member_id=workspace_member.member_id, is_active=True
-        ).update(is_active=False)
+        )
+        project_ids = list(project_members.values_list("project_id", flat=True))
+        _ = project_members.update(is_active=False)
+        # The update skips the signals invalidating the cached members
+        invalidate_group_values_cache(workspace_member.workspace_id, *project_ids)
 
         # # Deactivate the user
         workspace_member.is_active = False
         workspace_member.save()
+        invalidate_cache_tags(workspace=slug)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
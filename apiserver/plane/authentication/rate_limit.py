@@ -8,9 +8,10 @@ from plane.authentication.adapter.error import (
     AuthenticationException,
     AUTHENTICATION_ERROR_CODES,
 )
+from plane.utils.rate_limit import RedisRateThrottle
 
 
-class AuthenticationThrottle(AnonRateThrottle):
+class AuthenticationThrottle(RedisRateThrottle, AnonRateThrottle):
     rate = "30/minute"
     scope = "authentication"
 
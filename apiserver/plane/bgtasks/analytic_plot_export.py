@@ -44,7 +44,7 @@ CYCLE_ID = "issue_cycle__cycle_id"
 MODULE_ID = "issue_module__module_id"
 
 
-def send_export_email(email, slug, csv_buffer, rows):
+def send_export_email(email, slug, csv_buffer):
     """Helper function to send export email."""
     subject = "Your Export is ready"
     html_content = render_to_string("emails/exports/analytics.html", {})
@@ -175,215 +175,81 @@ def get_cycle_details(slug, filters):
     )
 
 
+def get_dimension_names(slug, filters, dimension):
+    """Display names of the values of an axis or segment, keyed by id"""
+    if dimension == ASSIGNEE_ID:
+        return {
+            str(assignee[ASSIGNEE_ID]): "{} {}".format(
+                assignee["assignees__first_name"], assignee["assignees__last_name"]
+            )
+            for assignee in get_assignee_details(slug, filters)
+        }
+    if dimension == LABEL_ID:
+        return {
+            str(label[LABEL_ID]): label["labels__name"]
+            for label in get_label_details(slug, filters)
+        }
+    if dimension == STATE_ID:
+        return {
+            str(state[STATE_ID]): state["state__name"]
+            for state in get_state_details(slug, filters)
+        }
+    if dimension == CYCLE_ID:
+        return {
+            str(cycle[CYCLE_ID]): cycle["issue_cycle__cycle__name"]
+            for cycle in get_cycle_details(slug, filters)
+        }
+    if dimension == MODULE_ID:
+        return {
+            str(module[MODULE_ID]): module["issue_module__module__name"]
+            for module in get_module_details(slug, filters)
+        }
+    return {}
+
+
 def generate_csv_from_rows(rows):
     """Generate CSV buffer from rows."""
     csv_buffer = io.StringIO()
     writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
-    [writer.writerow(row) for row in rows]
+    writer.writerows(rows)
     return csv_buffer
 
 
-def generate_segmented_rows(
-    distribution,
-    x_axis,
-    y_axis,
-    segment,
-    key,
-    assignee_details,
-    label_details,
-    state_details,
-    cycle_details,
-    module_details,
-):
-    segment_zero = list(
-        set(
-            item.get("segment") for sublist in distribution.values() for item in sublist
-        )
+def generate_segmented_rows(distribution, x_axis, y_axis, key, x_names, segment_names):
+    """Yield the header and a row per x axis value, with the total and the
+    value of every segment"""
+    # Pivot the distribution into a column per segment, the first value of a
+    # segment wins as before
+    columns = {}
+    for item, data in distribution.items():
+        column = columns.setdefault(item, {})
+        for obj in data:
+            column.setdefault(obj.get("segment"), obj.get(key))
+    segments = list(
+        dict.fromkeys(segment for column in columns.values() for segment in column)
     )
 
-    segmented = segment
-
-    row_zero = [
-        row_mapping.get(x_axis, "X-Axis"),
-        row_mapping.get(y_axis, "Y-Axis"),
-    ] + segment_zero
+    yield tuple(
+        [row_mapping.get(x_axis, "X-Axis"), row_mapping.get(y_axis, "Y-Axis")]
+        + [segment_names.get(str(segment), segment) for segment in segments]
+    )
 
-    rows = []
     for item, data in distribution.items():
-        generated_row = [
-            item,
-            sum(obj.get(key) for obj in data if obj.get(key) is not None),
-        ]
-
-        for segment in segment_zero:
-            value = next((x.get(key) for x in data if x.get("segment") == segment), "0")
-            generated_row.append(value)
-
-        if x_axis == ASSIGNEE_ID:
-            assignee = next(
-                (
-                    user
-                    for user in assignee_details
-                    if str(user[ASSIGNEE_ID]) == str(item)
-                ),
-                None,
-            )
-            if assignee:
-                generated_row[0] = (
-                    f"{assignee['assignees__first_name']} {assignee['assignees__last_name']}"
-                )
-
-        if x_axis == LABEL_ID:
-            label = next(
-                (lab for lab in label_details if str(lab[LABEL_ID]) == str(item)), None
-            )
-
-            if label:
-                generated_row[0] = f"{label['labels__name']}"
-
-        if x_axis == STATE_ID:
-            state = next(
-                (sta for sta in state_details if str(sta[STATE_ID]) == str(item)), None
-            )
-
-            if state:
-                generated_row[0] = f"{state['state__name']}"
-
-        if x_axis == CYCLE_ID:
-            cycle = next(
-                (cyc for cyc in cycle_details if str(cyc[CYCLE_ID]) == str(item)), None
-            )
-
-            if cycle:
-                generated_row[0] = f"{cycle['issue_cycle__cycle__name']}"
-
-        if x_axis == MODULE_ID:
-            module = next(
-                (mod for mod in module_details if str(mod[MODULE_ID]) == str(item)),
-                None,
-            )
-
-            if module:
-                generated_row[0] = f"{module['issue_module__module__name']}"
-
-        rows.append(tuple(generated_row))
-
-    if segmented == ASSIGNEE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            assignee = next(
-                (
-                    user
-                    for user in assignee_details
-                    if str(user[ASSIGNEE_ID]) == str(segm)
-                ),
-                None,
-            )
-            if assignee:
-                row_zero[index + 2] = (
-                    f"{assignee['assignees__first_name']} {assignee['assignees__last_name']}"
-                )
-
-    if segmented == LABEL_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            label = next(
-                (lab for lab in label_details if str(lab[LABEL_ID]) == str(segm)), None
-            )
-            if label:
-                row_zero[index + 2] = label["labels__name"]
-
-    if segmented == STATE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            state = next(
-                (sta for sta in state_details if str(sta[STATE_ID]) == str(segm)), None
-            )
-            if state:
-                row_zero[index + 2] = state["state__name"]
+        column = columns[item]
+        yield tuple(
+            [
+                x_names.get(str(item), item),
+                sum(obj.get(key) for obj in data if obj.get(key) is not None),
+            ]
+            + [column.get(segment, "0") for segment in segments]
+        )
 
-    if segmented == MODULE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            module = next(
-                (mod for mod in label_details if str(mod[MODULE_ID]) == str(segm)), None
-            )
-            if module:
-                row_zero[index + 2] = module["issue_module__module__name"]
 
-    if segmented == CYCLE_ID:
-        for index, segm in enumerate(row_zero[2:]):
-            cycle = next(
-                (cyc for cyc in cycle_details if str(cyc[CYCLE_ID]) == str(segm)), None
-            )
-            if cycle:
-                row_zero[index + 2] = cycle["issue_cycle__cycle__name"]
-
-    return [tuple(row_zero)] + rows
-
-
-def generate_non_segmented_rows(
-    distribution,
-    x_axis,
-    y_axis,
-    key,
-    assignee_details,
-    label_details,
-    state_details,
-    cycle_details,
-    module_details,
-):
-    rows = []
+def generate_non_segmented_rows(distribution, x_axis, y_axis, key, x_names):
+    """Yield the header and a row per x axis value"""
+    yield (row_mapping.get(x_axis, "X-Axis"), row_mapping.get(y_axis, "Y-Axis"))
     for item, data in distribution.items():
-        row = [item, data[0].get("count" if y_axis == "issue_count" else "estimate")]
-
-        if x_axis == ASSIGNEE_ID:
-            assignee = next(
-                (
-                    user
-                    for user in assignee_details
-                    if str(user[ASSIGNEE_ID]) == str(item)
-                ),
-                None,
-            )
-            if assignee:
-                row[0] = (
-                    f"{assignee['assignees__first_name']} {assignee['assignees__last_name']}"
-                )
-
-        if x_axis == LABEL_ID:
-            label = next(
-                (lab for lab in label_details if str(lab[LABEL_ID]) == str(item)), None
-            )
-
-            if label:
-                row[0] = f"{label['labels__name']}"
-
-        if x_axis == STATE_ID:
-            state = next(
-                (sta for sta in state_details if str(sta[STATE_ID]) == str(item)), None
-            )
-
-            if state:
-                row[0] = f"{state['state__name']}"
-
-        if x_axis == CYCLE_ID:
-            cycle = next(
-                (cyc for cyc in cycle_details if str(cyc[CYCLE_ID]) == str(item)), None
-            )
-
-            if cycle:
-                row[0] = f"{cycle['issue_cycle__cycle__name']}"
-
-        if x_axis == MODULE_ID:
-            module = next(
-                (mod for mod in module_details if str(mod[MODULE_ID]) == str(item)),
-                None,
-            )
-
-            if module:
-                row[0] = f"{module['issue_module__module__name']}"
-
-        rows.append(tuple(row))
-
-    row_zero = [row_mapping.get(x_axis, "X-Axis"), row_mapping.get(y_axis, "Y-Axis")]
-    return [tuple(row_zero)] + rows
+        yield (x_names.get(str(item), item), data[0].get(key))
 
 
 @shared_task
@@ -401,64 +267,22 @@ def analytic_export_task(email, data, slug):
         )
         key = "count" if y_axis == "issue_count" else "estimate"
 
-        assignee_details = (
-            get_assignee_details(slug, filters)
-            if x_axis == ASSIGNEE_ID or segment == ASSIGNEE_ID
-            else {}
-        )
-
-        label_details = (
-            get_label_details(slug, filters)
-            if x_axis == LABEL_ID or segment == LABEL_ID
-            else {}
-        )
-
-        state_details = (
-            get_state_details(slug, filters)
-            if x_axis == STATE_ID or segment == STATE_ID
-            else {}
-        )
-
-        cycle_details = (
-            get_cycle_details(slug, filters)
-            if x_axis == CYCLE_ID or segment == CYCLE_ID
-            else {}
-        )
-
-        module_details = (
-            get_module_details(slug, filters)
-            if x_axis == MODULE_ID or segment == MODULE_ID
-            else {}
-        )
+        # Names of the ids on the axes, looked up in constant time per cell
+        x_names = get_dimension_names(slug, filters, x_axis)
+        segment_names = get_dimension_names(slug, filters, segment) if segment else {}
 
         if segment:
             rows = generate_segmented_rows(
-                distribution,
-                x_axis,
-                y_axis,
-                segment,
-                key,
-                assignee_details,
-                label_details,
-                state_details,
-                cycle_details,
-                module_details,
+                distribution, x_axis, y_axis, key, x_names, segment_names
             )
         else:
             rows = generate_non_segmented_rows(
-                distribution,
-                x_axis,
-                y_axis,
-                key,
-                assignee_details,
-                label_details,
-                state_details,
-                cycle_details,
-                module_details,
+                distribution, x_axis, y_axis, key, x_names
             )
 
+        # The rows are written as they are generated
         csv_buffer = generate_csv_from_rows(rows)
-        send_export_email(email, slug, csv_buffer, rows)
+        send_export_email(email, slug, csv_buffer)
         logging.getLogger("plane").info("Email sent succesfully.")
         return
     except Exception as e:
@@ -1,15 +1,106 @@
+# Python imports
+import json
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+# Django imports
+from django.db import connection
 from django.utils import timezone
-from datetime import timedelta
-from plane.db.models import APIActivityLog
+
+# Third party imports
 from celery import shared_task
 
+# Module imports
+from plane.db.models import APIActivityLog
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+# Redis list the api log middleware appends the requests to
+API_LOG_BUFFER_KEY = "api_activity_logs"
+API_LOG_FLUSH_BATCH_SIZE = 1000
+
+# The logs are range partitioned by day on created_at, see migration 0088
+API_LOG_PARTITION_PREFIX = "api_activity_logs_p"
+API_LOG_RETENTION_DAYS = 30
+API_LOG_PARTITION_DAYS_AHEAD = 7
+
 
 @shared_task
-def delete_api_logs():
-    # Get the logs older than 30 days to delete
-    logs_to_delete = APIActivityLog.objects.filter(
-        created_at__lte=timezone.now() - timedelta(days=30)
+def flush_api_logs():
+    ri = redis_instance()
+    while True:
+        # Read and trim the batch atomically so concurrent flushes never
+        # insert the same entries twice
+        pipeline = ri.pipeline()
+        pipeline.lrange(API_LOG_BUFFER_KEY, 0, API_LOG_FLUSH_BATCH_SIZE - 1)
+        pipeline.ltrim(API_LOG_BUFFER_KEY, API_LOG_FLUSH_BATCH_SIZE, -1)
+        entries, _ = pipeline.execute()
+        if not entries:
+            return
+
+        try:
+            APIActivityLog.objects.bulk_create(
+                [APIActivityLog(**json.loads(entry)) for entry in entries],
+                batch_size=API_LOG_FLUSH_BATCH_SIZE,
+            )
+        except Exception as e:
+            # Put the batch back for the next flush
+            ri.rpush(API_LOG_BUFFER_KEY, *entries)
+            log_exception(e)
+            return
+
+        if len(entries) < API_LOG_FLUSH_BATCH_SIZE:
+            return
+
+
+def api_log_partition(day):
+    return f"{API_LOG_PARTITION_PREFIX}{day:%Y%m%d}"
+
+
+def create_api_log_partitions(cursor, today):
+    for offset in range(API_LOG_PARTITION_DAYS_AHEAD + 1):
+        day = today + timedelta(days=offset)
+        start = datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+        try:
+            cursor.execute(
+                f'CREATE TABLE IF NOT EXISTS "{api_log_partition(day)}" '
+                "PARTITION OF api_activity_logs FOR VALUES FROM (%s) TO (%s)",
+                [start, start + timedelta(days=1)],
+            )
+        except Exception as e:
+            log_exception(e)
+
+
+def drop_api_log_partitions(cursor, cutoff):
+    cursor.execute(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = %s
+        """,
+        ["api_activity_logs"],
     )
+    for (partition,) in cursor.fetchall():
+        if not partition.startswith(API_LOG_PARTITION_PREFIX):
+            continue
+        day = datetime.strptime(
+            partition[len(API_LOG_PARTITION_PREFIX) :], "%Y%m%d"
+        ).date()
+        # Drop the partitions whose whole day is past the retention
+        if day < cutoff.date():
+            cursor.execute(f'DROP TABLE IF EXISTS "{partition}"')
+
+
+@shared_task
+def delete_api_logs():
+    cutoff = timezone.now() - timedelta(days=API_LOG_RETENTION_DAYS)
+
+    with connection.cursor() as cursor:
+        # Retention is a partition drop instead of a delete of every row
+        drop_api_log_partitions(cursor, cutoff)
+        create_api_log_partitions(cursor, timezone.now().date())
 
-    # Delete the logs
+    # Only the rows of the default partition and of the partial day are left
+    logs_to_delete = APIActivityLog.objects.filter(created_at__lte=cutoff)
     logs_to_delete._raw_delete(logs_to_delete.db)
@@ -0,0 +1,37 @@
+# Python imports
+from datetime import datetime
+
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import APIToken
+from plane.settings.redis import redis_instance
+
+# Redis hash of token id to the last time it was used, written by the api key
+# authentication and flushed to the database in bulk
+API_TOKEN_LAST_USED_KEY = "api_token_last_used"
+
+
+@shared_task
+def flush_api_token_last_used():
+    ri = redis_instance()
+
+    # Read and clear the hash atomically, uses recorded after are kept
+    pipeline = ri.pipeline()
+    pipeline.hgetall(API_TOKEN_LAST_USED_KEY)
+    pipeline.delete(API_TOKEN_LAST_USED_KEY)
+    last_used, _ = pipeline.execute()
+    if not last_used:
+        return
+
+    APIToken.objects.bulk_update(
+        [
+            APIToken(
+                id=token_id.decode(), last_used=datetime.fromisoformat(used.decode())
+            )
+            for token_id, used in last_used.items()
+        ],
+        ["last_used"],
+        batch_size=500,
+    )
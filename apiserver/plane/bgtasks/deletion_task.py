@@ -1,16 +1,113 @@
+# Python imports
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
-from django.db import models
-from django.db.models.fields.related import OneToOneRel
+from django.db import DatabaseError, connection, transaction
+from django.db.models import CASCADE, Q
 
 
 # Third party imports
 from celery import shared_task
 
+# Module imports
+from plane.utils.cache import invalidate_group_values_cache
+from plane.utils.exception_logger import log_exception
+
+# Rows updated or deleted per statement, each batch is its own short transaction
+DELETION_BATCH_SIZE = 1000
+# Models hard deleted at the same time, within a layer of the deletion order
+DELETION_WORKERS = 4
+# Models the grouped issue lists cache the ids of
+GROUP_VALUE_MODELS = {
+    "db.Cycle",
+    "db.Label",
+    "db.Module",
+    "db.Project",
+    "db.ProjectMember",
+    "db.State",
+    "db.WorkspaceMember",
+}
+
+
+def chunks(items, size=DELETION_BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+@lru_cache(maxsize=None)
+def cascade_graph(model):
+    """Reverse relations of a model followed by a soft delete, as
+    (related model, foreign key name, set null) computed once per model"""
+    relations = []
+    for relation in model._meta.get_fields():
+        if not (
+            (relation.one_to_many or relation.one_to_one)
+            and relation.auto_created
+            and not relation.concrete
+        ):
+            continue
 
-@shared_task
+        on_delete_name = getattr(relation.on_delete, "__name__", "")
+        if on_delete_name == "DO_NOTHING":
+            continue
+
+        related_model = relation.related_model
+        if on_delete_name == "SET_NULL":
+            relations.append((related_model, relation.remote_field.name, True))
+        elif hasattr(related_model, "deleted_at"):
+            # Rows that can not be soft deleted are removed by the hard delete
+            relations.append((related_model, relation.remote_field.name, False))
+    return relations
+
+
+def soft_delete_cascade(model, pks, deleted_at):
+    """Soft delete every row depending on the given rows with set based
+    updates, one per relation and chunk of rows.
+
+    The rows are stamped with the deletion time of the root, rows already
+    carrying the stamp are walked again so an interrupted cascade can be
+    resumed by running it again.
+    """
+    counts = Counter()
+    seen = {model: set(pks)}
+    pending = [(model, list(pks))]
+    while pending:
+        model, pks = pending.pop()
+        for chunk in chunks(pks):
+            for related_model, field, set_null in cascade_graph(model):
+                related = related_model._base_manager.filter(**{f"{field}__in": chunk})
+                if set_null:
+                    related.update(**{field: None})
+                    continue
+
+                related_pks = [
+                    pk
+                    for pk in related.filter(
+                        Q(deleted_at__isnull=True) | Q(deleted_at=deleted_at)
+                    ).values_list("pk", flat=True)
+                    if pk not in seen.setdefault(related_model, set())
+                ]
+                if not related_pks:
+                    continue
+
+                for related_chunk in chunks(related_pks):
+                    counts[related_model._meta.label] += (
+                        related_model.all_objects.filter(
+                            pk__in=related_chunk, deleted_at__isnull=True
+                        ).update(deleted_at=deleted_at, updated_at=timezone.now())
+                    )
+                seen[related_model].update(related_pks)
+                pending.append((related_model, related_pks))
+    return counts
+
+
+@shared_task(autoretry_for=(DatabaseError,), retry_backoff=True, max_retries=5)
 def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
     """
     Soft delete related objects for a given model instance
@@ -24,209 +121,117 @@ def soft_delete_related_objects(app_label, model_name, instance_pk, using=None):
     except model_class.DoesNotExist:
         return
 
-    # Get all related fields that are reverse relationships
-    all_related = [
-        f
-        for f in instance._meta.get_fields()
-        if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
-    ]
-
-    # Handle each related field
-    for relation in all_related:
-        related_name = relation.get_accessor_name()
-
-        # Skip if the relation doesn't exist
-        if not hasattr(instance, related_name):
-            continue
-
-        # Get the on_delete behavior name
-        on_delete_name = (
-            relation.on_delete.__name__
-            if hasattr(relation.on_delete, "__name__")
-            else ""
-        )
-
-        if on_delete_name == "DO_NOTHING":
-            continue
-
-        elif on_delete_name == "SET_NULL":
-            # Handle SET_NULL relationships
-            if isinstance(relation, OneToOneRel):
-                # For OneToOne relationships
-                related_obj = getattr(instance, related_name, None)
-                if related_obj and isinstance(related_obj, models.Model):
-                    setattr(related_obj, relation.remote_field.name, None)
-                    related_obj.save(update_fields=[relation.remote_field.name])
-            else:
-                # For other relationships
-                related_queryset = getattr(instance, related_name).all()
-                related_queryset.update(**{relation.remote_field.name: None})
-
-        else:
-            # Handle CASCADE and other delete behaviors
-            try:
-                if relation.one_to_one:
-                    # Handle OneToOne relationships
-                    related_obj = getattr(instance, related_name, None)
-                    if related_obj:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-                else:
-                    # Handle other relationships
-                    related_queryset = getattr(instance, related_name).all()
-                    for related_obj in related_queryset:
-                        if hasattr(related_obj, "deleted_at"):
-                            if not related_obj.deleted_at:
-                                related_obj.deleted_at = timezone.now()
-                                related_obj.save()
-                                # Recursively handle related objects
-                                soft_delete_related_objects(
-                                    related_obj._meta.app_label,
-                                    related_obj._meta.model_name,
-                                    related_obj.pk,
-                                    using,
-                                )
-            except Exception as e:
-                # Log the error or handle as needed
-                print(f"Error handling relation {related_name}: {str(e)}")
-                continue
+    deleted_at = getattr(instance, "deleted_at", None) or timezone.now()
+    counts = soft_delete_cascade(model_class, [instance.pk], deleted_at)
 
     # Finally, soft delete the instance itself if it hasn't been deleted yet
     if hasattr(instance, "deleted_at") and not instance.deleted_at:
-        instance.deleted_at = timezone.now()
+        instance.deleted_at = deleted_at
         instance.save()
 
+    # The cascade updates skip the signals invalidating the cached group values
+    if GROUP_VALUE_MODELS & set(counts):
+        if model_class._meta.label == "db.Workspace":
+            workspace_id = instance.pk
+            project_ids = (
+                apps.get_model("db", "Project")
+                .all_objects.filter(workspace_id=instance.pk)
+                .values_list("pk", flat=True)
+            )
+        elif model_class._meta.label == "db.Project":
+            workspace_id, project_ids = instance.workspace_id, [instance.pk]
+        else:
+            workspace_id = getattr(instance, "workspace_id", None)
+            project_ids = [getattr(instance, "project_id", None)]
+        if workspace_id:
+            invalidate_group_values_cache(workspace_id, *project_ids)
+
+    logging.getLogger("plane").info(
+        f"Soft deleted {model_class._meta.label} {instance_pk}: {dict(counts)}"
+    )
+    return dict(counts)
+
 
 # @shared_task
 def restore_related_objects(app_label, model_name, instance_pk, using=None):
     pass
 
 
+def hard_delete_layers():
+    """Soft deletable models in the order they are hard deleted, the models of
+    a layer do not reference each other and only reference later layers"""
+    models = [model for model in apps.get_models() if hasattr(model, "deleted_at")]
+    # Only cascading references make the delete of a row collect other rows
+    dependents = {model: set() for model in models}
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if (
+                field.related_model in dependents
+                and field.related_model is not model
+                and field.remote_field.on_delete is CASCADE
+            ):
+                dependents[field.related_model].add(model)
+
+    layers = []
+    remaining = set(models)
+    while remaining:
+        layer = [model for model in remaining if not dependents[model] & remaining]
+        if not layer:
+            # Break a reference cycle with the model least referenced
+            layer = [
+                min(
+                    remaining,
+                    key=lambda model: (
+                        len(dependents[model] & remaining),
+                        model._meta.label,
+                    ),
+                )
+            ]
+        layers.append(sorted(layer, key=lambda model: model._meta.label))
+        remaining.difference_update(layer)
+    return layers
+
+
+def hard_delete_model(model, before):
+    """Delete the rows soft deleted before the given time in small batches,
+    a run stopped midway is resumed by the next one"""
+    deleted = 0
+    try:
+        queryset = model.all_objects.filter(deleted_at__lt=before).order_by()
+        while True:
+            pks = list(queryset.values_list("pk", flat=True)[:DELETION_BATCH_SIZE])
+            if not pks:
+                break
+            with transaction.atomic():
+                model.all_objects.filter(pk__in=pks).delete()
+            deleted += len(pks)
+    except Exception as e:
+        # The rows left are collected along with the models referenced later
+        log_exception(e)
+    finally:
+        # Every worker thread holds its own connection
+        connection.close()
+    return deleted
+
+
 @shared_task
 def hard_delete():
-    from plane.db.models import (
-        Workspace,
-        Project,
-        Cycle,
-        Module,
-        Issue,
-        Page,
-        IssueView,
-        Label,
-        State,
-        IssueActivity,
-        IssueComment,
-        IssueLink,
-        IssueReaction,
-        UserFavorite,
-        ModuleIssue,
-        CycleIssue,
-        Estimate,
-        EstimatePoint,
-    )
-
     days = settings.HARD_DELETE_AFTER_DAYS
-    # check delete workspace
-    _ = Workspace.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete project
-    _ = Project.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete cycle
-    _ = Cycle.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete module
-    _ = Module.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete issue
-    _ = Issue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete page
-    _ = Page.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete view
-    _ = IssueView.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete label
-    _ = Label.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete state
-    _ = State.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueActivity.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueComment.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueLink.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueReaction.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = UserFavorite.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = ModuleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = CycleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = Estimate.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = EstimatePoint.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # at last, check for every thing which ever is left and delete it
-    # Get all Django models
-    all_models = apps.get_models()
-
-    # Iterate through all models
-    for model in all_models:
-        # Check if the model has a 'deleted_at' field
-        if hasattr(model, "deleted_at"):
-            # Get all instances where 'deleted_at' is greater than 30 days ago
-            _ = model.all_objects.filter(
-                deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-            ).delete()
-
-    return
+    before = timezone.now() - timezone.timedelta(days=days)
+
+    # Models referencing others go first, so deleting a row never has to
+    # collect a large set of dependent rows
+    counts = {}
+    with ThreadPoolExecutor(max_workers=DELETION_WORKERS) as executor:
+        for layer in hard_delete_layers():
+            deleted = executor.map(
+                lambda model: hard_delete_model(model, before), layer
+            )
+            for model, count in zip(layer, deleted):
+                if count:
+                    counts[model._meta.label] = count
+                    logging.getLogger("plane").info(
+                        f"Hard deleted {count} {model._meta.label} rows"
+                    )
+
+    return counts
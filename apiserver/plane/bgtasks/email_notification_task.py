@@ -1,13 +1,15 @@
 import logging
 import re
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 
 from bs4 import BeautifulSoup
 
 # Third party imports
 from celery import shared_task
 from django.core.mail import EmailMultiAlternatives, get_connection
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 
 # Django imports
 from django.utils import timezone
@@ -39,62 +41,70 @@ def release_lock(lock_id):
     redis_client.delete(lock_id)
 
 
+# Receivers digested per batch, the digests of a batch are sent by one task
+# over a single SMTP connection
+DIGEST_RECEIVER_BATCH_SIZE = 100
+
+
 @shared_task
 def stack_email_notification():
-    # get all email notifications
-    email_notifications = (
-        EmailNotificationLog.objects.filter(processed_at__isnull=True)
-        .order_by("receiver")
-        .values()
+    # Notifications logged while stacking are left for the next run
+    pending = EmailNotificationLog.objects.filter(
+        processed_at__isnull=True, created_at__lte=timezone.now()
     )
 
-    # Create the below format for each of the issues
-    # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
+    # Walk the receivers in batches, each batch reads only its own rows
+    last_receiver_id = None
+    while True:
+        receivers = pending.order_by("receiver_id").values_list(
+            "receiver_id", flat=True
+        )
+        if last_receiver_id:
+            receivers = receivers.filter(receiver_id__gt=last_receiver_id)
+        receiver_ids = list(receivers.distinct()[:DIGEST_RECEIVER_BATCH_SIZE])
+        if not receiver_ids:
+            return
+        last_receiver_id = receiver_ids[-1]
 
-    # Convert to unique receivers list
-    receivers = list(
-        set(
-            [
-                str(notification.get("receiver_id"))
-                for notification in email_notifications
-            ]
+        email_notifications = (
+            pending.filter(receiver_id__in=receiver_ids)
+            .order_by("receiver_id", "created_at")
+            .values("id", "receiver_id", "entity_identifier", "triggered_by_id", "data")
         )
-    )
-    processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification
-            for notification in email_notifications
-            if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
-        payload = {}
-        email_notification_ids = []
-        for receiver_notification in receiver_notifications:
-            payload.setdefault(
-                receiver_notification.get("entity_identifier"), {}
-            ).setdefault(str(receiver_notification.get("triggered_by_id")), []).append(
-                receiver_notification.get("data")
-            )
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
-            )
 
-    # Update the email notification log
-    EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(
-        processed_at=timezone.now()
-    )
+        # Create the below format for each of the issues
+        # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
+        digests = []
+        processed_notifications = []
+        for receiver_id, receiver_notifications in groupby(
+            email_notifications.iterator(), key=itemgetter("receiver_id")
+        ):
+            payload = {}
+            for receiver_notification in receiver_notifications:
+                issue = payload.setdefault(
+                    str(receiver_notification.get("entity_identifier")),
+                    {"notification_data": {}, "email_notification_ids": []},
+                )
+                issue["notification_data"].setdefault(
+                    str(receiver_notification.get("triggered_by_id")), []
+                ).append(receiver_notification.get("data"))
+                issue["email_notification_ids"].append(
+                    str(receiver_notification.get("id"))
+                )
+
+            # Create emails for all the issues
+            for issue_id, issue in payload.items():
+                digests.append(
+                    {"issue_id": issue_id, "receiver_id": str(receiver_id), **issue}
+                )
+                processed_notifications.extend(issue["email_notification_ids"])
+
+        send_email_notifications.delay(digests=digests)
+
+        # Update the email notification log
+        EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(
+            processed_at=timezone.now()
+        )
 
 
 def create_payload(notification_data):
@@ -146,191 +156,268 @@ def create_payload(notification_data):
     return data
 
 
-def process_mention(mention_component):
+def get_user(users, user_id):
+    # The users of a batch are loaded up front, mentioned users once each
+    user_id = str(user_id)
+    if user_id not in users:
+        users[user_id] = User.objects.get(pk=user_id)
+    return users[user_id]
+
+
+def process_mention(mention_component, users):
     soup = BeautifulSoup(mention_component, "html.parser")
     mentions = soup.find_all("mention-component")
     for mention in mentions:
         user_id = mention["entity_identifier"]
-        user = User.objects.get(pk=user_id)
+        user = get_user(users, user_id)
         user_name = user.display_name
         highlighted_name = f"@{user_name}"
         mention.replace_with(highlighted_name)
     return str(soup)
 
 
-def process_html_content(content):
+def process_html_content(content, users):
     if content is None:
         return None
     processed_content_list = []
     for html_content in content:
-        processed_content = process_mention(html_content)
+        processed_content = process_mention(html_content, users)
         processed_content_list.append(processed_content)
     return processed_content_list
 
 
-@shared_task
-def send_email_notification(
-    issue_id, notification_data, receiver_id, email_notification_ids
-):
+def digest_lock_id(issue_id, receiver_id, email_notification_ids):
     # Convert UUIDs to a sorted, concatenated string
     sorted_ids = sorted(email_notification_ids)
     ids_str = "_".join(str(id) for id in sorted_ids)
-    lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
+    return f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
+
+
+def digest_email(digest, issue, users, base_api, template, email_from):
+    """Render the email of the changes made to an issue for a receiver"""
+    receiver = get_user(users, digest["receiver_id"])
+    data = create_payload(notification_data=digest["notification_data"])
+
+    template_data = []
+    total_changes = 0
+    comments = []
+    actors_involved = []
+    for actor_id, changes in data.items():
+        actor = get_user(users, actor_id)
+        total_changes = total_changes + len(changes)
+        comment = changes.pop("comment", False)
+        mention = changes.pop("mention", False)
+        actors_involved.append(actor_id)
+        if comment:
+            comments.append(
+                {
+                    "actor_comments": comment,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        if mention:
+            mention["new_value"] = process_html_content(mention.get("new_value"), users)
+            mention["old_value"] = process_html_content(mention.get("old_value"), users)
+            comments.append(
+                {
+                    "actor_comments": mention,
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        activity_time = changes.pop("activity_time")
+        # Parse the input string into a datetime object
+        formatted_time = datetime.strptime(activity_time, "%Y-%m-%d %H:%M:%S").strftime(
+            "%H:%M %p"
+        )
 
-    # acquire the lock for sending emails
-    try:
-        if acquire_lock(lock_id=lock_id):
-            # get the redis instance
-            ri = redis_instance()
-            base_api = ri.get(str(issue_id)).decode() if ri.get(str(issue_id)) else None
-
-            # Skip if base api is not present
-            if not base_api:
-                return
-
-            data = create_payload(notification_data=notification_data)
-
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
-
-            receiver = User.objects.get(pk=receiver_id)
-            issue = Issue.objects.get(pk=issue_id)
-            template_data = []
-            total_changes = 0
-            comments = []
-            actors_involved = []
-            for actor_id, changes in data.items():
-                actor = User.objects.get(pk=actor_id)
-                total_changes = total_changes + len(changes)
-                comment = changes.pop("comment", False)
-                mention = changes.pop("mention", False)
-                actors_involved.append(actor_id)
-                if comment:
-                    comments.append(
-                        {
-                            "actor_comments": comment,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                if mention:
-                    mention["new_value"] = process_html_content(
-                        mention.get("new_value")
-                    )
-                    mention["old_value"] = process_html_content(
-                        mention.get("old_value")
-                    )
-                    comments.append(
-                        {
-                            "actor_comments": mention,
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                activity_time = changes.pop("activity_time")
-                # Parse the input string into a datetime object
-                formatted_time = datetime.strptime(
-                    activity_time, "%Y-%m-%d %H:%M:%S"
-                ).strftime("%H:%M %p")
-
-                if changes:
-                    template_data.append(
-                        {
-                            "actor_detail": {
-                                "avatar_url": f"{base_api}{actor.avatar_url}",
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                            "changes": changes,
-                            "issue_details": {
-                                "name": issue.name,
-                                "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
-                            },
-                            "activity_time": str(formatted_time),
-                        }
-                    )
+        if changes:
+            template_data.append(
+                {
+                    "actor_detail": {
+                        "avatar_url": f"{base_api}{actor.avatar_url}",
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                    "changes": changes,
+                    "issue_details": {
+                        "name": issue.name,
+                        "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
+                    },
+                    "activity_time": str(formatted_time),
+                }
+            )
 
-            summary = "Updates were made to the issue by"
-
-            # Send the mail
-            subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
-            context = {
-                "data": template_data,
-                "summary": summary,
-                "actors_involved": len(set(actors_involved)),
-                "issue": {
-                    "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
-                    "name": issue.name,
-                    "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                },
-                "receiver": {"email": receiver.email},
-                "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
-                "workspace": str(issue.project.workspace.slug),
-                "project": str(issue.project.name),
-                "user_preference": f"{base_api}/profile/preferences/email",
-                "comments": comments,
-            }
-            html_content = render_to_string(
-                "emails/notifications/issue-updates.html", context
+    summary = "Updates were made to the issue by"
+
+    # Send the mail
+    subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
+    context = {
+        "data": template_data,
+        "summary": summary,
+        "actors_involved": len(set(actors_involved)),
+        "issue": {
+            "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
+            "name": issue.name,
+            "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        },
+        "receiver": {"email": receiver.email},
+        "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
+        "workspace": str(issue.project.workspace.slug),
+        "project": str(issue.project.name),
+        "user_preference": f"{base_api}/profile/preferences/email",
+        "comments": comments,
+    }
+    html_content = template.render(context)
+    text_content = strip_tags(html_content)
+
+    msg = EmailMultiAlternatives(
+        subject=subject, body=text_content, from_email=email_from, to=[receiver.email]
+    )
+    msg.attach_alternative(html_content, "text/html")
+    return msg
+
+
+@shared_task
+def send_email_notifications(digests):
+    # Digests already being sent by another worker are skipped
+    digests = [
+        digest
+        for digest in digests
+        if acquire_lock(
+            lock_id=digest_lock_id(
+                digest["issue_id"],
+                digest["receiver_id"],
+                digest["email_notification_ids"],
             )
-            text_content = strip_tags(html_content)
+        )
+    ]
+    if not digests:
+        logging.getLogger("plane").info("Duplicate email received skipping")
+        return
 
+    try:
+        # The base url of every issue in one round trip
+        issue_ids = list({digest["issue_id"] for digest in digests})
+        base_apis = dict(zip(issue_ids, redis_instance().mget(issue_ids)))
+
+        issues = {
+            str(pk): issue
+            for pk, issue in Issue.objects.select_related("project__workspace")
+            .in_bulk(issue_ids)
+            .items()
+        }
+        user_ids = {digest["receiver_id"] for digest in digests}
+        for digest in digests:
+            user_ids.update(digest["notification_data"].keys())
+        users = {str(pk): user for pk, user in User.objects.in_bulk(user_ids).items()}
+
+        # Get email configurations
+        (
+            EMAIL_HOST,
+            EMAIL_HOST_USER,
+            EMAIL_HOST_PASSWORD,
+            EMAIL_PORT,
+            EMAIL_USE_TLS,
+            EMAIL_USE_SSL,
+            EMAIL_FROM,
+        ) = get_email_configuration()
+        template = get_template("emails/notifications/issue-updates.html")
+
+        messages = []
+        for digest in digests:
+            base_api = base_apis.get(digest["issue_id"])
+            issue = issues.get(digest["issue_id"])
+            # Skip if base api or the issue is not present
+            if not base_api or not issue:
+                continue
             try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
+                messages.append(
+                    (
+                        digest,
+                        digest_email(
+                            digest,
+                            issue,
+                            users,
+                            base_api.decode(),
+                            template,
+                            EMAIL_FROM,
+                        ),
+                    )
                 )
+            except User.DoesNotExist:
+                continue
 
-                msg = EmailMultiAlternatives(
-                    subject=subject,
-                    body=text_content,
-                    from_email=EMAIL_FROM,
-                    to=[receiver.email],
-                    connection=connection,
-                )
-                msg.attach_alternative(html_content, "text/html")
-                msg.send()
-                logging.getLogger("plane").info("Email Sent Successfully")
-
-                # Update the logs
-                EmailNotificationLog.objects.filter(
-                    pk__in=email_notification_ids
-                ).update(sent_at=timezone.now())
-
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
-            except Exception as e:
-                log_exception(e)
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
-        else:
-            logging.getLogger("plane").info("Duplicate email received skipping")
+        if not messages:
             return
-    except (Issue.DoesNotExist, User.DoesNotExist):
-        release_lock(lock_id=lock_id)
-        return
+
+        # Every email of the batch goes through the same connection
+        connection = get_connection(
+            host=EMAIL_HOST,
+            port=int(EMAIL_PORT),
+            username=EMAIL_HOST_USER,
+            password=EMAIL_HOST_PASSWORD,
+            use_tls=EMAIL_USE_TLS == "1",
+            use_ssl=EMAIL_USE_SSL == "1",
+        )
+        sent_ids = []
+        sent = 0
+        try:
+            connection.open()
+            for digest, msg in messages:
+                try:
+                    connection.send_messages([msg])
+                    sent_ids.extend(digest["email_notification_ids"])
+                    sent += 1
+                except Exception as e:
+                    log_exception(e)
+                    # Reconnect for the next emails
+                    connection.close()
+                    connection.open()
+        finally:
+            connection.close()
+
+            # Update the logs of the emails sent, even if the server went away
+            EmailNotificationLog.objects.filter(pk__in=sent_ids).update(
+                sent_at=timezone.now()
+            )
+            logging.getLogger("plane").info(
+                f"Sent {sent} of {len(messages)} notification emails"
+            )
     except Exception as e:
         log_exception(e)
-        release_lock(lock_id=lock_id)
-        return
+    finally:
+        # release the locks
+        for digest in digests:
+            release_lock(
+                lock_id=digest_lock_id(
+                    digest["issue_id"],
+                    digest["receiver_id"],
+                    digest["email_notification_ids"],
+                )
+            )
+
+
+@shared_task
+def send_email_notification(
+    issue_id, notification_data, receiver_id, email_notification_ids
+):
+    # Single digests queued before the batched sender
+    send_email_notifications(
+        [
+            {
+                "issue_id": str(issue_id),
+                "receiver_id": str(receiver_id),
+                "notification_data": notification_data,
+                "email_notification_ids": [str(pk) for pk in email_notification_ids],
+            }
+        ]
+    )
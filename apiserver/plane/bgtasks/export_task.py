@@ -2,9 +2,11 @@
 import csv
 import io
 import json
+import tempfile
 import zipfile
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
 
 # Third party imports
@@ -19,6 +21,17 @@ from openpyxl import Workbook
 from plane.db.models import ExporterHistory, Issue
 from plane.utils.exception_logger import log_exception
 
+# Rows are read from a server side cursor in chunks and written straight into
+# the archive, so memory stays bounded regardless of the number of issues
+EXPORT_CHUNK_SIZE = 2000
+
+# The archive is uploaded in parts, at most the concurrent parts are in memory
+EXPORT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+)
+
 
 def dateTimeConverter(time):
     if time:
@@ -30,42 +43,41 @@ def dateConverter(time):
         return time.strftime("%a, %d %b %Y")
 
 
-def create_csv_file(data):
-    csv_buffer = io.StringIO()
+def generate_csv(header, rows, file):
+    """
+    Write the CSV export of the passed rows to the file.
+    """
+    csv_buffer = io.TextIOWrapper(file, encoding="utf-8", newline="")
     csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
 
-    for row in data:
-        csv_writer.writerow(row)
-
-    csv_buffer.seek(0)
-    return csv_buffer.getvalue()
+    csv_writer.writerow(header)
+    for row in rows:
+        csv_writer.writerow(list(row.values()))
 
+    # Leave the archive entry open for the caller to close
+    csv_buffer.flush()
+    csv_buffer.detach()
 
-def create_json_file(data):
-    return json.dumps(data)
 
+def generate_json(header, rows, file):
+    file.write(b"[")
+    for index, row in enumerate(rows):
+        if index:
+            file.write(b", ")
+        file.write(json.dumps(row).encode())
+    file.write(b"]")
 
-def create_xlsx_file(data):
-    workbook = Workbook()
-    sheet = workbook.active
 
-    for row in data:
-        sheet.append(row)
+def generate_xlsx(header, rows, file):
+    # Write only workbooks flush the rows to disk instead of keeping the cells
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
 
-    xlsx_buffer = io.BytesIO()
-    workbook.save(xlsx_buffer)
-    xlsx_buffer.seek(0)
-    return xlsx_buffer.getvalue()
+    sheet.append(header)
+    for row in rows:
+        sheet.append(list(row.values()))
 
-
-def create_zip_file(files):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
-
-    zip_buffer.seek(0)
-    return zip_buffer
+    workbook.save(file)
 
 
 def upload_to_s3(zip_file, workspace_id, token_id, slug):
@@ -87,6 +99,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
+            Config=EXPORT_TRANSFER_CONFIG,
         )
 
         # Generate presigned url for the uploaded file with different base
@@ -128,6 +141,7 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
             settings.AWS_STORAGE_BUCKET_NAME,
             file_name,
             ExtraArgs={"ContentType": "application/zip"},
+            Config=EXPORT_TRANSFER_CONFIG,
         )
 
         # Generate presigned url for the uploaded file
@@ -150,40 +164,6 @@ def upload_to_s3(zip_file, workspace_id, token_id, slug):
     exporter_instance.save(update_fields=["status", "url", "key"])
 
 
-def generate_table_row(issue):
-    return [
-        f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
-        issue["project__name"],
-        issue["name"],
-        issue["description_stripped"],
-        issue["state__name"],
-        dateConverter(issue["start_date"]),
-        dateConverter(issue["target_date"]),
-        issue["priority"],
-        (
-            f"{issue['created_by__first_name']} {issue['created_by__last_name']}"
-            if issue["created_by__first_name"] and issue["created_by__last_name"]
-            else ""
-        ),
-        (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        issue["labels__name"] if issue["labels__name"] else "",
-        issue["issue_cycle__cycle__name"],
-        dateConverter(issue["issue_cycle__cycle__start_date"]),
-        dateConverter(issue["issue_cycle__cycle__end_date"]),
-        issue["issue_module__module__name"],
-        dateConverter(issue["issue_module__module__start_date"]),
-        dateConverter(issue["issue_module__module__target_date"]),
-        dateTimeConverter(issue["created_at"]),
-        dateTimeConverter(issue["updated_at"]),
-        dateTimeConverter(issue["completed_at"]),
-        dateTimeConverter(issue["archived_at"]),
-    ]
-
-
 def generate_json_row(issue):
     return {
         "ID": f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
@@ -218,85 +198,33 @@ def generate_json_row(issue):
     }
 
 
-def update_json_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row["ID"] == row["ID"]
-        ),
-        None,
-    )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = (
-            rows[matched_index]["Assignee"],
-            rows[matched_index]["Labels"],
-        )
-        assignee, label = row["Assignee"], row["Labels"]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index]["Assignee"] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index]["Labels"] += f", {label}"
-    else:
-        rows.append(row)
-
-
-def update_table_row(rows, row):
-    matched_index = next(
-        (index for index, existing_row in enumerate(rows) if existing_row[0] == row[0]),
-        None,
-    )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = rows[matched_index][7:9]
-        assignee, label = row[7:9]
-
-        if assignee is not None and (
-            existing_assignees is None or label not in existing_assignees
-        ):
-            rows[matched_index][8] += f", {assignee}"
-        if label is not None and (
-            existing_labels is None or label not in existing_labels
-        ):
-            rows[matched_index][8] += f", {label}"
-    else:
-        rows.append(row)
+def update_json_row(existing_row, row):
+    for field in ["Assignee", "Labels"]:
+        value = row[field]
+        if value and value not in existing_row[field].split(", "):
+            existing_row[field] = (
+                f"{existing_row[field]}, {value}" if existing_row[field] else value
+            )
 
 
-def generate_csv(header, project_id, issues, files):
+def generate_rows(issues):
     """
-    Generate CSV export for all the passed issues.
+    Yield one row per issue, merging the rows of the assignees and labels.
     """
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    csv_file = create_csv_file(rows)
-    files.append((f"{project_id}.csv", csv_file))
-
-
-def generate_json(header, project_id, issues, files):
-    rows = []
-    for issue in issues:
+    current_id, current_row = None, None
+    # The issues are ordered by id last, so the rows of an issue are adjacent
+    for issue in issues.iterator(chunk_size=EXPORT_CHUNK_SIZE):
         row = generate_json_row(issue)
-        update_json_row(rows, row)
-    json_file = create_json_file(rows)
-    files.append((f"{project_id}.json", json_file))
+        if issue["id"] == current_id:
+            update_json_row(current_row, row)
+            continue
 
+        if current_row is not None:
+            yield current_row
+        current_id, current_row = issue["id"], row
 
-def generate_xlsx(header, project_id, issues, files):
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    xlsx_file = create_xlsx_file(rows)
-    files.append((f"{project_id}.xlsx", xlsx_file))
+    if current_row is not None:
+        yield current_row
 
 
 @shared_task
@@ -314,12 +242,7 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
                     project__project_projectmember__member=exporter_instance.initiated_by_id,
                     project__project_projectmember__is_active=True,
                     project__archived_at__isnull=True,
-                )
-                .select_related("project", "workspace", "state", "parent", "created_by")
-                .prefetch_related(
-                    "assignees", "labels", "issue_cycle__cycle", "issue_module__module"
-                )
-                .values(
+                ).values(
                     "id",
                     "project__identifier",
                     "project__name",
@@ -348,7 +271,7 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
                     "labels__name",
                 )
             )
-            .order_by("project__identifier", "sequence_id")
+            .order_by("project__identifier", "sequence_id", "id")
             .distinct()
         )
         # CSV header
@@ -382,21 +305,27 @@ def issue_export_task(provider, workspace_id, project_ids, token_id, multiple, s
             "xlsx": generate_xlsx,
         }
 
-        files = []
         if multiple:
-            for project_id in project_ids:
-                issues = workspace_issues.filter(project__id=project_id)
-                exporter = EXPORTER_MAPPER.get(provider)
-                if exporter is not None:
-                    exporter(header, project_id, issues, files)
-
+            exports = [
+                (project_id, workspace_issues.filter(project__id=project_id))
+                for project_id in project_ids
+            ]
         else:
-            exporter = EXPORTER_MAPPER.get(provider)
-            if exporter is not None:
-                exporter(header, workspace_id, workspace_issues, files)
+            exports = [(workspace_id, workspace_issues)]
 
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+        exporter = EXPORTER_MAPPER.get(provider)
+        # The archive is spooled to disk and uploaded in parts
+        with tempfile.TemporaryFile() as zip_file:
+            with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zipf:
+                if exporter is not None:
+                    for file_id, issues in exports:
+                        with zipf.open(
+                            f"{file_id}.{provider}", "w", force_zip64=True
+                        ) as file:
+                            exporter(header, generate_rows(issues), file)
+
+            zip_file.seek(0)
+            upload_to_s3(zip_file, workspace_id, token_id, slug)
 
     except Exception as e:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
@@ -1,5 +1,6 @@
 # Python imports
 import json
+from collections import defaultdict
 
 
 # Third Party imports
@@ -10,7 +11,7 @@ from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 
 from plane.app.serializers import IssueActivitySerializer
-from plane.bgtasks.notification_task import notifications
+from plane.bgtasks.notification_task import batch_notifications
 
 # Module imports
 from plane.db.models import (
@@ -29,9 +30,52 @@ from plane.db.models import (
     EstimatePoint,
 )
 from plane.settings.redis import redis_instance
+from plane.utils.cache import invalidate_public_board_cache
 from plane.utils.exception_logger import log_exception
-from plane.bgtasks.webhook_task import webhook_activity
+from plane.bgtasks.webhook_task import webhook_activities
 from plane.utils.issue_relation_mapper import get_inverse_relation
+from plane.utils.issue_rollup import refresh_issue_rollups
+
+
+class ActivityPrefetch:
+    """
+    Lookup of the objects referenced by a batch of activities, keyed by model
+    and primary key. Objects that were not prefetched are loaded on first
+    access, so the trackers behave the same when they run on their own.
+    """
+
+    def __init__(self):
+        self.objects = defaultdict(dict)
+
+    def prefetch(self, model, ids):
+        # Load all the missing ids in one query
+        missing = {str(pk) for pk in ids if pk} - set(self.objects[model])
+        if not missing:
+            return
+        queryset = (
+            model.objects.select_related("project")
+            if model is Issue
+            else model.objects.all()
+        )
+        for instance in queryset.filter(pk__in=missing):
+            self.objects[model][str(instance.pk)] = instance
+        # Remember the misses so they are not queried again
+        for pk in missing:
+            self.objects[model].setdefault(pk, None)
+
+    def first(self, model, pk):
+        """Same as `model.objects.filter(pk=pk).first()`"""
+        if not pk:
+            return None
+        self.prefetch(model, [pk])
+        return self.objects[model].get(str(pk))
+
+    def get(self, model, pk):
+        """Same as `model.objects.get(pk=pk)`"""
+        instance = self.first(model, pk)
+        if instance is None:
+            raise model.DoesNotExist(f"{model.__name__} matching query does not exist.")
+        return instance
 
 
 # Track Changes in name
@@ -44,6 +88,7 @@ def track_name(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if current_instance.get("name") != requested_data.get("name"):
         issue_activities.append(
@@ -72,6 +117,7 @@ def track_description(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if current_instance.get("description_html") != requested_data.get(
         "description_html"
@@ -115,18 +161,12 @@ def track_parent(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if current_instance.get("parent_id") != requested_data.get("parent_id"):
-        old_parent = (
-            Issue.objects.filter(pk=current_instance.get("parent_id")).first()
-            if current_instance.get("parent_id") is not None
-            else None
-        )
-        new_parent = (
-            Issue.objects.filter(pk=requested_data.get("parent_id")).first()
-            if requested_data.get("parent_id") is not None
-            else None
-        )
+        prefetched = prefetched or ActivityPrefetch()
+        old_parent = prefetched.first(Issue, current_instance.get("parent_id"))
+        new_parent = prefetched.first(Issue, requested_data.get("parent_id"))
 
         issue_activities.append(
             IssueActivity(
@@ -164,6 +204,7 @@ def track_priority(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if current_instance.get("priority") != requested_data.get("priority"):
         issue_activities.append(
@@ -192,10 +233,12 @@ def track_state(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if current_instance.get("state_id") != requested_data.get("state_id"):
-        new_state = State.objects.get(pk=requested_data.get("state_id", None))
-        old_state = State.objects.get(pk=current_instance.get("state_id", None))
+        prefetched = prefetched or ActivityPrefetch()
+        new_state = prefetched.get(State, requested_data.get("state_id", None))
+        old_state = prefetched.get(State, current_instance.get("state_id", None))
 
         issue_activities.append(
             IssueActivity(
@@ -225,6 +268,7 @@ def track_target_date(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if current_instance.get("target_date") != requested_data.get("target_date"):
         issue_activities.append(
@@ -261,6 +305,7 @@ def track_start_date(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if current_instance.get("start_date") != requested_data.get("start_date"):
         issue_activities.append(
@@ -297,6 +342,7 @@ def track_labels(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_labels = set([str(lab) for lab in requested_data.get("label_ids", [])])
     current_labels = set([str(lab) for lab in current_instance.get("label_ids", [])])
@@ -304,9 +350,12 @@ def track_labels(
     added_labels = requested_labels - current_labels
     dropped_labels = current_labels - requested_labels
 
+    prefetched = prefetched or ActivityPrefetch()
+    prefetched.prefetch(Label, added_labels | dropped_labels)
+
     # Set of newly added labels
     for added_label in added_labels:
-        label = Label.objects.get(pk=added_label)
+        label = prefetched.get(Label, added_label)
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -326,7 +375,7 @@ def track_labels(
 
     # Set of dropped labels
     for dropped_label in dropped_labels:
-        label = Label.objects.get(pk=dropped_label)
+        label = prefetched.get(Label, dropped_label)
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -355,6 +404,7 @@ def track_assignees(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_assignees = (
         set([str(asg) for asg in requested_data.get("assignee_ids", [])])
@@ -370,9 +420,12 @@ def track_assignees(
     added_assignees = requested_assignees - current_assignees
     dropped_assginees = current_assignees - requested_assignees
 
+    prefetched = prefetched or ActivityPrefetch()
+    prefetched.prefetch(User, added_assignees | dropped_assginees)
+
     bulk_subscribers = []
     for added_asignee in added_assignees:
-        assignee = User.objects.get(pk=added_asignee)
+        assignee = prefetched.get(User, added_asignee)
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -405,7 +458,7 @@ def track_assignees(
     )
 
     for dropped_assignee in dropped_assginees:
-        assignee = User.objects.get(pk=dropped_assignee)
+        assignee = prefetched.get(User, dropped_assignee)
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -432,21 +485,15 @@ def track_estimate_points(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if current_instance.get("estimate_point") != requested_data.get("estimate_point"):
-        old_estimate = (
-            EstimatePoint.objects.filter(
-                pk=current_instance.get("estimate_point")
-            ).first()
-            if current_instance.get("estimate_point") is not None
-            else None
+        prefetched = prefetched or ActivityPrefetch()
+        old_estimate = prefetched.first(
+            EstimatePoint, current_instance.get("estimate_point")
         )
-        new_estimate = (
-            EstimatePoint.objects.filter(
-                pk=requested_data.get("estimate_point")
-            ).first()
-            if requested_data.get("estimate_point") is not None
-            else None
+        new_estimate = prefetched.first(
+            EstimatePoint, requested_data.get("estimate_point")
         )
         issue_activities.append(
             IssueActivity(
@@ -483,6 +530,7 @@ def track_archive_at(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if current_instance.get("archived_at") != requested_data.get("archived_at"):
         if requested_data.get("archived_at") is None:
@@ -532,11 +580,13 @@ def track_closed_to(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     if requested_data.get("closed_to") is not None:
-        updated_state = State.objects.get(
-            pk=requested_data.get("closed_to"), project_id=project_id
-        )
+        prefetched = prefetched or ActivityPrefetch()
+        updated_state = prefetched.get(State, requested_data.get("closed_to"))
+        if str(updated_state.project_id) != str(project_id):
+            raise State.DoesNotExist("State does not belong to the project")
         issue_activities.append(
             IssueActivity(
                 issue_id=issue_id,
@@ -564,8 +614,10 @@ def create_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
-    issue = Issue.objects.get(pk=issue_id)
+    prefetched = prefetched or ActivityPrefetch()
+    issue = prefetched.get(Issue, issue_id)
     issue_activity = IssueActivity.objects.create(
         issue_id=issue_id,
         project_id=project_id,
@@ -589,6 +641,7 @@ def create_issue_activity(
             actor_id,
             issue_activities,
             epoch,
+            prefetched,
         )
 
 
@@ -601,6 +654,7 @@ def update_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     ISSUE_ACTIVITY_MAPPER = {
         "name": track_name,
@@ -634,6 +688,7 @@ def update_issue_activity(
                 actor_id=actor_id,
                 issue_activities=issue_activities,
                 epoch=epoch,
+                prefetched=prefetched,
             )
 
 
@@ -646,6 +701,7 @@ def delete_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -670,6 +726,7 @@ def create_comment_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -702,6 +759,7 @@ def update_comment_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -737,6 +795,7 @@ def delete_comment_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -761,6 +820,7 @@ def create_cycle_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -771,17 +831,22 @@ def create_cycle_issue_activity(
     updated_records = current_instance.get("updated_cycle_issues", [])
     created_records = json.loads(current_instance.get("created_cycle_issues", []))
 
+    prefetched = prefetched or ActivityPrefetch()
+    prefetched.prefetch(
+        Cycle,
+        [record.get("old_cycle_id") for record in updated_records]
+        + [record.get("new_cycle_id") for record in updated_records]
+        + [record.get("fields").get("cycle") for record in created_records],
+    )
+    # Bump the issues in one update instead of saving each of them
+    Issue.objects.filter(
+        pk__in=[record.get("issue_id") for record in updated_records]
+        + [record.get("fields").get("issue") for record in created_records]
+    ).update(updated_at=timezone.now())
+
     for updated_record in updated_records:
-        old_cycle = Cycle.objects.filter(
-            pk=updated_record.get("old_cycle_id", None)
-        ).first()
-        new_cycle = Cycle.objects.filter(
-            pk=updated_record.get("new_cycle_id", None)
-        ).first()
-        issue = Issue.objects.filter(pk=updated_record.get("issue_id")).first()
-        if issue:
-            issue.updated_at = timezone.now()
-            issue.save(update_fields=["updated_at"])
+        old_cycle = prefetched.first(Cycle, updated_record.get("old_cycle_id", None))
+        new_cycle = prefetched.first(Cycle, updated_record.get("new_cycle_id", None))
 
         issue_activities.append(
             IssueActivity(
@@ -801,15 +866,7 @@ def create_cycle_issue_activity(
         )
 
     for created_record in created_records:
-        cycle = Cycle.objects.filter(
-            pk=created_record.get("fields").get("cycle")
-        ).first()
-        issue = Issue.objects.filter(
-            pk=created_record.get("fields").get("issue")
-        ).first()
-        if issue:
-            issue.updated_at = timezone.now()
-            issue.save(update_fields=["updated_at"])
+        cycle = prefetched.first(Cycle, created_record.get("fields").get("cycle"))
 
         issue_activities.append(
             IssueActivity(
@@ -837,6 +894,7 @@ def delete_cycle_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -845,13 +903,11 @@ def delete_cycle_issue_activity(
 
     cycle_id = requested_data.get("cycle_id", "")
     cycle_name = requested_data.get("cycle_name", "")
-    cycle = Cycle.objects.filter(pk=cycle_id).first()
+    prefetched = prefetched or ActivityPrefetch()
+    cycle = prefetched.first(Cycle, cycle_id)
     issues = requested_data.get("issues")
+    Issue.objects.filter(pk__in=issues).update(updated_at=timezone.now())
     for issue in issues:
-        current_issue = Issue.objects.filter(pk=issue).first()
-        if issue:
-            current_issue.updated_at = timezone.now()
-            current_issue.save(update_fields=["updated_at"])
         issue_activities.append(
             IssueActivity(
                 issue_id=issue,
@@ -878,13 +934,12 @@ def create_module_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
-    module = Module.objects.filter(pk=requested_data.get("module_id")).first()
-    issue = Issue.objects.filter(pk=issue_id).first()
-    if issue:
-        issue.updated_at = timezone.now()
-        issue.save(update_fields=["updated_at"])
+    prefetched = prefetched or ActivityPrefetch()
+    module = prefetched.first(Module, requested_data.get("module_id"))
+    Issue.objects.filter(pk=issue_id).update(updated_at=timezone.now())
     issue_activities.append(
         IssueActivity(
             issue_id=issue_id,
@@ -911,16 +966,14 @@ def delete_module_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
     )
     module_name = current_instance.get("module_name")
-    current_issue = Issue.objects.filter(pk=issue_id).first()
-    if current_issue:
-        current_issue.updated_at = timezone.now()
-        current_issue.save(update_fields=["updated_at"])
+    Issue.objects.filter(pk=issue_id).update(updated_at=timezone.now())
     issue_activities.append(
         IssueActivity(
             issue_id=issue_id,
@@ -951,6 +1004,7 @@ def create_link_activity(
     workspace_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -982,6 +1036,7 @@ def update_link_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -1016,6 +1071,7 @@ def delete_link_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
@@ -1046,6 +1102,7 @@ def create_attachment_activity(
     workspace_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -1077,6 +1134,7 @@ def delete_attachment_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -1101,6 +1159,7 @@ def create_issue_reaction_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     if requested_data and requested_data.get("reaction") is not None:
@@ -1141,6 +1200,7 @@ def delete_issue_reaction_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
@@ -1173,6 +1233,7 @@ def create_comment_reaction_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     if requested_data and requested_data.get("reaction") is not None:
@@ -1218,6 +1279,7 @@ def delete_comment_reaction_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
@@ -1258,6 +1320,7 @@ def create_issue_vote_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     if requested_data and requested_data.get("vote") is not None:
@@ -1288,6 +1351,7 @@ def delete_issue_vote_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
@@ -1320,14 +1384,17 @@ def create_issue_relation_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
     )
     if current_instance is None and requested_data.get("issues") is not None:
+        prefetched = prefetched or ActivityPrefetch()
+        prefetched.prefetch(Issue, [issue_id, *requested_data.get("issues")])
         for related_issue in requested_data.get("issues"):
-            issue = Issue.objects.get(pk=related_issue)
+            issue = prefetched.get(Issue, related_issue)
             issue_activities.append(
                 IssueActivity(
                     issue_id=issue_id,
@@ -1344,7 +1411,7 @@ def create_issue_relation_activity(
                 )
             )
             inverse_relation = get_inverse_relation(requested_data.get("relation_type"))
-            issue = Issue.objects.get(pk=issue_id)
+            issue = prefetched.get(Issue, issue_id)
             issue_activities.append(
                 IssueActivity(
                     issue_id=related_issue,
@@ -1371,12 +1438,14 @@ def delete_issue_relation_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
         json.loads(current_instance) if current_instance is not None else None
     )
-    issue = Issue.objects.get(pk=requested_data.get("related_issue"))
+    prefetched = prefetched or ActivityPrefetch()
+    issue = prefetched.get(Issue, requested_data.get("related_issue"))
     issue_activities.append(
         IssueActivity(
             issue_id=issue_id,
@@ -1392,7 +1461,7 @@ def delete_issue_relation_activity(
             epoch=epoch,
         )
     )
-    issue = Issue.objects.get(pk=issue_id)
+    issue = prefetched.get(Issue, issue_id)
     issue_activities.append(
         IssueActivity(
             issue_id=requested_data.get("related_issue"),
@@ -1427,6 +1496,7 @@ def create_draft_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -1451,6 +1521,7 @@ def update_draft_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -1495,6 +1566,7 @@ def delete_draft_issue_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     issue_activities.append(
         IssueActivity(
@@ -1518,6 +1590,7 @@ def create_intake_activity(
     actor_id,
     issue_activities,
     epoch,
+    prefetched=None,
 ):
     requested_data = json.loads(requested_data) if requested_data is not None else None
     current_instance = (
@@ -1547,135 +1620,271 @@ def create_intake_activity(
         )
 
 
-# Receive message from room group
-@shared_task
-def issue_activity(
-    type,
-    requested_data,
-    current_instance,
-    issue_id,
-    actor_id,
-    project_id,
-    epoch,
-    subscriber=True,
-    notification=False,
-    origin=None,
-    intake=None,
-):
-    try:
-        issue_activities = []
-
-        project = Project.objects.get(pk=project_id)
-        workspace_id = project.workspace_id
+ACTIVITY_MAPPER = {
+    "issue.activity.created": create_issue_activity,
+    "issue.activity.updated": update_issue_activity,
+    "issue.activity.deleted": delete_issue_activity,
+    "comment.activity.created": create_comment_activity,
+    "comment.activity.updated": update_comment_activity,
+    "comment.activity.deleted": delete_comment_activity,
+    "cycle.activity.created": create_cycle_issue_activity,
+    "cycle.activity.deleted": delete_cycle_issue_activity,
+    "module.activity.created": create_module_issue_activity,
+    "module.activity.deleted": delete_module_issue_activity,
+    "link.activity.created": create_link_activity,
+    "link.activity.updated": update_link_activity,
+    "link.activity.deleted": delete_link_activity,
+    "attachment.activity.created": create_attachment_activity,
+    "attachment.activity.deleted": delete_attachment_activity,
+    "issue_relation.activity.created": create_issue_relation_activity,
+    "issue_relation.activity.deleted": delete_issue_relation_activity,
+    "issue_reaction.activity.created": create_issue_reaction_activity,
+    "issue_reaction.activity.deleted": delete_issue_reaction_activity,
+    "comment_reaction.activity.created": create_comment_reaction_activity,
+    "comment_reaction.activity.deleted": delete_comment_reaction_activity,
+    "issue_vote.activity.created": create_issue_vote_activity,
+    "issue_vote.activity.deleted": delete_issue_vote_activity,
+    "issue_draft.activity.created": create_draft_issue_activity,
+    "issue_draft.activity.updated": update_draft_issue_activity,
+    "issue_draft.activity.deleted": delete_draft_issue_activity,
+    "intake.activity.created": create_intake_activity,
+}
+
+
+def load_activity_data(value):
+    data = json.loads(value) if isinstance(value, str) else value
+    return data if isinstance(data, dict) else {}
+
+
+def prefetch_activity_references(events, prefetched):
+    """Resolve everything the events refer to with one query per model"""
+    references = defaultdict(set)
+    for event in events:
+        requested_data = load_activity_data(event.get("requested_data"))
+        current_instance = load_activity_data(event.get("current_instance"))
+        references[Issue].add(event.get("issue_id"))
+
+        if event["type"].startswith("issue.activity"):
+            for data in (requested_data, current_instance):
+                references[Label].update(data.get("label_ids") or [])
+                references[User].update(data.get("assignee_ids") or [])
+                references[State].update([data.get("state_id"), data.get("closed_to")])
+                references[Issue].add(data.get("parent_id"))
+                references[EstimatePoint].add(data.get("estimate_point"))
+        elif event["type"] == "cycle.activity.created":
+            for record in current_instance.get("updated_cycle_issues", []):
+                references[Cycle].update(
+                    [record.get("old_cycle_id"), record.get("new_cycle_id")]
+                )
+            for record in json.loads(
+                current_instance.get("created_cycle_issues", "[]")
+            ):
+                references[Cycle].add(record.get("fields").get("cycle"))
+        elif event["type"] == "cycle.activity.deleted":
+            references[Cycle].add(requested_data.get("cycle_id"))
+        elif event["type"] == "module.activity.created":
+            references[Module].add(requested_data.get("module_id"))
+        elif event["type"].startswith("issue_relation.activity"):
+            references[Issue].update(requested_data.get("issues") or [])
+            references[Issue].add(requested_data.get("related_issue"))
+
+    for model, ids in references.items():
+        prefetched.prefetch(model, [str(pk) for pk in ids if pk])
+
+
+def process_issue_activities(events, origin=None):
+    """
+    Create the activities of a batch of events. The referenced objects are
+    resolved in a single prefetch pass, all the activities are written with one
+    bulk_create and webhooks and notifications are dispatched once per workspace.
+    """
+    prefetched = ActivityPrefetch()
+    projects = {
+        str(project.id): project
+        for project in Project.objects.filter(
+            pk__in={str(event["project_id"]) for event in events}
+        ).select_related("workspace")
+    }
+    prefetch_activity_references(events, prefetched)
 
-        if issue_id is not None:
-            if origin:
-                ri = redis_instance()
-                # set the request origin in redis
-                ri.set(str(issue_id), origin, ex=600)
-            issue = Issue.objects.filter(pk=issue_id).first()
-            if issue:
-                try:
-                    issue.updated_at = timezone.now()
-                    issue.save(update_fields=["updated_at"])
-                except Exception:
-                    pass
-
-        ACTIVITY_MAPPER = {
-            "issue.activity.created": create_issue_activity,
-            "issue.activity.updated": update_issue_activity,
-            "issue.activity.deleted": delete_issue_activity,
-            "comment.activity.created": create_comment_activity,
-            "comment.activity.updated": update_comment_activity,
-            "comment.activity.deleted": delete_comment_activity,
-            "cycle.activity.created": create_cycle_issue_activity,
-            "cycle.activity.deleted": delete_cycle_issue_activity,
-            "module.activity.created": create_module_issue_activity,
-            "module.activity.deleted": delete_module_issue_activity,
-            "link.activity.created": create_link_activity,
-            "link.activity.updated": update_link_activity,
-            "link.activity.deleted": delete_link_activity,
-            "attachment.activity.created": create_attachment_activity,
-            "attachment.activity.deleted": delete_attachment_activity,
-            "issue_relation.activity.created": create_issue_relation_activity,
-            "issue_relation.activity.deleted": delete_issue_relation_activity,
-            "issue_reaction.activity.created": create_issue_reaction_activity,
-            "issue_reaction.activity.deleted": delete_issue_reaction_activity,
-            "comment_reaction.activity.created": create_comment_reaction_activity,
-            "comment_reaction.activity.deleted": delete_comment_reaction_activity,
-            "issue_vote.activity.created": create_issue_vote_activity,
-            "issue_vote.activity.deleted": delete_issue_vote_activity,
-            "issue_draft.activity.created": create_draft_issue_activity,
-            "issue_draft.activity.updated": update_draft_issue_activity,
-            "issue_draft.activity.deleted": delete_draft_issue_activity,
-            "intake.activity.created": create_intake_activity,
-        }
-
-        func = ACTIVITY_MAPPER.get(type)
-        if func is not None:
+    issue_ids = {
+        str(event["issue_id"]) for event in events if event.get("issue_id") is not None
+    }
+    if issue_ids:
+        if origin:
+            # set the request origin in redis
+            pipeline = redis_instance().pipeline()
+            for issue_id in issue_ids:
+                pipeline.set(issue_id, origin, ex=600)
+            pipeline.execute()
+        Issue.objects.filter(pk__in=issue_ids).update(updated_at=timezone.now())
+
+    issue_activities = []
+    processed_events = []
+    for event in events:
+        project = projects.get(str(event["project_id"]))
+        func = ACTIVITY_MAPPER.get(event["type"])
+        if project is None or func is None:
+            continue
+
+        event_activities = []
+        try:
             func(
-                requested_data=requested_data,
-                current_instance=current_instance,
-                issue_id=issue_id,
-                project_id=project_id,
-                workspace_id=workspace_id,
-                actor_id=actor_id,
-                issue_activities=issue_activities,
-                epoch=epoch,
+                requested_data=event.get("requested_data"),
+                current_instance=event.get("current_instance"),
+                issue_id=event.get("issue_id"),
+                project_id=event["project_id"],
+                workspace_id=project.workspace_id,
+                actor_id=event["actor_id"],
+                issue_activities=event_activities,
+                epoch=event["epoch"],
+                prefetched=prefetched,
             )
+        except Exception as e:
+            # A broken event should not drop the rest of the batch
+            log_exception(e)
+            continue
+        processed_events.append((event, project, len(event_activities)))
+        issue_activities.extend(event_activities)
+
+    # Save all the values to database
+    issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
+
+    # Bulk cycle and module events carry their issues on the activities only
+    rollup_issue_ids = issue_ids | {
+        str(activity.issue_id)
+        for activity in issue_activities_created
+        if activity.issue_id is not None
+    }
+    if rollup_issue_ids:
+        try:
+            # Keep the counts shown in the cycle and module lists up to date
+            refresh_issue_rollups(rollup_issue_ids, issue_activities_created)
+        except Exception as e:
+            log_exception(e)
+
+    # The published boards of the projects are served from the cache
+    if processed_events:
+        invalidate_public_board_cache(
+            {project.id for _, project, _ in processed_events}
+        )
 
-        # Save all the values to database
-        issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
-        # Post the updates to segway for integrations and webhooks
-        if len(issue_activities_created):
-            for activity in issue_activities_created:
-                webhook_activity.delay(
-                    event=(
+    webhook_payloads = defaultdict(list)
+    notification_events = defaultdict(list)
+    offset = 0
+    for event, project, count in processed_events:
+        activities = issue_activities_created[offset : offset + count]
+        offset += count
+        slug = project.workspace.slug
+        intake = event.get("intake")
+
+        for activity in activities:
+            webhook_payloads[slug].append(
+                {
+                    "event": (
                         "issue_comment"
                         if activity.field == "comment"
                         else "intake_issue"
                         if intake
                         else "issue"
                     ),
-                    event_id=(
+                    "event_id": (
                         activity.issue_comment_id
                         if activity.field == "comment"
                         else intake
                         if intake
                         else activity.issue_id
                     ),
-                    verb=activity.verb,
-                    field=(
+                    "verb": activity.verb,
+                    "field": (
                         "description" if activity.field == "comment" else activity.field
                     ),
-                    old_value=(
+                    "old_value": (
                         activity.old_value if activity.old_value != "" else None
                     ),
-                    new_value=(
+                    "new_value": (
                         activity.new_value if activity.new_value != "" else None
                     ),
-                    actor_id=activity.actor_id,
-                    current_site=origin,
-                    slug=activity.workspace.slug,
-                    old_identifier=activity.old_identifier,
-                    new_identifier=activity.new_identifier,
-                )
+                    "actor_id": activity.actor_id,
+                    "old_identifier": activity.old_identifier,
+                    "new_identifier": activity.new_identifier,
+                }
+            )
 
-        if notification:
-            notifications.delay(
-                type=type,
-                issue_id=issue_id,
-                actor_id=actor_id,
-                project_id=project_id,
-                subscriber=subscriber,
-                issue_activities_created=json.dumps(
-                    IssueActivitySerializer(issue_activities_created, many=True).data,
-                    cls=DjangoJSONEncoder,
-                ),
-                requested_data=requested_data,
-                current_instance=current_instance,
+        if event.get("notification", False):
+            notification_events[slug].append(
+                {
+                    "type": event["type"],
+                    "issue_id": event.get("issue_id"),
+                    "actor_id": event["actor_id"],
+                    "project_id": event["project_id"],
+                    "subscriber": event.get("subscriber", True),
+                    "issue_activities_created": json.dumps(
+                        IssueActivitySerializer(activities, many=True).data,
+                        cls=DjangoJSONEncoder,
+                    ),
+                    "requested_data": event.get("requested_data"),
+                    "current_instance": event.get("current_instance"),
+                }
             )
 
+    # Post the updates to segway for integrations and webhooks
+    for slug, activities in webhook_payloads.items():
+        webhook_activities.delay(slug=slug, current_site=origin, activities=activities)
+
+    for notification_batch in notification_events.values():
+        batch_notifications.delay(events=notification_batch)
+
+    return issue_activities_created
+
+
+# Receive message from room group
+@shared_task
+def issue_activity(
+    type,
+    requested_data,
+    current_instance,
+    issue_id,
+    actor_id,
+    project_id,
+    epoch,
+    subscriber=True,
+    notification=False,
+    origin=None,
+    intake=None,
+):
+    try:
+        process_issue_activities(
+            events=[
+                {
+                    "type": type,
+                    "requested_data": requested_data,
+                    "current_instance": current_instance,
+                    "issue_id": issue_id,
+                    "actor_id": actor_id,
+                    "project_id": project_id,
+                    "epoch": epoch,
+                    "subscriber": subscriber,
+                    "notification": notification,
+                    "intake": intake,
+                }
+            ],
+            origin=origin,
+        )
+        return
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def bulk_issue_activity(events, origin=None):
+    """
+    Create the activities of many events at once, e.g. for bulk issue updates.
+    Every event takes the same keys as the arguments of `issue_activity`.
+    """
+    try:
+        process_issue_activities(events=events, origin=origin)
         return
     except Exception as e:
         log_exception(e)
@@ -84,36 +84,50 @@ def get_removed_mentions(requested_instance, current_instance):
 # Adds mentions as subscribers
 def extract_mentions_as_subscribers(project_id, issue_id, mentions):
     # mentions is an array of User IDs representing the FILTERED set of mentioned users
+    mentions = {str(mention_id) for mention_id in mentions}
+    if not mentions:
+        return []
 
-    bulk_mention_subscribers = []
-
-    for mention_id in mentions:
-        # If the particular mention has not already been subscribed to the issue, he must be sent the mentioned notification
-        if (
-            not IssueSubscriber.objects.filter(
-                issue_id=issue_id, subscriber_id=mention_id, project_id=project_id
-            ).exists()
-            and not IssueAssignee.objects.filter(
-                project_id=project_id, issue_id=issue_id, assignee_id=mention_id
-            ).exists()
-            and not Issue.objects.filter(
-                project_id=project_id, pk=issue_id, created_by_id=mention_id
-            ).exists()
-            and ProjectMember.objects.filter(
-                project_id=project_id, member_id=mention_id, is_active=True
-            ).exists()
-        ):
-            project = Project.objects.get(pk=project_id)
-
-            bulk_mention_subscribers.append(
-                IssueSubscriber(
-                    workspace_id=project.workspace_id,
-                    project_id=project_id,
-                    issue_id=issue_id,
-                    subscriber_id=mention_id,
-                )
-            )
-    return bulk_mention_subscribers
+    # Mentioned users that already follow the issue, resolved in one query per
+    # relation instead of one query per mention
+    already_notified = {
+        str(subscriber_id)
+        for subscriber_id in IssueSubscriber.objects.filter(
+            issue_id=issue_id, project_id=project_id, subscriber_id__in=mentions
+        ).values_list("subscriber_id", flat=True)
+    }
+    already_notified.update(
+        str(assignee_id)
+        for assignee_id in IssueAssignee.objects.filter(
+            project_id=project_id, issue_id=issue_id, assignee_id__in=mentions
+        ).values_list("assignee_id", flat=True)
+    )
+    already_notified.update(
+        str(created_by_id)
+        for created_by_id in Issue.objects.filter(
+            project_id=project_id, pk=issue_id, created_by_id__in=mentions
+        ).values_list("created_by_id", flat=True)
+    )
+    new_subscribers = [
+        str(member_id)
+        for member_id in ProjectMember.objects.filter(
+            project_id=project_id, member_id__in=mentions, is_active=True
+        ).values_list("member_id", flat=True)
+        if str(member_id) not in already_notified
+    ]
+    if not new_subscribers:
+        return []
+
+    project = Project.objects.get(pk=project_id)
+    return [
+        IssueSubscriber(
+            workspace_id=project.workspace_id,
+            project_id=project_id,
+            issue_id=issue_id,
+            subscriber_id=mention_id,
+        )
+        for mention_id in new_subscribers
+    ]
 
 
 # Parse Issue Description & extracts mentions
@@ -250,6 +264,7 @@ def notifications(
             project_members = ProjectMember.objects.filter(
                 project_id=project_id, is_active=True
             ).values_list("member_id", flat=True)
+            project_member_ids = {str(member_id) for member_id in project_members}
 
             # Get new mentions from the newer instance
             new_mentions = get_new_mentions(
@@ -259,7 +274,7 @@ def notifications(
             new_mentions = [
                 str(mention)
                 for mention in new_mentions
-                if mention in set(project_members)
+                if str(mention) in project_member_ids
             ]
             removed_mention = get_removed_mentions(
                 requested_instance=requested_data, current_instance=current_instance
@@ -294,7 +309,7 @@ def notifications(
                     comment_mentions = [
                         mention
                         for mention in comment_mentions
-                        if UUID(mention) in set(project_members)
+                        if str(UUID(mention)) in project_member_ids
                     ]
 
             comment_mention_subscribers = extract_mentions_as_subscribers(
@@ -320,7 +335,11 @@ def notifications(
                 .values_list("subscriber", flat=True)
             )
 
-            issue = Issue.objects.filter(pk=issue_id).first()
+            issue = (
+                Issue.objects.filter(pk=issue_id)
+                .select_related("project__workspace", "state")
+                .first()
+            )
 
             if subscriber:
                 # add the user to issue subscriber
@@ -331,16 +350,77 @@ def notifications(
                 except Exception:
                     pass
 
-            project = Project.objects.get(pk=project_id)
+            project = Project.objects.select_related("workspace").get(pk=project_id)
 
-            issue_assignees = IssueAssignee.objects.filter(
-                issue_id=issue_id,
-                project_id=project_id,
-                assignee__in=Subquery(project_members),
-            ).values_list("assignee", flat=True)
+            issue_assignees = set(
+                IssueAssignee.objects.filter(
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    assignee__in=Subquery(project_members),
+                ).values_list("assignee", flat=True)
+            )
 
             issue_subscribers = list(set(issue_subscribers) - {uuid.UUID(actor_id)})
 
+            # Everything the recipient x activity matrix depends on is loaded
+            # up front so the query count does not grow with the subscribers
+            preferences = {
+                str(preference.user_id): preference
+                for preference in UserNotificationPreference.objects.filter(
+                    user_id__in=[str(subscriber) for subscriber in issue_subscribers]
+                    + comment_mentions
+                    + new_mentions
+                )
+            }
+
+            # Activities the subscribers are notified about
+            subscriber_activities = [
+                issue_activity
+                for issue_activity in issue_activities_created
+                # If activity done in blocking then blocked by email should not go
+                if issue_activity.get("issue_detail").get("id") == issue_id
+                # Do not send notification for description update
+                and issue_activity.get("field") != "description"
+            ]
+
+            state_identifiers = [
+                issue_activity.get("new_identifier")
+                for issue_activity in subscriber_activities
+                if issue_activity.get("field") == "state"
+                and issue_activity.get("new_identifier")
+            ]
+            completed_state_ids = (
+                {
+                    str(state_id)
+                    for state_id in State.objects.filter(
+                        project_id=project_id,
+                        pk__in=state_identifiers,
+                        group="completed",
+                    ).values_list("id", flat=True)
+                }
+                if state_identifiers
+                else set()
+            )
+
+            comment_identifiers = [
+                issue_activity.get("issue_comment")
+                for issue_activity in subscriber_activities
+                if issue_activity.get("issue_comment")
+            ]
+            issue_comments = (
+                {
+                    str(issue_comment.id): issue_comment
+                    for issue_comment in IssueComment.objects.filter(
+                        id__in=comment_identifiers,
+                        issue_id=issue_id,
+                        project_id=project_id,
+                        workspace_id=project.workspace_id,
+                    )
+                }
+                if comment_identifiers
+                else {}
+            )
+
             for subscriber in issue_subscribers:
                 if issue.created_by_id and issue.created_by_id == subscriber:
                     sender = "in_app:issue_activities:created"
@@ -352,20 +432,14 @@ def notifications(
                 else:
                     sender = "in_app:issue_activities:subscribed"
 
-                preference = UserNotificationPreference.objects.get(user_id=subscriber)
-
-                for issue_activity in issue_activities_created:
-                    # If activity done in blocking then blocked by email should not go
-                    if issue_activity.get("issue_detail").get("id") != issue_id:
-                        continue
-
-                    # Do not send notification for description update
-                    if issue_activity.get("field") == "description":
-                        continue
+                preference = preferences.get(str(subscriber))
 
+                for issue_activity in subscriber_activities:
                     # Check if the value should be sent or not
                     send_email = False
-                    if (
+                    if preference is None:
+                        send_email = False
+                    elif (
                         issue_activity.get("field") == "state"
                         and preference.state_change
                     ):
@@ -373,11 +447,8 @@ def notifications(
                     elif (
                         issue_activity.get("field") == "state"
                         and preference.issue_completed
-                        and State.objects.filter(
-                            project_id=project_id,
-                            pk=issue_activity.get("new_identifier"),
-                            group="completed",
-                        ).exists()
+                        and str(issue_activity.get("new_identifier"))
+                        in completed_state_ids
                     ):
                         send_email = True
                     elif (
@@ -390,15 +461,8 @@ def notifications(
                         send_email = False
 
                     # If activity is of issue comment fetch the comment
-                    issue_comment = (
-                        IssueComment.objects.filter(
-                            id=issue_activity.get("issue_comment"),
-                            issue_id=issue_id,
-                            project_id=project_id,
-                            workspace_id=project.workspace_id,
-                        ).first()
-                        if issue_activity.get("issue_comment")
-                        else None
+                    issue_comment = issue_comments.get(
+                        str(issue_activity.get("issue_comment"))
                     )
 
                     # Create in app notification
@@ -521,9 +585,7 @@ def notifications(
 
             for mention_id in comment_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences.get(str(mention_id))
                     for issue_activity in issue_activities_created:
                         notification = create_mention_notification(
                             project=project,
@@ -536,7 +598,7 @@ def notifications(
                         )
 
                         # check for email notifications
-                        if preference.mention:
+                        if preference is not None and preference.mention:
                             bulk_email_logs.append(
                                 EmailNotificationLog(
                                     triggered_by_id=actor_id,
@@ -592,11 +654,13 @@ def notifications(
                             )
                         bulk_notifications.append(notification)
 
+            # Description mentions carry the identifiers of the latest activity
+            latest_activity = (
+                issue_activities_created[-1] if issue_activities_created else {}
+            )
             for mention_id in new_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences.get(str(mention_id))
                     if (
                         last_activity is not None
                         and last_activity.field == "description"
@@ -633,24 +697,24 @@ def notifications(
                                         "new_value": str(last_activity.new_value),
                                         "old_value": str(last_activity.old_value),
                                         "old_identifier": (
-                                            str(issue_activity.get("old_identifier"))
-                                            if issue_activity.get("old_identifier")
+                                            str(latest_activity.get("old_identifier"))
+                                            if latest_activity.get("old_identifier")
                                             else None
                                         ),
                                         "new_identifier": (
-                                            str(issue_activity.get("new_identifier"))
-                                            if issue_activity.get("new_identifier")
+                                            str(latest_activity.get("new_identifier"))
+                                            if latest_activity.get("new_identifier")
                                             else None
                                         ),
                                     },
                                 },
                             )
                         )
-                        if preference.mention:
+                        if preference is not None and preference.mention:
                             bulk_email_logs.append(
                                 EmailNotificationLog(
                                     triggered_by_id=actor_id,
-                                    receiver_id=subscriber,
+                                    receiver_id=mention_id,
                                     entity_identifier=issue_id,
                                     entity_name="issue",
                                     data={
@@ -671,16 +735,20 @@ def notifications(
                                             "old_value": str(last_activity.old_value),
                                             "old_identifier": (
                                                 str(
-                                                    issue_activity.get("old_identifier")
+                                                    latest_activity.get(
+                                                        "old_identifier"
+                                                    )
                                                 )
-                                                if issue_activity.get("old_identifier")
+                                                if latest_activity.get("old_identifier")
                                                 else None
                                             ),
                                             "new_identifier": (
                                                 str(
-                                                    issue_activity.get("new_identifier")
+                                                    latest_activity.get(
+                                                        "new_identifier"
+                                                    )
                                                 )
-                                                if issue_activity.get("new_identifier")
+                                                if latest_activity.get("new_identifier")
                                                 else None
                                             ),
                                             "activity_time": str(
@@ -701,11 +769,11 @@ def notifications(
                                 issue_id=issue_id,
                                 activity=issue_activity,
                             )
-                            if preference.mention:
+                            if preference is not None and preference.mention:
                                 bulk_email_logs.append(
                                     EmailNotificationLog(
                                         triggered_by_id=actor_id,
-                                        receiver_id=subscriber,
+                                        receiver_id=mention_id,
                                         entity_identifier=issue_id,
                                         entity_name="issue",
                                         data={
@@ -779,3 +847,10 @@ def notifications(
     except Exception as e:
         print(e)
         return
+
+
+@shared_task
+def batch_notifications(events):
+    """Process the notifications of a batch of issue activities in one task"""
+    for event in events:
+        notifications(**event)
@@ -1,4 +1,11 @@
 # Python imports
+import json
+import time
+from datetime import datetime, timezone as dt_timezone
+
+# Django imports
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 
 # Third party imports
@@ -6,51 +13,167 @@ from celery import shared_task
 
 # Module imports
 from plane.db.models import UserRecentVisit, Workspace
+from plane.settings.redis import redis_client, redis_instance
 from plane.utils.exception_logger import log_exception
 
+RECENT_VISITS_LIMIT = 20
+# Sorted set of the visited entities of a user in a workspace, scored by the
+# visit time, and the set of the sorted sets changed since the last flush
+RECENT_VISITS_KEY = "recent_visits"
+RECENT_VISITS_DIRTY_KEY = "recent_visits_dirty"
+RECENT_VISITS_TIMEOUT = 60 * 60 * 24 * 30
+RECENT_VISITS_FLUSH_BATCH_SIZE = 500
+
+
+def recent_visits_key(slug, user_id):
+    return f"{RECENT_VISITS_KEY}:{slug}:{user_id}"
+
+
+def record_recent_visit(entity_name, entity_identifier, user_id, project_id, slug):
+    """Record a visit in redis, a single round trip written to the database in
+    bulk by flush_recent_visits"""
+    try:
+        key = recent_visits_key(slug, user_id)
+        member = json.dumps(
+            [
+                entity_name,
+                str(entity_identifier) if entity_identifier else None,
+                str(project_id) if project_id else None,
+            ]
+        )
+        pipeline = redis_client().pipeline()
+        pipeline.zadd(key, {member: time.time()})
+        pipeline.zremrangebyrank(key, 0, -RECENT_VISITS_LIMIT - 1)
+        pipeline.expire(key, RECENT_VISITS_TIMEOUT)
+        pipeline.sadd(RECENT_VISITS_DIRTY_KEY, key)
+        pipeline.execute()
+    except Exception as e:
+        log_exception(e)
+
+
+def get_recent_visits(slug, user_id):
+    """Recent visits of a user in a workspace, the latest first"""
+    visits = redis_client().zrevrange(
+        recent_visits_key(slug, user_id), 0, RECENT_VISITS_LIMIT - 1, withscores=True
+    )
+    if not visits:
+        # Visits older than the redis timeout are only in the database
+        return list(
+            UserRecentVisit.objects.filter(workspace__slug=slug, user_id=user_id)
+            .order_by("-visited_at")
+            .values("entity_name", "entity_identifier", "project_id", "visited_at")[
+                :RECENT_VISITS_LIMIT
+            ]
+        )
+
+    recent_visits = []
+    for member, score in visits:
+        entity_name, entity_identifier, project_id = json.loads(member)
+        recent_visits.append(
+            {
+                "entity_name": entity_name,
+                "entity_identifier": entity_identifier,
+                "project_id": project_id,
+                "visited_at": datetime.fromtimestamp(score, tz=dt_timezone.utc),
+            }
+        )
+    return recent_visits
+
 
 @shared_task
 def recent_visited_task(entity_name, entity_identifier, user_id, project_id, slug):
-    try:
-        workspace = Workspace.objects.get(slug=slug)
-        recent_visited = UserRecentVisit.objects.filter(
-            entity_name=entity_name,
-            entity_identifier=entity_identifier,
-            user_id=user_id,
-            project_id=project_id,
-            workspace_id=workspace.id,
-        ).first()
-
-        if recent_visited:
-            recent_visited.visited_at = timezone.now()
-            recent_visited.save(update_fields=["visited_at"])
-        else:
-            recent_visited_count = UserRecentVisit.objects.filter(
-                user_id=user_id, workspace_id=workspace.id
-            ).count()
-            if recent_visited_count == 20:
-                recent_visited = (
-                    UserRecentVisit.objects.filter(
-                        user_id=user_id, workspace_id=workspace.id
+    # Visits queued before they were recorded in redis
+    record_recent_visit(
+        entity_name=entity_name,
+        entity_identifier=entity_identifier,
+        user_id=user_id,
+        project_id=project_id,
+        slug=slug,
+    )
+
+
+@shared_task
+def flush_recent_visits():
+    ri = redis_instance()
+    while True:
+        # Visits recorded after a key is taken mark it again for the next run
+        keys = ri.spop(RECENT_VISITS_DIRTY_KEY, RECENT_VISITS_FLUSH_BATCH_SIZE)
+        if not keys:
+            return
+        keys = [key.decode() for key in keys]
+
+        pipeline = ri.pipeline()
+        for key in keys:
+            pipeline.zrange(key, 0, -1, withscores=True)
+        visits = dict(zip(keys, pipeline.execute()))
+
+        workspaces = dict(
+            Workspace.objects.filter(
+                slug__in={key.split(":")[1] for key in keys}
+            ).values_list("slug", "id")
+        )
+
+        now = timezone.now()
+        recent_visits = []
+        for key, members in visits.items():
+            _, slug, user_id = key.split(":")
+            if slug not in workspaces:
+                continue
+            for member, score in members:
+                entity_name, entity_identifier, project_id = json.loads(member)
+                recent_visits.append(
+                    UserRecentVisit(
+                        workspace_id=workspaces[slug],
+                        project_id=project_id,
+                        user_id=user_id,
+                        entity_name=entity_name,
+                        entity_identifier=entity_identifier,
+                        visited_at=datetime.fromtimestamp(score, tz=dt_timezone.utc),
+                        created_at=now,
+                        updated_at=now,
+                        created_by_id=user_id,
+                        updated_by_id=user_id,
                     )
-                    .order_by("created_at")
-                    .first()
                 )
-                recent_visited.delete()
-
-            recent_activity = UserRecentVisit.objects.create(
-                entity_name=entity_name,
-                entity_identifier=entity_identifier,
-                user_id=user_id,
-                visited_at=timezone.now(),
-                project_id=project_id,
-                workspace_id=workspace.id,
+        if not recent_visits:
+            continue
+
+        try:
+            # A single INSERT ... ON CONFLICT DO UPDATE per batch
+            UserRecentVisit.all_objects.bulk_create(
+                recent_visits,
+                update_conflicts=True,
+                unique_fields=["workspace", "user", "entity_name", "entity_identifier"],
+                update_fields=[
+                    "project",
+                    "visited_at",
+                    "updated_at",
+                    "updated_by",
+                    "deleted_at",
+                ],
+                batch_size=RECENT_VISITS_FLUSH_BATCH_SIZE,
             )
-            recent_activity.created_by_id = user_id
-            recent_activity.updated_by_id = user_id
-            recent_activity.save(update_fields=["created_by_id", "updated_by_id"])
 
-        return
-    except Exception as e:
-        log_exception(e)
-        return
+            # Drop the visits past the limit of every user and workspace, the
+            # soft deleted ones are not listed and do not count
+            ranked = (
+                UserRecentVisit.objects.filter(
+                    user_id__in={visit.user_id for visit in recent_visits},
+                    workspace_id__in={visit.workspace_id for visit in recent_visits},
+                )
+                .annotate(
+                    position=Window(
+                        RowNumber(),
+                        partition_by=[F("workspace_id"), F("user_id")],
+                        order_by=F("visited_at").desc(),
+                    )
+                )
+                .filter(position__gt=RECENT_VISITS_LIMIT)
+                .values("id")
+            )
+            UserRecentVisit.all_objects.filter(id__in=ranked).delete()
+        except Exception as e:
+            # The visits are kept in redis, the keys are flushed on the next run
+            ri.sadd(RECENT_VISITS_DIRTY_KEY, *keys)
+            log_exception(e)
+            return
@@ -2,12 +2,19 @@ import hashlib
 import hmac
 import json
 import logging
+import time
 import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Third party imports
 from celery import shared_task
+from celery.utils.time import get_exponential_backoff_interval
 
 # Django imports
 from django.conf import settings
@@ -43,6 +50,7 @@ from plane.db.models import (
     IntakeIssue,
 )
 from plane.license.utils.instance_value import get_email_configuration
+from plane.settings.redis import redis_client
 from plane.utils.exception_logger import log_exception
 
 SERIALIZER_MAPPER = {
@@ -70,6 +78,35 @@ MODEL_MAPPER = {
 }
 
 
+# Receivers get a few seconds to connect and answer, the retries are scheduled
+# instead of holding a worker on a slow receiver
+WEBHOOK_TIMEOUT = (5, 10)
+WEBHOOK_MAX_RETRIES = 5
+WEBHOOK_RETRY_BACKOFF = 600
+
+# Deliveries in flight per receiving host across all the workers, a slot is
+# held at most for the time a delivery can take
+WEBHOOK_HOST_CONCURRENCY = 4
+WEBHOOK_SLOT_TIMEOUT = sum(WEBHOOK_TIMEOUT) * 2
+# Times a delivery is put off for a busy or failing host before it counts as
+# a failed attempt
+WEBHOOK_MAX_DEFERRALS = 12
+
+# Consecutive failures after which a host is not called for the cooldown
+WEBHOOK_CIRCUIT_THRESHOLD = 5
+WEBHOOK_CIRCUIT_COOLDOWN = 300
+
+# Webhooks of an event delivered in parallel by a task
+WEBHOOK_DELIVERY_WORKERS = 8
+
+WEBHOOK_ACTIONS = {
+    "POST": "create",
+    "PATCH": "update",
+    "PUT": "update",
+    "DELETE": "delete",
+}
+
+
 def get_model_data(event, event_id, many=False):
     model = MODEL_MAPPER.get(event)
     if many:
@@ -239,110 +276,294 @@ def send_webhook_deactivation_email(webhook_id, receiver_id, current_site, reaso
         return
 
 
-@shared_task(
-    bind=True,
-    autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
-    retry_jitter=True,
-)
-def webhook_send_task(
-    self, webhook, slug, event, event_data, action, current_site, activity
-):
-    try:
-        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
-
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
+@lru_cache(maxsize=None)
+def webhook_session():
+    """HTTP session of the process, keeps a pool of connections per host"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=64, pool_maxsize=WEBHOOK_HOST_CONCURRENCY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class WebhookCircuit:
+    """Concurrency limit and circuit breaker of a receiving host, shared by all
+    the workers through redis. Deliveries go ahead when redis is unavailable."""
+
+    def __init__(self, url):
+        self.host = urlparse(url).netloc
+        self.inflight_key = f"webhook:inflight:{self.host}"
+        self.failures_key = f"webhook:failures:{self.host}"
+        self.open_key = f"webhook:circuit:{self.host}"
+        self.slot = None
+
+    def acquire(self, requests=1):
+        """Take a delivery slot of the host for the given number of requests,
+        returns 0 when one was taken or the seconds to wait before trying again"""
+        try:
+            ri = redis_client()
+            cooldown = ri.ttl(self.open_key)
+            if cooldown > 0:
+                return cooldown
+
+            # Every slot expires on its own, so the slots of workers killed mid
+            # delivery are given back however busy the host is
+            now = time.time()
+            slot = uuid.uuid4().hex
+            timeout = WEBHOOK_SLOT_TIMEOUT * requests
+            pipeline = ri.pipeline()
+            pipeline.zremrangebyscore(self.inflight_key, "-inf", now)
+            pipeline.zadd(self.inflight_key, {slot: now + timeout})
+            pipeline.zcard(self.inflight_key)
+            pipeline.expire(self.inflight_key, timeout)
+            _, _, inflight, _ = pipeline.execute()
+            if inflight > WEBHOOK_HOST_CONCURRENCY:
+                ri.zrem(self.inflight_key, slot)
+                return sum(WEBHOOK_TIMEOUT)
+            self.slot = slot
+        except Exception as e:
+            log_exception(e)
+        return 0
+
+    def release(self, success):
+        try:
+            ri = redis_client()
+            if self.slot:
+                ri.zrem(self.inflight_key, self.slot)
+                self.slot = None
+            if success:
+                ri.delete(self.failures_key)
+                return
+
+            pipeline = ri.pipeline()
+            pipeline.incr(self.failures_key)
+            pipeline.expire(self.failures_key, WEBHOOK_CIRCUIT_COOLDOWN)
+            failures, _ = pipeline.execute()
+            if failures >= WEBHOOK_CIRCUIT_THRESHOLD:
+                ri.set(self.open_key, 1, ex=WEBHOOK_CIRCUIT_COOLDOWN)
+                ri.delete(self.failures_key)
+        except Exception as e:
+            log_exception(e)
+
+
+def webhook_payload(webhook, event, action, shared):
+    """Body sent to a webhook, the serialized data and activity are shared by
+    all the webhooks of the event"""
+    head = json.dumps(
+        {
+            "event": event,
+            "action": action,
+            "webhook_id": str(webhook.id),
+            "workspace_id": str(webhook.workspace_id),
         }
+    )
+    return f"{head[:-1]}, {shared[1:]}"
 
-        # # Your secret key
-        event_data = (
-            json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
-            if event_data is not None
-            else None
+
+def post_webhook(webhook, event, action, payload, attempt):
+    """Post the payload to the webhook, returns the log of the delivery and
+    whether it failed"""
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Autopilot",
+        "X-Plane-Delivery": str(uuid.uuid4()),
+        "X-Plane-Event": event,
+    }
+    # Use HMAC for generating signature
+    if webhook.secret_key:
+        headers["X-Plane-Signature"] = hmac.new(
+            webhook.secret_key.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+
+    log = WebhookLog(
+        workspace_id=webhook.workspace_id,
+        webhook_id=webhook.id,
+        event_type=str(event),
+        request_method=str(action),
+        request_headers=str(headers),
+        request_body=payload,
+        retry_count=attempt,
+    )
+    failed = False
+    try:
+        response = webhook_session().post(
+            webhook.url,
+            data=payload.encode("utf-8"),
+            headers=headers,
+            timeout=WEBHOOK_TIMEOUT,
         )
+        log.response_status = str(response.status_code)
+        log.response_headers = str(response.headers)
+        log.response_body = str(response.text)
+    except requests.RequestException as e:
+        failed = True
+        log.response_status = 500
+        log.response_headers = ""
+        log.response_body = str(e)
+    return log, failed
+
+
+def send_webhook(webhook, circuit, event, action, payloads, attempt):
+    """Post the payloads to the webhook in order over a slot taken from the
+    circuit of its host. The payloads after a failed one are not sent, returns
+    the logs of the deliveries and whether the last one failed"""
+    logs, failed = [], False
+    try:
+        for payload in payloads:
+            log, failed = post_webhook(webhook, event, action, payload, attempt)
+            logs.append(log)
+            if failed:
+                break
+    finally:
+        circuit.release(success=not failed)
+    return logs, failed
 
-        activity = (
-            json.loads(json.dumps(activity, cls=DjangoJSONEncoder))
-            if activity is not None
-            else None
+
+@shared_task
+def deliver_webhooks(
+    webhook_ids,
+    slug,
+    event,
+    event_data,
+    action,
+    current_site,
+    activity,
+    attempt=0,
+    deferrals=0,
+):
+    """
+    Deliver an event to webhooks of a workspace. The payload is serialized once
+    for all of them, they are called in parallel over pooled connections and
+    the deliveries are logged with one insert. Failed deliveries are retried
+    with a backoff and the ones to hosts that are busy or failing are deferred.
+
+    A list of activities is sent as one body per activity, in order, and a
+    retry resumes from the first activity a webhook did not receive.
+    """
+    try:
+        webhooks = list(
+            Webhook.objects.filter(
+                id__in=webhook_ids, workspace__slug=slug, is_active=True
+            )
         )
+        if not webhooks:
+            return
 
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
+        action = WEBHOOK_ACTIONS.get(action, action)
+        activities = activity if isinstance(activity, list) else [activity]
+        shared = [
+            json.dumps({"data": event_data, "activity": item}, cls=DjangoJSONEncoder)
+            for item in activities
+        ]
 
-        payload = {
+        # Hosts that are failing or at their concurrency limit are skipped
+        ready, deferred, wait = [], [], 0
+        for webhook in webhooks:
+            circuit = WebhookCircuit(webhook.url)
+            delay = circuit.acquire(len(shared))
+            if delay:
+                deferred.append(webhook)
+                wait = max(wait, delay)
+            else:
+                ready.append((webhook, circuit))
+
+        results = []
+        if ready:
+            with ThreadPoolExecutor(
+                max_workers=min(len(ready), WEBHOOK_DELIVERY_WORKERS)
+            ) as executor:
+                results = list(
+                    executor.map(
+                        lambda item: send_webhook(
+                            item[0],
+                            item[1],
+                            event,
+                            action,
+                            [
+                                webhook_payload(item[0], event, action, body)
+                                for body in shared
+                            ],
+                            attempt,
+                        ),
+                        ready,
+                    )
+                )
+            WebhookLog.objects.bulk_create([log for logs, _ in results for log in logs])
+
+        task_kwargs = {
+            "slug": slug,
             "event": event,
+            "event_data": event_data,
             "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
+            "current_site": current_site,
             "activity": activity,
         }
+        # Failed webhooks along with the number of activities they received
+        failed = [
+            (webhook, logs[-1].response_body, len(logs) - 1)
+            for (webhook, _), (logs, fail) in zip(ready, results)
+            if fail
+        ]
+
+        if deferred:
+            if deferrals < WEBHOOK_MAX_DEFERRALS:
+                deliver_webhooks.apply_async(
+                    kwargs={
+                        **task_kwargs,
+                        "webhook_ids": [str(webhook.id) for webhook in deferred],
+                        "attempt": attempt,
+                        "deferrals": deferrals + 1,
+                    },
+                    countdown=wait,
+                )
+            else:
+                # A host busy or failing for too long counts as a failed attempt
+                failed.extend(
+                    (webhook, "The receiver was unavailable", 0) for webhook in deferred
+                )
 
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
-
-        # Send the webhook event
-        response = requests.post(webhook.url, headers=headers, json=payload, timeout=30)
-
-        # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
-        )
+        if not failed:
+            return
 
-    except requests.RequestException as e:
-        # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
-        )
-        # Retry logic
-        if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
-                # send email for the deactivation of the webhook
-                send_webhook_deactivation_email(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
+        if attempt < WEBHOOK_MAX_RETRIES:
+            # Webhooks that received as many activities are retried together
+            pending = defaultdict(list)
+            for webhook, _, delivered in failed:
+                pending[delivered].append(str(webhook.id))
+            for delivered, webhook_ids in pending.items():
+                deliver_webhooks.apply_async(
+                    kwargs={
+                        **task_kwargs,
+                        "activity": (
+                            activity[delivered:]
+                            if isinstance(activity, list)
+                            else activity
+                        ),
+                        "webhook_ids": webhook_ids,
+                        "attempt": attempt + 1,
+                        "deferrals": 0,
+                    },
+                    countdown=get_exponential_backoff_interval(
+                        factor=WEBHOOK_RETRY_BACKOFF,
+                        retries=attempt,
+                        maximum=WEBHOOK_RETRY_BACKOFF,
+                        full_jitter=True,
+                    ),
                 )
             return
-        raise requests.RequestException()
 
+        Webhook.objects.filter(pk__in=[webhook.id for webhook, _, _ in failed]).update(
+            is_active=False
+        )
+        for webhook, reason, _ in failed:
+            # send email for the deactivation of the webhook
+            send_webhook_deactivation_email(
+                webhook_id=webhook.id,
+                receiver_id=webhook.created_by_id,
+                reason=reason,
+                current_site=current_site,
+            )
+        return
     except Exception as e:
         if settings.DEBUG:
             print(e)
@@ -350,6 +571,20 @@ def webhook_send_task(
         return
 
 
+@shared_task
+def webhook_send_task(webhook, slug, event, event_data, action, current_site, activity):
+    # Deliveries queued one webhook at a time are handed to the delivery engine
+    deliver_webhooks(
+        webhook_ids=[str(webhook)],
+        slug=slug,
+        event=event,
+        event_data=event_data,
+        action=action,
+        current_site=current_site,
+        activity=activity,
+    )
+
+
 @shared_task
 def webhook_activity(
     event,
@@ -382,28 +617,174 @@ def webhook_activity(
         if event == "issue_comment":
             webhooks = webhooks.filter(issue_comment=True)
 
-        for webhook in webhooks:
-            webhook_send_task.delay(
-                webhook=webhook.id,
+        webhook_ids = [
+            str(webhook_id) for webhook_id in webhooks.values_list("id", flat=True)
+        ]
+        if not webhook_ids:
+            return
+
+        deliver_webhooks.delay(
+            webhook_ids=webhook_ids,
+            slug=slug,
+            event=event,
+            event_data=get_model_data(event=event, event_id=event_id),
+            action=verb,
+            current_site=current_site,
+            activity={
+                "field": field,
+                "new_value": new_value,
+                "old_value": old_value,
+                "actor": get_model_data(event="user", event_id=actor_id),
+                "old_identifier": old_identifier,
+                "new_identifier": new_identifier,
+            },
+        )
+        return
+    except Exception as e:
+        # Return if a does not exist error occurs
+        if isinstance(e, ObjectDoesNotExist):
+            return
+        if settings.DEBUG:
+            print(e)
+        log_exception(e)
+        return
+
+
+# Webhook flag that subscribes to each event, events without one go to every webhook
+WEBHOOK_EVENT_FLAGS = {
+    "project": "project",
+    "issue": "issue",
+    "module": "module",
+    "module_issue": "module",
+    "cycle": "cycle",
+    "cycle_issue": "cycle",
+    "issue_comment": "issue_comment",
+}
+
+
+@shared_task
+def webhook_activities(slug, current_site, activities):
+    """
+    Fan out a batch of activities of a workspace to its webhooks. The webhooks
+    are loaded once and every entity and actor is serialized once per batch.
+    """
+    try:
+        webhooks = list(Webhook.objects.filter(workspace__slug=slug, is_active=True))
+        if not webhooks:
+            return
+
+        serialized = {}
+        for activity in activities:
+            event = activity["event"]
+            flag = WEBHOOK_EVENT_FLAGS.get(event)
+            subscribed = [
+                webhook
+                for webhook in webhooks
+                if flag is None or getattr(webhook, flag)
+            ]
+            if not subscribed:
+                continue
+
+            try:
+                for key in [
+                    (event, str(activity["event_id"])),
+                    ("user", str(activity["actor_id"])),
+                ]:
+                    if key not in serialized:
+                        serialized[key] = get_model_data(event=key[0], event_id=key[1])
+            except ObjectDoesNotExist:
+                # The entity was removed before the webhooks went out
+                continue
+
+            deliver_webhooks.delay(
+                webhook_ids=[str(webhook.id) for webhook in subscribed],
                 slug=slug,
                 event=event,
-                event_data=get_model_data(event=event, event_id=event_id),
-                action=verb,
+                event_data=serialized[(event, str(activity["event_id"]))],
+                action=activity["verb"],
                 current_site=current_site,
                 activity={
-                    "field": field,
-                    "new_value": new_value,
-                    "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
-                    "old_identifier": old_identifier,
-                    "new_identifier": new_identifier,
+                    "field": activity["field"],
+                    "new_value": activity["new_value"],
+                    "old_value": activity["old_value"],
+                    "actor": serialized[("user", str(activity["actor_id"]))],
+                    "old_identifier": activity["old_identifier"],
+                    "new_identifier": activity["new_identifier"],
                 },
             )
         return
     except Exception as e:
-        # Return if a does not exist error occurs
-        if isinstance(e, ObjectDoesNotExist):
+        if settings.DEBUG:
+            print(e)
+        log_exception(e)
+        return
+
+
+@shared_task
+def webhook_changes(event, changes, actor_id, slug, current_site, event_id):
+    """
+    Deliver the fields changed by an update of an entity. Webhooks that opted in
+    to batched changes get them all in one event, the others one event per
+    field from a single delivery task, and the entity and actor are serialized
+    once for all of them.
+    """
+    try:
+        webhooks = Webhook.objects.filter(workspace__slug=slug, is_active=True)
+        flag = WEBHOOK_EVENT_FLAGS.get(event)
+        if flag is not None:
+            webhooks = webhooks.filter(**{flag: True})
+        webhooks = list(webhooks.values_list("id", "batch_changes"))
+        if not webhooks:
             return
+
+        event_data = get_model_data(event=event, event_id=event_id)
+        actor = get_model_data(event="user", event_id=actor_id)
+        batched = [str(webhook_id) for webhook_id, batch in webhooks if batch]
+        per_field = [str(webhook_id) for webhook_id, batch in webhooks if not batch]
+
+        if batched:
+            deliver_webhooks.delay(
+                webhook_ids=batched,
+                slug=slug,
+                event=event,
+                event_data=event_data,
+                action="updated",
+                current_site=current_site,
+                activity={
+                    "field": None,
+                    "changes": changes,
+                    "actor": actor,
+                    "old_identifier": None,
+                    "new_identifier": None,
+                },
+            )
+
+        if per_field:
+            # One message for all the fields, delivered as a body per field
+            deliver_webhooks.delay(
+                webhook_ids=per_field,
+                slug=slug,
+                event=event,
+                event_data=event_data,
+                action="updated",
+                current_site=current_site,
+                activity=[
+                    {
+                        "field": change["field"],
+                        "new_value": change["new_value"],
+                        "old_value": change["old_value"],
+                        "actor": actor,
+                        "old_identifier": None,
+                        "new_identifier": None,
+                    }
+                    for change in changes
+                ],
+            )
+        return
+    except ObjectDoesNotExist:
+        # The entity was removed before the webhooks went out
+        return
+    except Exception as e:
         if settings.DEBUG:
             print(e)
         log_exception(e)
@@ -436,25 +817,25 @@ def model_activity(
         json.loads(current_instance) if current_instance is not None else None
     )
 
-    # Loop through all keys in requested data and check the current value and requested value
-    for key in requested_data:
-        # Check if key is present in current instance or not
-        if key in current_instance:
-            current_value = current_instance.get(key, None)
-            requested_value = requested_data.get(key, None)
-            if current_value != requested_value:
-                webhook_activity.delay(
-                    event=model_name,
-                    verb="updated",
-                    field=key,
-                    old_value=current_value,
-                    new_value=requested_value,
-                    actor_id=actor_id,
-                    slug=slug,
-                    current_site=origin,
-                    event_id=model_id,
-                    old_identifier=None,
-                    new_identifier=None,
-                )
+    # Diff all the requested keys against the current instance at once
+    changes = [
+        {
+            "field": key,
+            "old_value": current_instance.get(key, None),
+            "new_value": requested_data.get(key, None),
+        }
+        for key in requested_data
+        if key in current_instance
+        and current_instance.get(key, None) != requested_data.get(key, None)
+    ]
+    if changes:
+        webhook_changes.delay(
+            event=model_name,
+            changes=changes,
+            actor_id=actor_id,
+            slug=slug,
+            current_site=origin,
+            event_id=model_id,
+        )
 
     return
@@ -36,6 +36,18 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.deletion_task.hard_delete",
         "schedule": crontab(hour=0, minute=0),
     },
+    "check-every-minute-to-flush-api-logs": {
+        "task": "plane.bgtasks.api_logs_task.flush_api_logs",
+        "schedule": crontab(minute="*"),
+    },
+    "check-every-minute-to-flush-api-token-last-used": {
+        "task": "plane.bgtasks.api_token_task.flush_api_token_last_used",
+        "schedule": crontab(minute="*"),
+    },
+    "check-every-minute-to-flush-recent-visits": {
+        "task": "plane.bgtasks.recent_visited_task.flush_recent_visits",
+        "schedule": crontab(minute="*"),
+    },
     "check-every-day-to-delete-api-logs": {
         "task": "plane.bgtasks.api_logs_task.delete_api_logs",
         "schedule": crontab(hour=0, minute=0),
@@ -0,0 +1,45 @@
+# Django imports
+from django.core.management import BaseCommand
+
+# Module imports
+from plane.db.models import Cycle, Module
+from plane.utils.issue_rollup import refresh_cycle_rollups, refresh_module_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild the issue counts and estimate points rolled up per cycle and module"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project", type=str, nargs="?", help="Project to rebuild the rollups of"
+        )
+        parser.add_argument(
+            "--missing",
+            action="store_true",
+            help="Only build the rollups that do not exist yet",
+        )
+
+    def handle(self, *args, **options):
+        cycles = Cycle.objects.all()
+        modules = Module.objects.all()
+
+        if options["project"]:
+            cycles = cycles.filter(project_id=options["project"])
+            modules = modules.filter(project_id=options["project"])
+
+        if options["missing"]:
+            cycles = cycles.filter(rollup__isnull=True)
+            modules = modules.filter(rollup__isnull=True)
+
+        cycle_ids = list(cycles.values_list("id", flat=True))
+        module_ids = list(modules.values_list("id", flat=True))
+
+        refresh_cycle_rollups(cycle_ids)
+        refresh_module_rollups(module_ids)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt the rollups of {len(cycle_ids)} cycles and "
+                f"{len(module_ids)} modules"
+            )
+        )
@@ -0,0 +1,99 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:40
+
+from django.db import migrations
+
+
+# Recreate the api logs as a table range partitioned by day on created_at, so
+# the retention drops whole partitions. The primary key has to include the
+# partition key. Every log is carried over, the logs older than the created
+# partitions land in the default partition and are deleted by the retention.
+PARTITION_API_ACTIVITY_LOGS = """
+ALTER TABLE api_activity_logs RENAME TO api_activity_logs_legacy;
+
+CREATE TABLE api_activity_logs (
+    LIKE api_activity_logs_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+) PARTITION BY RANGE (created_at);
+
+ALTER TABLE api_activity_logs ADD PRIMARY KEY (id, created_at);
+
+CREATE TABLE api_activity_logs_default PARTITION OF api_activity_logs DEFAULT;
+
+DO $$
+DECLARE
+    day date;
+BEGIN
+    FOR day IN
+        SELECT generate_series(
+            (now() AT TIME ZONE 'UTC')::date - 30,
+            (now() AT TIME ZONE 'UTC')::date + 7,
+            interval '1 day'
+        )::date
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF api_activity_logs FOR VALUES FROM (%L) TO (%L)',
+            'api_activity_logs_p' || to_char(day, 'YYYYMMDD'),
+            day::timestamp AT TIME ZONE 'UTC',
+            (day + 1)::timestamp AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+END $$;
+
+INSERT INTO api_activity_logs
+SELECT * FROM api_activity_logs_legacy;
+
+DROP TABLE api_activity_logs_legacy;
+
+CREATE INDEX api_activity_logs_created_at_idx ON api_activity_logs (created_at);
+CREATE INDEX api_activity_logs_created_by_id_idx
+    ON api_activity_logs (created_by_id);
+CREATE INDEX api_activity_logs_updated_by_id_idx
+    ON api_activity_logs (updated_by_id);
+
+ALTER TABLE api_activity_logs
+    ADD CONSTRAINT api_activity_logs_created_by_id_fk
+    FOREIGN KEY (created_by_id) REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE api_activity_logs
+    ADD CONSTRAINT api_activity_logs_updated_by_id_fk
+    FOREIGN KEY (updated_by_id) REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED;
+"""
+
+# Recreate the api logs as a plain table with every log of the partitions
+UNPARTITION_API_ACTIVITY_LOGS = """
+CREATE TABLE api_activity_logs_unpartitioned (
+    LIKE api_activity_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+);
+
+INSERT INTO api_activity_logs_unpartitioned
+SELECT * FROM api_activity_logs;
+
+DROP TABLE api_activity_logs;
+
+ALTER TABLE api_activity_logs_unpartitioned RENAME TO api_activity_logs;
+
+ALTER TABLE api_activity_logs ADD PRIMARY KEY (id);
+
+CREATE INDEX api_activity_logs_created_by_id_idx
+    ON api_activity_logs (created_by_id);
+CREATE INDEX api_activity_logs_updated_by_id_idx
+    ON api_activity_logs (updated_by_id);
+
+ALTER TABLE api_activity_logs
+    ADD CONSTRAINT api_activity_logs_created_by_id_fk
+    FOREIGN KEY (created_by_id) REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE api_activity_logs
+    ADD CONSTRAINT api_activity_logs_updated_by_id_fk
+    FOREIGN KEY (updated_by_id) REFERENCES users (id) DEFERRABLE INITIALLY DEFERRED;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0087_issue_search_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=PARTITION_API_ACTIVITY_LOGS,
+            reverse_sql=UNPARTITION_API_ACTIVITY_LOGS,
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:20
+
+from django.db import migrations, models
+import django.contrib.postgres.operations
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    # The index is built concurrently to not lock the issues
+    atomic = False
+
+    dependencies = [
+        ("db", "0088_partition_api_activity_logs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueSequenceCounter",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="issue_sequence_counter",
+                        serialize=False,
+                        to="db.project",
+                    ),
+                ),
+                ("last_sequence", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Issue Sequence Counter",
+                "verbose_name_plural": "Issue Sequence Counters",
+                "db_table": "issue_sequence_counters",
+            },
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="issue",
+            index=models.Index(
+                fields=["project", "state", "sort_order"],
+                name="issue_state_sort_order_idx",
+            ),
+        ),
+    ]
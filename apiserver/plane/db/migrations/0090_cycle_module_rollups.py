@@ -0,0 +1,96 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:26
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [("db", "0089_issuesequencecounter")]
+
+    operations = [
+        migrations.CreateModel(
+            name="CycleRollup",
+            fields=[
+                ("backlog_issues", models.PositiveIntegerField(default=0)),
+                ("unstarted_issues", models.PositiveIntegerField(default=0)),
+                ("started_issues", models.PositiveIntegerField(default=0)),
+                ("completed_issues", models.PositiveIntegerField(default=0)),
+                ("cancelled_issues", models.PositiveIntegerField(default=0)),
+                ("total_issues", models.PositiveIntegerField(default=0)),
+                ("backlog_estimate_points", models.FloatField(default=0)),
+                ("unstarted_estimate_points", models.FloatField(default=0)),
+                ("started_estimate_points", models.FloatField(default=0)),
+                ("completed_estimate_points", models.FloatField(default=0)),
+                ("cancelled_estimate_points", models.FloatField(default=0)),
+                ("total_estimate_points", models.FloatField(default=0)),
+                (
+                    "assignee_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.UUIDField(),
+                        blank=True,
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "cycle",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rollup",
+                        serialize=False,
+                        to="db.cycle",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Cycle Rollup",
+                "verbose_name_plural": "Cycle Rollups",
+                "db_table": "cycle_rollups",
+            },
+        ),
+        migrations.CreateModel(
+            name="ModuleRollup",
+            fields=[
+                ("backlog_issues", models.PositiveIntegerField(default=0)),
+                ("unstarted_issues", models.PositiveIntegerField(default=0)),
+                ("started_issues", models.PositiveIntegerField(default=0)),
+                ("completed_issues", models.PositiveIntegerField(default=0)),
+                ("cancelled_issues", models.PositiveIntegerField(default=0)),
+                ("total_issues", models.PositiveIntegerField(default=0)),
+                ("backlog_estimate_points", models.FloatField(default=0)),
+                ("unstarted_estimate_points", models.FloatField(default=0)),
+                ("started_estimate_points", models.FloatField(default=0)),
+                ("completed_estimate_points", models.FloatField(default=0)),
+                ("cancelled_estimate_points", models.FloatField(default=0)),
+                ("total_estimate_points", models.FloatField(default=0)),
+                (
+                    "assignee_ids",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.UUIDField(),
+                        blank=True,
+                        default=list,
+                        size=None,
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "module",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="rollup",
+                        serialize=False,
+                        to="db.module",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Module Rollup",
+                "verbose_name_plural": "Module Rollups",
+                "db_table": "module_rollups",
+            },
+        ),
+    ]
@@ -0,0 +1,15 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("db", "0090_cycle_module_rollups")]
+
+    operations = [
+        migrations.AddField(
+            model_name="webhook",
+            name="batch_changes",
+            field=models.BooleanField(default=False),
+        )
+    ]
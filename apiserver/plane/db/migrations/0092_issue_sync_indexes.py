@@ -0,0 +1,44 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:33
+
+import django.contrib.postgres.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The indexes are built concurrently to not lock large tables
+    atomic = False
+
+    dependencies = [("db", "0091_webhook_batch_changes")]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="cycleissue",
+            index=models.Index(
+                fields=["project", "updated_at"], name="cycle_issue_updated_idx"
+            ),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="issue",
+            index=models.Index(
+                fields=["project", "updated_at"], name="issue_project_updated_idx"
+            ),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="issueassignee",
+            index=models.Index(
+                fields=["project", "updated_at"], name="issue_assignee_updated_idx"
+            ),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="issuelabel",
+            index=models.Index(
+                fields=["project", "updated_at"], name="issue_label_updated_idx"
+            ),
+        ),
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="moduleissue",
+            index=models.Index(
+                fields=["project", "updated_at"], name="module_issue_updated_idx"
+            ),
+        ),
+    ]
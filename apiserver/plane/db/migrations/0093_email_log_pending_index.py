@@ -0,0 +1,22 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:05
+
+import django.contrib.postgres.operations
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The index is built concurrently to not lock the log table
+    atomic = False
+
+    dependencies = [("db", "0092_issue_sync_indexes")]
+
+    operations = [
+        django.contrib.postgres.operations.AddIndexConcurrently(
+            model_name="emailnotificationlog",
+            index=models.Index(
+                condition=models.Q(("processed_at__isnull", True)),
+                fields=["receiver", "created_at"],
+                name="email_log_pending_idx",
+            ),
+        )
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [("db", "0093_email_log_pending_index")]
+
+    operations = [
+        migrations.AddField(
+            model_name="pageversion",
+            name="base",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="deltas",
+                to="db.pageversion",
+            ),
+        ),
+        migrations.AddField(
+            model_name="pageversion",
+            name="binary_data",
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name="pageversion",
+            name="html_data",
+            field=models.BinaryField(null=True),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.17 on 2026-10-18 22:10
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [("db", "0094_page_version_deltas")]
+
+    operations = [
+        migrations.AlterField(
+            model_name="userrecentvisit",
+            name="visited_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        # Keep the latest visit of every entity before making them unique
+        migrations.RunSQL(
+            """
+            DELETE FROM user_recent_visits
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY workspace_id, user_id, entity_name,
+                            entity_identifier
+                        ORDER BY deleted_at IS NULL DESC, visited_at DESC, id
+                    ) AS position
+                    FROM user_recent_visits
+                ) AS visits
+                WHERE position > 1
+            );
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="userrecentvisit",
+            constraint=models.UniqueConstraint(
+                fields=("workspace", "user", "entity_name", "entity_identifier"),
+                name="recent_visit_unique_entity",
+            ),
+        ),
+    ]
@@ -41,7 +41,9 @@ class UserAuditModel(models.Model):
 class SoftDeletionQuerySet(models.QuerySet):
     def delete(self, soft=True):
         if soft:
-            return self.update(deleted_at=timezone.now())
+            # Deleting is a change too, the same as deleting a single instance
+            now = timezone.now()
+            return self.update(deleted_at=now, updated_at=now)
         else:
             return super().delete()
 
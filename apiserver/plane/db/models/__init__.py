@@ -39,6 +39,7 @@ from .issue import (
     IssueReaction,
     IssueRelation,
     IssueSequence,
+    IssueSequenceCounter,
     IssueSubscriber,
     IssueVote,
 )
@@ -53,6 +54,7 @@ from .project import (
     ProjectMemberInvite,
     ProjectPublicMember,
 )
+from .rollup import CycleRollup, ModuleRollup
 from .session import Session
 from .social_connection import SocialLoginConnection
 from .state import State
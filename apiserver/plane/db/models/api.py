@@ -1,10 +1,15 @@
 # Python imports
+import hashlib
 from uuid import uuid4
 
 # Django imports
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.conf import settings
 
+from plane.db.mixins import SoftDeletionQuerySet
 from .base import BaseModel
 
 
@@ -16,6 +21,32 @@ def generate_token():
     return "plane_api_" + uuid4().hex
 
 
+class APITokenQuerySet(models.QuerySet):
+    """Drops the cached tokens a bulk update changes, updates do not send the
+    post_save signal that revokes a single token"""
+
+    def invalidate_cache(self):
+        cache.delete_many(
+            [
+                APIToken.cache_key(token)
+                for token in self.values_list("token", flat=True)
+            ]
+        )
+
+    def update(self, **kwargs):
+        self.invalidate_cache()
+        return super().update(**kwargs)
+
+
+class SoftDeletionAPITokenQuerySet(SoftDeletionQuerySet, APITokenQuerySet):
+    """Soft deletes are updates and drop the cached tokens too"""
+
+
+class APITokenManager(models.Manager.from_queryset(SoftDeletionAPITokenQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class APIToken(BaseModel):
     # Meta information
     label = models.CharField(max_length=255, default=generate_label_token)
@@ -41,6 +72,9 @@ class APIToken(BaseModel):
     expired_at = models.DateTimeField(blank=True, null=True)
     is_service = models.BooleanField(default=False)
 
+    objects = APITokenManager()
+    all_objects = models.Manager.from_queryset(APITokenQuerySet)()
+
     class Meta:
         verbose_name = "API Token"
         verbose_name_plural = "API Tokems"
@@ -50,6 +84,29 @@ class APIToken(BaseModel):
     def __str__(self):
         return str(self.user.id)
 
+    @staticmethod
+    def cache_key(token):
+        """Cache key of a verified token, hashed to keep tokens out of redis"""
+        return f"api_token:{hashlib.sha256(token.encode()).hexdigest()}"
+
+    @staticmethod
+    def user_cache_key(user_id):
+        """Cache key of the user authenticated by the tokens of the user"""
+        return f"api_token_user:{user_id}"
+
+
+@receiver(post_save, sender=APIToken)
+@receiver(post_delete, sender=APIToken)
+def invalidate_api_token_cache(sender, instance, **kwargs):
+    # Deactivated, expired or deleted tokens are revoked immediately
+    cache.delete(APIToken.cache_key(instance.token))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_api_token_user_cache(sender, instance, **kwargs):
+    cache.delete(APIToken.user_cache_key(instance.pk))
+
 
 class APIActivityLog(BaseModel):
     token_identifier = models.CharField(max_length=255)
@@ -3,10 +3,15 @@ import pytz
 
 # Django imports
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 
 # Module imports
+from plane.utils.issue_search import search_vector
 from .project import ProjectBaseModel
+from plane.utils.cache import invalidate_group_values_cache
 
 
 def get_default_filters():
@@ -80,6 +85,7 @@ class Cycle(ProjectBaseModel):
         verbose_name_plural = "Cycles"
         db_table = "cycles"
         ordering = ("-created_at",)
+        indexes = [GinIndex(search_vector("name"), name="cycle_name_search_idx")]
 
     def save(self, *args, **kwargs):
         if self._state.adding:
@@ -118,6 +124,11 @@ class CycleIssue(ProjectBaseModel):
                 name="cycle_issue_when_deleted_at_null",
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["project", "updated_at"], name="cycle_issue_updated_idx"
+            )
+        ]
         verbose_name = "Cycle Issue"
         verbose_name_plural = "Cycle Issues"
         db_table = "cycle_issues"
@@ -156,3 +167,9 @@ class CycleUserProperties(ProjectBaseModel):
 
     def __str__(self):
         return f"{self.cycle.name} {self.user.email}"
+
+
+@receiver(post_save, sender=Cycle)
+def invalidate_cycle_group_values(sender, instance, **kwargs):
+    # Grouped issue lists read the cycles of the project from the cache
+    invalidate_group_values_cache(instance.workspace_id, instance.project_id)
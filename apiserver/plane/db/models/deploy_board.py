@@ -3,9 +3,12 @@ from uuid import uuid4
 
 # Django imports
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 
 # Module imports
 from .workspace import WorkspaceBaseModel
+from plane.utils.cache import invalidate_public_board_cache
 
 
 def get_anchor():
@@ -55,3 +58,10 @@ class DeployBoard(WorkspaceBaseModel):
         verbose_name_plural = "Deploy Boards"
         db_table = "deploy_boards"
         ordering = ("-created_at",)
+
+
+@receiver(post_save, sender=DeployBoard)
+def invalidate_deploy_board_cache(sender, instance, **kwargs):
+    # Cached responses of a board unpublished or republished are dropped
+    if instance.entity_name == "project" and instance.entity_identifier:
+        invalidate_public_board_cache([instance.entity_identifier])
@@ -4,9 +4,10 @@ from uuid import uuid4
 # Django imports
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models, transaction
+from django.db import connection, models, transaction
 from django.utils import timezone
 from django.db.models import Q
 from django import apps
@@ -15,6 +16,7 @@ from django import apps
 from plane.utils.html_processor import strip_tags
 from plane.db.mixins import SoftDeletionManager
 from plane.utils.exception_logger import log_exception
+from plane.utils.issue_search import search_vector
 from .project import ProjectBaseModel
 
 
@@ -177,6 +179,16 @@ class Issue(ProjectBaseModel):
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(search_vector("name"), name="issue_name_search_idx"),
+            models.Index(
+                fields=["project", "updated_at"], name="issue_project_updated_idx"
+            ),
+            models.Index(
+                fields=["project", "state", "sort_order"],
+                name="issue_state_sort_order_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if self.state is None:
@@ -207,25 +219,24 @@ class Issue(ProjectBaseModel):
                 pass
 
         if self._state.adding:
+            # Reserved before the insert so concurrent writers of the project
+            # do not wait on the insert, the counter row stays locked until
+            # the end of an outer transaction the issue is saved in
+            self.sequence_id = IssueSequenceCounter.allocate(self.project_id)
+            # New issues land at the bottom of their state, the largest sort
+            # order is read from the end of issue_state_sort_order_idx
+            largest_sort_order = Issue.objects.filter(
+                project=self.project, state=self.state
+            ).aggregate(largest=models.Max("sort_order"))["largest"]
+            if largest_sort_order is not None:
+                self.sort_order = largest_sort_order + 10000
+            # Strip the html tags using html parser
+            self.description_stripped = (
+                None
+                if (self.description_html == "" or self.description_html is None)
+                else strip_tags(self.description_html)
+            )
             with transaction.atomic():
-                last_sequence = (
-                    IssueSequence.objects.filter(project=self.project)
-                    .select_for_update()
-                    .aggregate(largest=models.Max("sequence"))["largest"]
-                )
-                self.sequence_id = last_sequence + 1 if last_sequence else 1
-                # Strip the html tags using html parser
-                self.description_stripped = (
-                    None
-                    if (self.description_html == "" or self.description_html is None)
-                    else strip_tags(self.description_html)
-                )
-                largest_sort_order = Issue.objects.filter(
-                    project=self.project, state=self.state
-                ).aggregate(largest=models.Max("sort_order"))["largest"]
-                if largest_sort_order is not None:
-                    self.sort_order = largest_sort_order + 10000
-
                 super(Issue, self).save(*args, **kwargs)
 
                 IssueSequence.objects.create(
@@ -348,6 +359,11 @@ class IssueAssignee(ProjectBaseModel):
                 name="issue_assignee_unique_issue_assignee_when_deleted_at_null",
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["project", "updated_at"], name="issue_assignee_updated_idx"
+            )
+        ]
         verbose_name = "Issue Assignee"
         verbose_name_plural = "Issue Assignees"
         db_table = "issue_assignees"
@@ -522,6 +538,11 @@ class IssueLabel(ProjectBaseModel):
     )
 
     class Meta:
+        indexes = [
+            models.Index(
+                fields=["project", "updated_at"], name="issue_label_updated_idx"
+            )
+        ]
         verbose_name = "Issue Label"
         verbose_name_plural = "Issue Labels"
         db_table = "issue_labels"
@@ -548,6 +569,65 @@ class IssueSequence(ProjectBaseModel):
         ordering = ("-created_at",)
 
 
+class IssueSequenceCounter(models.Model):
+    """Last sequence id handed out to the issues of a project"""
+
+    project = models.OneToOneField(
+        "db.Project",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="issue_sequence_counter",
+    )
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+
+    @classmethod
+    def allocate(cls, project_id, count=1):
+        """Reserve count consecutive sequence ids in a project, returns the
+        first sequence id of the range"""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE issue_sequence_counters
+                SET last_sequence = last_sequence + %s
+                WHERE project_id = %s
+                RETURNING last_sequence
+                """,
+                [count, project_id],
+            )
+            row = cursor.fetchone()
+            if row is None:
+                # First allocation of the project, start after the existing
+                # sequences
+                cursor.execute(
+                    """
+                    INSERT INTO issue_sequence_counters AS counter
+                        (project_id, last_sequence)
+                    SELECT
+                        %(project_id)s,
+                        COALESCE(
+                            (
+                                SELECT MAX(sequence) FROM issue_sequences
+                                WHERE project_id = %(project_id)s
+                            ),
+                            0
+                        ) + %(count)s
+                    ON CONFLICT (project_id) DO UPDATE
+                    SET last_sequence = counter.last_sequence + %(count)s
+                    RETURNING last_sequence
+                    """,
+                    {"project_id": project_id, "count": count},
+                )
+                row = cursor.fetchone()
+
+        (last_sequence,) = row
+        return last_sequence - count + 1
+
+
 class IssueSubscriber(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue, on_delete=models.CASCADE, related_name="issue_subscribers"
@@ -1,7 +1,13 @@
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.db.models import Q
 
 from .workspace import WorkspaceBaseModel
+from plane.utils.cache import (
+    invalidate_group_values_cache,
+    invalidate_public_board_cache,
+)
 
 
 class Label(WorkspaceBaseModel):
@@ -53,3 +59,16 @@ class Label(WorkspaceBaseModel):
 
     def __str__(self):
         return str(self.name)
+
+
+@receiver(post_save, sender=Label)
+def invalidate_label_group_values(sender, instance, **kwargs):
+    # Grouped issue lists read the labels from the cache
+    invalidate_group_values_cache(instance.workspace_id, instance.project_id)
+
+
+@receiver(post_save, sender=Label)
+def invalidate_label_public_board(sender, instance, **kwargs):
+    # Published boards are grouped by the labels of their project
+    if instance.project_id:
+        invalidate_public_board_cache([instance.project_id])
@@ -1,10 +1,15 @@
 # Django imports
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.db.models import Q
 
 # Module imports
+from plane.utils.issue_search import search_vector
 from .project import ProjectBaseModel
+from plane.utils.cache import invalidate_group_values_cache
 
 
 def get_default_filters():
@@ -104,6 +109,7 @@ class Module(ProjectBaseModel):
         verbose_name_plural = "Modules"
         db_table = "modules"
         ordering = ("-created_at",)
+        indexes = [GinIndex(search_vector("name"), name="module_name_search_idx")]
 
     def save(self, *args, **kwargs):
         if self._state.adding:
@@ -159,6 +165,11 @@ class ModuleIssue(ProjectBaseModel):
                 name="module_issue_unique_issue_module_when_deleted_at_null",
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["project", "updated_at"], name="module_issue_updated_idx"
+            )
+        ]
         verbose_name = "Module Issue"
         verbose_name_plural = "Module Issues"
         db_table = "module_issues"
@@ -215,3 +226,9 @@ class ModuleUserProperties(ProjectBaseModel):
 
     def __str__(self):
         return f"{self.module.name} {self.user.email}"
+
+
+@receiver(post_save, sender=Module)
+def invalidate_module_group_values(sender, instance, **kwargs):
+    # Grouped issue lists read the modules of the project from the cache
+    invalidate_group_values_cache(instance.workspace_id, instance.project_id)
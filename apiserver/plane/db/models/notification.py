@@ -1,6 +1,7 @@
 # Django imports
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
 
 # Module imports
 from .base import BaseModel
@@ -123,3 +124,11 @@ class EmailNotificationLog(BaseModel):
         verbose_name_plural = "Email Notification Logs"
         db_table = "email_notification_logs"
         ordering = ("-created_at",)
+        indexes = [
+            # Pending notifications are digested per receiver
+            models.Index(
+                fields=["receiver", "created_at"],
+                condition=Q(processed_at__isnull=True),
+                name="email_log_pending_idx",
+            )
+        ]
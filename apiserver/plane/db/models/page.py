@@ -4,10 +4,12 @@ from django.conf import settings
 from django.utils import timezone
 
 # Django imports
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 # Module imports
 from plane.utils.html_processor import strip_tags
+from plane.utils.issue_search import search_vector
 
 from .base import BaseModel
 
@@ -56,6 +58,7 @@ class Page(BaseModel):
         verbose_name_plural = "Pages"
         db_table = "pages"
         ordering = ("-created_at",)
+        indexes = [GinIndex(search_vector("name"), name="page_name_search_idx")]
 
     def __str__(self):
         """Return owner email and page name"""
@@ -172,6 +175,13 @@ class PageVersion(BaseModel):
     description_html = models.TextField(blank=True, default="<p></p>")
     description_stripped = models.TextField(blank=True, null=True)
     description_json = models.JSONField(default=dict, blank=True)
+    # Compressed snapshot of the description, or delta against the snapshot
+    # in base, the description fields only hold the versions saved before
+    base = models.ForeignKey(
+        "self", on_delete=models.CASCADE, null=True, related_name="deltas"
+    )
+    html_data = models.BinaryField(null=True)
+    binary_data = models.BinaryField(null=True)
 
     class Meta:
         verbose_name = "Page Version"
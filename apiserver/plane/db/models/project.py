@@ -6,6 +6,8 @@ from uuid import uuid4
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.db.models import Q
 
 # Module imports
@@ -13,6 +15,7 @@ from plane.db.mixins import AuditModel
 
 # Module imports
 from .base import BaseModel
+from plane.utils.cache import invalidate_group_values_cache
 
 ROLE_CHOICES = ((20, "Admin"), (15, "Member"), (5, "Guest"))
 
@@ -322,3 +325,15 @@ class ProjectPublicMember(ProjectBaseModel):
         verbose_name_plural = "Project Public Members"
         db_table = "project_public_members"
         ordering = ("-created_at",)
+
+
+@receiver(post_save, sender=Project)
+def invalidate_project_group_values(sender, instance, **kwargs):
+    # Grouped issue lists read the projects of the workspace from the cache
+    invalidate_group_values_cache(instance.workspace_id)
+
+
+@receiver(post_save, sender=ProjectMember)
+def invalidate_project_member_group_values(sender, instance, **kwargs):
+    # Grouped issue lists read the members of the project from the cache
+    invalidate_group_values_cache(instance.workspace_id, instance.project_id)
@@ -1,6 +1,7 @@
 # Django imports
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 # Module imports
 from .workspace import WorkspaceBaseModel
@@ -23,9 +24,16 @@ class UserRecentVisit(WorkspaceBaseModel):
         on_delete=models.CASCADE,
         related_name="user_recent_visit",
     )
-    visited_at = models.DateTimeField(auto_now=True)
+    visited_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
+        # Visits are upserted on the entity, soft deleted rows included
+        constraints = [
+            models.UniqueConstraint(
+                fields=["workspace", "user", "entity_name", "entity_identifier"],
+                name="recent_visit_unique_entity",
+            )
+        ]
         verbose_name = "User Recent Visit"
         verbose_name_plural = "User Recent Visits"
         db_table = "user_recent_visits"
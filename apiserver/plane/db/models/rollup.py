@@ -0,0 +1,48 @@
+# Django imports
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+
+class IssueRollup(models.Model):
+    """Issue counts and estimate points per state group of a cycle or module,
+    kept up to date by the issue activities so lists do not aggregate them"""
+
+    backlog_issues = models.PositiveIntegerField(default=0)
+    unstarted_issues = models.PositiveIntegerField(default=0)
+    started_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    cancelled_issues = models.PositiveIntegerField(default=0)
+    total_issues = models.PositiveIntegerField(default=0)
+    backlog_estimate_points = models.FloatField(default=0)
+    unstarted_estimate_points = models.FloatField(default=0)
+    started_estimate_points = models.FloatField(default=0)
+    completed_estimate_points = models.FloatField(default=0)
+    cancelled_estimate_points = models.FloatField(default=0)
+    total_estimate_points = models.FloatField(default=0)
+    assignee_ids = ArrayField(models.UUIDField(), blank=True, default=list)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class CycleRollup(IssueRollup):
+    cycle = models.OneToOneField(
+        "db.Cycle", on_delete=models.CASCADE, primary_key=True, related_name="rollup"
+    )
+
+    class Meta:
+        verbose_name = "Cycle Rollup"
+        verbose_name_plural = "Cycle Rollups"
+        db_table = "cycle_rollups"
+
+
+class ModuleRollup(IssueRollup):
+    module = models.OneToOneField(
+        "db.Module", on_delete=models.CASCADE, primary_key=True, related_name="rollup"
+    )
+
+    class Meta:
+        verbose_name = "Module Rollup"
+        verbose_name_plural = "Module Rollups"
+        db_table = "module_rollups"
@@ -1,10 +1,16 @@
 # Django imports
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.template.defaultfilters import slugify
 from django.db.models import Q
 
 # Module imports
 from .project import ProjectBaseModel
+from plane.utils.cache import (
+    invalidate_group_values_cache,
+    invalidate_public_board_cache,
+)
 
 
 class State(ProjectBaseModel):
@@ -60,3 +66,16 @@ class State(ProjectBaseModel):
                 self.sequence = last_id + 15000
 
         return super().save(*args, **kwargs)
+
+
+@receiver(post_save, sender=State)
+def invalidate_state_group_values(sender, instance, **kwargs):
+    # Grouped issue lists read the states of the project from the cache
+    invalidate_group_values_cache(instance.workspace_id, instance.project_id)
+
+
+@receiver(post_save, sender=State)
+def invalidate_state_public_board(sender, instance, **kwargs):
+    # Published boards are grouped by the states of their project
+    if instance.project_id:
+        invalidate_public_board_cache([instance.project_id])
@@ -3,12 +3,16 @@ import pytz
 
 # Django imports
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 
 # Module imports
 from .base import BaseModel
 from plane.utils.constants import RESTRICTED_WORKSPACE_SLUGS
+from plane.utils.cache import invalidate_group_values_cache, workspace_id_cache_key
 
 ROLE_CHOICES = ((20, "Admin"), (15, "Member"), (5, "Guest"))
 
@@ -322,3 +326,15 @@ class WorkspaceUserProperties(BaseModel):
 
     def __str__(self):
         return f"{self.workspace.name} {self.user.email}"
+
+
+@receiver(post_save, sender=WorkspaceMember)
+def invalidate_workspace_member_group_values(sender, instance, **kwargs):
+    # Grouped issue lists read the members of the workspace from the cache
+    invalidate_group_values_cache(instance.workspace_id)
+
+
+@receiver(post_save, sender=Workspace)
+def invalidate_workspace_id(sender, instance, **kwargs):
+    # A slug given up by a workspace may be taken by another one
+    cache.delete(workspace_id_cache_key(instance.slug))
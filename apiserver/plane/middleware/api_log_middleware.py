@@ -1,39 +1,75 @@
-from plane.db.models import APIActivityLog
+# Python imports
+import json
+import random
+
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.bgtasks.api_logs_task import API_LOG_BUFFER_KEY
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
 
 
 class APITokenLogMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
+        self.redis = None
 
     def __call__(self, request):
+        api_key = request.headers.get("X-Api-Key")
+        # Only the sampled API key requests are logged
+        if not api_key or random.random() >= settings.API_LOG_SAMPLE_RATE:
+            return self.get_response(request)
+
         request_body = request.body
         response = self.get_response(request)
-        self.process_request(request, response, request_body)
+        self.process_request(request, response, request_body, api_key)
         return response
 
-    def process_request(self, request, response, request_body):
-        api_key_header = "X-Api-Key"
-        api_key = request.headers.get(api_key_header)
-        # If the API key is present, log the request
-        if api_key:
-            try:
-                APIActivityLog.objects.create(
-                    token_identifier=api_key,
-                    path=request.path,
-                    method=request.method,
-                    query_params=request.META.get("QUERY_STRING", ""),
-                    headers=str(request.headers),
-                    body=(request_body.decode("utf-8") if request_body else None),
-                    response_body=(
-                        response.content.decode("utf-8") if response.content else None
-                    ),
-                    response_code=response.status_code,
-                    ip_address=request.META.get("REMOTE_ADDR", None),
-                    user_agent=request.META.get("HTTP_USER_AGENT", None),
-                )
-
-            except Exception as e:
-                print(e)
-                # If the token does not exist, you can decide whether to log this as an invalid attempt
+    def truncate(self, value, limit=None):
+        if not value:
+            return None
+        limit = limit or settings.API_LOG_BODY_LIMIT
+        if isinstance(value, bytes):
+            return value[:limit].decode("utf-8", errors="ignore")
+        return value[:limit]
+
+    def process_request(self, request, response, request_body, api_key):
+        # The log is buffered in redis and written in bulk by flush_api_logs,
+        # the request never waits on the database
+        try:
+            user = getattr(request, "user", None)
+            log = {
+                "token_identifier": api_key,
+                "path": self.truncate(request.path, 255),
+                "method": request.method,
+                "query_params": self.truncate(request.META.get("QUERY_STRING", "")),
+                "headers": self.truncate(str(request.headers)),
+                "body": self.truncate(request_body),
+                "response_body": (
+                    None
+                    if getattr(response, "streaming", False)
+                    else self.truncate(response.content)
+                ),
+                "response_code": response.status_code,
+                "ip_address": request.META.get("REMOTE_ADDR", None),
+                "user_agent": self.truncate(
+                    request.META.get("HTTP_USER_AGENT", None), 512
+                ),
+                "created_by_id": (
+                    str(user.id) if user and user.is_authenticated else None
+                ),
+            }
+
+            if self.redis is None:
+                self.redis = redis_instance()
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.rpush(API_LOG_BUFFER_KEY, json.dumps(log))
+            # Bound the buffer when the flush is falling behind
+            pipeline.ltrim(API_LOG_BUFFER_KEY, -settings.API_LOG_BUFFER_SIZE, -1)
+            pipeline.execute()
+        except Exception as e:
+            log_exception(e)
 
         return None
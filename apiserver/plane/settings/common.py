@@ -309,6 +309,20 @@ SKIP_ENV_VAR = os.environ.get("SKIP_ENV_VAR", "1") == "1"
 
 DATA_UPLOAD_MAX_MEMORY_SIZE = int(os.environ.get("FILE_SIZE_LIMIT", 5242880))
 
+# API request logs, sampled and truncated before being buffered in redis
+API_LOG_SAMPLE_RATE = float(os.environ.get("API_LOG_SAMPLE_RATE", 1))
+API_LOG_BODY_LIMIT = int(os.environ.get("API_LOG_BODY_LIMIT", 65536))
+API_LOG_BUFFER_SIZE = int(os.environ.get("API_LOG_BUFFER_SIZE", 100000))
+
+# API rate limits, the burst is allowed on top of the rate after idle periods
+# and the workspace limit is shared by all the tokens of a workspace
+API_KEY_RATE_LIMIT = os.environ.get("API_KEY_RATE_LIMIT", "60/minute")
+API_KEY_RATE_BURST = int(os.environ.get("API_KEY_RATE_BURST", 0))
+SERVICE_TOKEN_RATE_LIMIT = os.environ.get("SERVICE_TOKEN_RATE_LIMIT", "300/minute")
+SERVICE_TOKEN_RATE_BURST = int(os.environ.get("SERVICE_TOKEN_RATE_BURST", 0))
+WORKSPACE_API_RATE_LIMIT = os.environ.get("WORKSPACE_API_RATE_LIMIT") or None
+WORKSPACE_API_RATE_BURST = int(os.environ.get("WORKSPACE_API_RATE_BURST", 0))
+
 # Cookie Settings
 SESSION_COOKIE_SECURE = secure_origins
 SESSION_COOKIE_HTTPONLY = True
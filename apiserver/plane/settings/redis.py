@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import redis
 from django.conf import settings
 from urllib.parse import urlparse
@@ -18,3 +20,9 @@ def redis_instance():
         ri = redis.Redis.from_url(settings.REDIS_URL, db=0)
 
     return ri
+
+
+@lru_cache(maxsize=None)
+def redis_client():
+    """Redis connection shared by the requests of the process"""
+    return redis_instance()
@@ -1,5 +1,11 @@
 # Python imports
+import hashlib
 import os
+import time
+from functools import lru_cache
+
+# Django imports
+from django.core.cache import cache
 
 # Third party imports
 import boto3
@@ -10,6 +16,33 @@ from urllib.parse import quote
 from plane.utils.exception_logger import log_exception
 from storages.backends.s3boto3 import S3Boto3Storage
 
+# Static assets never change once uploaded, their urls are signed for long and
+# reused until they get close to expiring. An url handed out keeps working
+# after its asset is deleted, so long is a day and not the week S3 allows.
+STATIC_ASSET_URL_EXPIRATION = 60 * 60 * 24
+# Urls signed with temporary credentials (instance roles, STS) stop working when
+# the credentials expire, which boto refreshes ten minutes before at the latest
+TEMPORARY_CREDENTIALS_URL_EXPIRATION = 60 * 10
+PRESIGNED_URL_REFRESH_MARGIN = 60 * 60
+S3_MAX_POOL_CONNECTIONS = 50
+
+
+@lru_cache(maxsize=32)
+def get_s3_client(access_key_id, secret_access_key, region, endpoint_url):
+    """S3 client shared by the threads of the process, one per endpoint and
+    credentials"""
+    # The default session is not thread safe, each client gets its own
+    return boto3.session.Session().client(
+        "s3",
+        aws_access_key_id=access_key_id,
+        aws_secret_access_key=secret_access_key,
+        region_name=region,
+        endpoint_url=endpoint_url,
+        config=boto3.session.Config(
+            signature_version="s3v4", max_pool_connections=S3_MAX_POOL_CONNECTIONS
+        ),
+    )
+
 
 class S3Storage(S3Boto3Storage):
     def url(self, name, parameters=None, expire=None, http_method=None):
@@ -31,30 +64,18 @@ class S3Storage(S3Boto3Storage):
             "AWS_S3_ENDPOINT_URL"
         ) or os.environ.get("MINIO_ENDPOINT_URL")
 
-        if os.environ.get("USE_MINIO") == "1":
-            # Create an S3 client for MinIO
-            self.s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.aws_region,
-                endpoint_url=(
-                    f"{request.scheme}://{request.get_host()}"
-                    if request
-                    else self.aws_s3_endpoint_url
-                ),
-                config=boto3.session.Config(signature_version="s3v4"),
-            )
+        if os.environ.get("USE_MINIO") == "1" and request:
+            # MinIO is reached through the host serving the request
+            endpoint_url = f"{request.scheme}://{request.get_host()}"
         else:
-            # Create an S3 client
-            self.s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.aws_region,
-                endpoint_url=self.aws_s3_endpoint_url,
-                config=boto3.session.Config(signature_version="s3v4"),
-            )
+            endpoint_url = self.aws_s3_endpoint_url
+
+        self.s3_client = get_s3_client(
+            self.aws_access_key_id,
+            self.aws_secret_access_key,
+            self.aws_region,
+            endpoint_url,
+        )
 
     def generate_presigned_post(
         self, object_name, file_type, file_size, expiration=3600
@@ -130,6 +151,47 @@ class S3Storage(S3Boto3Storage):
         # The response contains the presigned URL
         return response
 
+    def static_url_expiration(self):
+        """Seconds the urls of static assets are signed for, only long when
+        they are signed with static keys"""
+        if self.aws_access_key_id and self.aws_secret_access_key:
+            return STATIC_ASSET_URL_EXPIRATION
+        # The keys come from the instance role or another temporary source
+        return TEMPORARY_CREDENTIALS_URL_EXPIRATION
+
+    def generate_static_presigned_url(self, object_name):
+        """Generate a presigned URL for an immutable object, reusing the one
+        signed before while it is valid for long enough.
+
+        Returns the URL and the seconds it can still be cached for.
+        """
+        expiration = self.static_url_expiration()
+        margin = min(PRESIGNED_URL_REFRESH_MARGIN, expiration // 2)
+
+        # Urls signed with rotated keys are not reused
+        endpoint_url = self.s3_client.meta.endpoint_url
+        digest = hashlib.md5(
+            f"{endpoint_url}:{self.aws_access_key_id}:{object_name}".encode()
+        ).hexdigest()
+        key = f"presigned_url:{digest}"
+
+        cached = cache.get(key)
+        if cached:
+            max_age = int(cached["expires_at"] - time.time())
+            if max_age > margin:
+                return cached["url"], max_age - margin
+
+        expires_at = time.time() + expiration
+        url = self.generate_presigned_url(
+            object_name=object_name, expiration=expiration
+        )
+        if not url:
+            return None, 0
+
+        max_age = expiration - margin
+        cache.set(key, {"url": url, "expires_at": expires_at}, max_age)
+        return url, max_age
+
     def get_object_metadata(self, object_name):
         """Get the metadata for an S3 object"""
         try:
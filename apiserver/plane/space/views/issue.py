@@ -1,7 +1,13 @@
 # Python imports
+import hashlib
 import json
+import time
 
 # Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.fields import ArrayField
 from django.db.models.functions import Coalesce, JSONObject
@@ -63,6 +69,12 @@ from plane.db.models import (
     CycleIssue,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.cache import (
+    PUBLIC_BOARD_CACHE_TIMEOUT,
+    public_board_cache_key,
+    public_board_cache_tag,
+    versioned_cache_key,
+)
 from plane.utils.issue_filters import issue_filters
 
 
@@ -70,17 +82,62 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
     permission_classes = [AllowAny]
 
     def get(self, request, anchor):
-        filters = issue_filters(request.query_params, "GET")
-        order_by_param = request.GET.get("order_by", "-created_at")
-
-        deploy_board = DeployBoard.objects.filter(
-            anchor=anchor, entity_name="project"
-        ).first()
+        deploy_board = (
+            DeployBoard.objects.filter(anchor=anchor, entity_name="project")
+            .select_related("workspace")
+            .first()
+        )
         if not deploy_board:
             return Response(
                 {"error": "Project is not published"}, status=status.HTTP_404_NOT_FOUND
             )
 
+        # The board is the same for every visitor, responses are cached per
+        # query and versioned by the project's tag, which the issue activities
+        # bump, so the ETag changes with the issues and a client or proxy
+        # revalidating a hot board gets a 304 without the issues being queried
+        key = versioned_cache_key(
+            public_board_cache_key(anchor, request.query_params),
+            [public_board_cache_tag(deploy_board.entity_identifier)],
+        )
+        etag = quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+        cached = cache.get(key)
+        last_modified = cached["last_modified"] if cached else None
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return self.cache_headers(not_modified, etag, last_modified)
+
+        if cached is not None:
+            response = Response(cached["data"], status=status.HTTP_200_OK)
+        else:
+            response = self.list_issues(request, deploy_board)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+
+            last_modified = int(time.time())
+            if not settings.DEBUG:
+                cache.set(
+                    key,
+                    {"data": response.data, "last_modified": last_modified},
+                    PUBLIC_BOARD_CACHE_TIMEOUT,
+                )
+        return self.cache_headers(response, etag, last_modified)
+
+    def cache_headers(self, response, etag, last_modified):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        # Shared caches may keep the board but have to revalidate it
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
+
+    def list_issues(self, request, deploy_board):
+        filters = issue_filters(request.query_params, "GET")
+        order_by_param = request.GET.get("order_by", "-created_at")
+
         project_id = deploy_board.entity_identifier
         slug = deploy_board.workspace.slug
 
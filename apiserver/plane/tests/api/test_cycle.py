@@ -1 +1,81 @@
-# TODO: Write Test for Cycle Endpoints
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.test import TestCase
+
+# Third party imports
+from rest_framework.test import APIClient
+
+# Module imports
+from plane.celery import app
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleRollup,
+    Issue,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+class CycleIssueRollupTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="admin", email="admin@plane.so")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(
+            project=self.project, workspace=self.workspace, member=self.user, role=20
+        )
+        backlog = State.objects.create(
+            name="Backlog", group="backlog", project=self.project
+        )
+        done = State.objects.create(
+            name="Done", group="completed", project=self.project
+        )
+        self.cycle = Cycle.objects.create(
+            name="Cycle", project=self.project, owned_by=self.user
+        )
+        self.other_cycle = Cycle.objects.create(
+            name="Other", project=self.project, owned_by=self.user
+        )
+        self.issues = [
+            Issue.objects.create(name="Issue", project=self.project, state=state)
+            for state in [backlog, backlog, done]
+        ]
+        # The last issue is moved from another cycle
+        CycleIssue.objects.create(
+            cycle=self.other_cycle, issue=self.issues[2], project=self.project
+        )
+
+        self.client = APIClient(HTTP_USER_AGENT="plane/test", REMOTE_ADDR="10.10.10.10")
+        self.client.force_authenticate(user=self.user)
+
+    def test_bulk_add_refreshes_rollups(self):
+        # Run the issue activity inline
+        with mock.patch.object(app.conf, "task_always_eager", True):
+            response = self.client.post(
+                f"/api/workspaces/{self.workspace.slug}/projects/{self.project.id}"
+                f"/cycles/{self.cycle.id}/cycle-issues/",
+                {"issues": [str(issue.id) for issue in self.issues]},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, 201)
+        rollup = CycleRollup.objects.get(cycle=self.cycle)
+        self.assertEqual(rollup.total_issues, 3)
+        self.assertEqual(rollup.backlog_issues, 2)
+        self.assertEqual(rollup.completed_issues, 1)
+        other_rollup = CycleRollup.objects.get(cycle=self.other_cycle)
+        self.assertEqual(other_rollup.total_issues, 0)
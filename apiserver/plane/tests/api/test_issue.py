@@ -1 +1,177 @@
-# TODO: Write Test for Issue Endpoints
+# Python imports
+from datetime import timedelta
+from unittest import mock
+
+# Django imports
+from django.test import TestCase
+from django.utils import timezone
+
+# Third party imports
+from rest_framework.test import APIClient
+
+# Module imports
+from plane.app.views.issue.base import encode_sync_token
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueLabel,
+    Label,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+
+
+class IssueSyncTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="admin", email="admin@plane.so")
+        self.guest = User.objects.create(username="guest", email="guest@plane.so")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        for user, role in [(self.user, 20), (self.guest, 5)]:
+            WorkspaceMember.objects.create(
+                workspace=self.workspace, member=user, role=role
+            )
+            ProjectMember.objects.create(
+                project=self.project, workspace=self.workspace, member=user, role=role
+            )
+        state = State.objects.create(
+            name="Backlog", group="backlog", project=self.project
+        )
+        self.issues = [
+            Issue.objects.create(name="Issue", project=self.project, state=state)
+            for _ in range(3)
+        ]
+        self.label = Label.objects.create(name="Bug", project=self.project)
+
+        # Changes are stamped in the past, clear of the sync lag
+        self.start = timezone.now() - timedelta(hours=1)
+        Issue.all_objects.filter(project=self.project).update(
+            updated_at=self.start, created_by=self.user
+        )
+
+        self.client = APIClient(HTTP_USER_AGENT="plane/test", REMOTE_ADDR="10.10.10.10")
+        self.client.force_authenticate(user=self.user)
+
+    def sync(self, **params):
+        response = self.client.get(
+            f"/api/workspaces/{self.workspace.slug}/projects/{self.project.id}"
+            "/issues/sync/",
+            params,
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def touch(self, queryset, minutes):
+        queryset.update(updated_at=self.start + timedelta(minutes=minutes))
+
+    def test_deleted_issue_tombstone(self):
+        token = encode_sync_token(self.start)
+        Issue.objects.filter(pk=self.issues[0].id).delete()
+        self.touch(Issue.all_objects.filter(pk=self.issues[0].id), 1)
+
+        data = self.sync(sync_token=token)
+
+        self.assertEqual(data["issues"], [])
+        self.assertEqual(
+            [str(issue_id) for issue_id in data["deleted_issues"]],
+            [str(self.issues[0].id)],
+        )
+        self.assertFalse(data["has_more"])
+
+    def test_removed_label(self):
+        issue_label = IssueLabel.objects.create(
+            issue=self.issues[1], label=self.label, project=self.project
+        )
+        self.touch(IssueLabel.all_objects.filter(pk=issue_label.id), 0)
+        token = encode_sync_token(self.start)
+        IssueLabel.objects.filter(pk=issue_label.id).delete()
+        self.touch(IssueLabel.all_objects.filter(pk=issue_label.id), 1)
+
+        data = self.sync(sync_token=token)
+
+        self.assertEqual(
+            [str(issue["id"]) for issue in data["issues"]], [str(self.issues[1].id)]
+        )
+        self.assertEqual(
+            [
+                (str(relation["issue_id"]), str(relation["label_id"]))
+                for relation in data["removed"]["labels"]
+            ],
+            [(str(self.issues[1].id), str(self.label.id))],
+        )
+
+    def test_page_boundary_on_tied_timestamps(self):
+        self.touch(Issue.objects.filter(pk=self.issues[2].id), 1)
+
+        # The two issues sharing the first timestamp are sent together
+        data = self.sync(per_page=1)
+        self.assertTrue(data["has_more"])
+        self.assertEqual(
+            {str(issue["id"]) for issue in data["issues"]},
+            {str(self.issues[0].id), str(self.issues[1].id)},
+        )
+        self.assertEqual(data["sync_token"], encode_sync_token(self.start))
+
+        data = self.sync(per_page=1, sync_token=data["sync_token"])
+        self.assertFalse(data["has_more"])
+        self.assertEqual(
+            [str(issue["id"]) for issue in data["issues"]], [str(self.issues[2].id)]
+        )
+
+    def test_page_size_is_clamped(self):
+        for per_page in [0, -1]:
+            data = self.sync(per_page=per_page)
+            self.assertTrue(data["has_more"])
+            self.assertEqual(len(data["issues"]), 3)
+
+    def test_guest_sees_own_issues(self):
+        Issue.objects.filter(pk=self.issues[0].id).update(created_by=self.guest)
+        self.client.force_authenticate(user=self.guest)
+
+        data = self.sync()
+
+        self.assertEqual(
+            [str(issue["id"]) for issue in data["issues"]], [str(self.issues[0].id)]
+        )
+        self.assertEqual(data["deleted_issues"], [])
+
+    def test_issue_moved_between_cycles(self):
+        cycles = [
+            Cycle.objects.create(name=name, project=self.project, owned_by=self.user)
+            for name in ["First", "Second"]
+        ]
+        CycleIssue.objects.create(
+            cycle=cycles[0], issue=self.issues[0], project=self.project
+        )
+        self.touch(CycleIssue.objects.filter(issue=self.issues[0]), 0)
+        token = encode_sync_token(self.start)
+
+        # Only the transfer itself is synced, not the queued activity
+        with mock.patch("plane.app.views.cycle.issue.issue_activity.delay"):
+            response = self.client.post(
+                f"/api/workspaces/{self.workspace.slug}/projects/{self.project.id}"
+                f"/cycles/{cycles[1].id}/cycle-issues/",
+                {"issues": [str(self.issues[0].id)]},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+
+        with mock.patch(
+            "plane.app.views.issue.base.sync_upper_bound",
+            return_value=timezone.now() + timedelta(minutes=1),
+        ):
+            data = self.sync(sync_token=token)
+
+        self.assertEqual(
+            [(str(issue["id"]), str(issue["cycle_id"])) for issue in data["issues"]],
+            [(str(self.issues[0].id), str(cycles[1].id))],
+        )
@@ -0,0 +1,68 @@
+# Python imports
+from datetime import timedelta
+
+# Django imports
+from django.db.models import CASCADE
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+# Module imports
+from plane.bgtasks.deletion_task import (
+    cascade_graph,
+    hard_delete_layers,
+    hard_delete_model,
+)
+from plane.db.models import (
+    APIToken,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    Project,
+    User,
+    Workspace,
+)
+
+
+class HardDeleteLayersTest(SimpleTestCase):
+    def test_referencing_models_are_deleted_first(self):
+        layers = hard_delete_layers()
+        position = {
+            model: index for index, layer in enumerate(layers) for model in layer
+        }
+
+        self.assertLess(position[IssueAssignee], position[Issue])
+        self.assertLess(position[Issue], position[Project])
+        self.assertLess(position[Project], position[Workspace])
+        for model, index in position.items():
+            for field in model._meta.concrete_fields:
+                if (
+                    field.related_model in position
+                    and field.related_model is not model
+                    and field.remote_field.on_delete is CASCADE
+                ):
+                    self.assertLess(index, position[field.related_model])
+
+
+class CascadeGraphTest(SimpleTestCase):
+    def test_relations_of_issue(self):
+        relations = cascade_graph(Issue)
+
+        self.assertIn((IssueAssignee, "issue", False), relations)
+        self.assertIn((IssueActivity, "issue", True), relations)
+        self.assertIn((Issue, "parent", False), relations)
+
+
+class HardDeleteModelTest(TestCase):
+    def test_expired_soft_deleted_token_is_removed(self):
+        user = User.objects.create(username="owner", email="owner@plane.so")
+        deleted_at = timezone.now() - timedelta(days=60)
+        expired = APIToken.objects.create(user=user)
+        recent = APIToken.objects.create(user=user)
+        APIToken.all_objects.filter(pk=expired.id).update(deleted_at=deleted_at)
+        APIToken.objects.filter(pk=recent.id).delete()
+
+        count = hard_delete_model(APIToken, timezone.now() - timedelta(days=30))
+
+        self.assertEqual(count, 1)
+        self.assertFalse(APIToken.all_objects.filter(pk=expired.id).exists())
+        self.assertTrue(APIToken.all_objects.filter(pk=recent.id).exists())
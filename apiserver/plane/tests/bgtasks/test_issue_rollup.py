@@ -0,0 +1,164 @@
+# Python imports
+from io import StringIO
+
+# Django imports
+from django.core.management import call_command
+from django.db.models import Count, Q
+from django.test import TestCase
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleRollup,
+    Issue,
+    IssueAssignee,
+    Module,
+    ModuleIssue,
+    ModuleRollup,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+from plane.utils.issue_rollup import (
+    STATE_GROUPS,
+    refresh_cycle_rollups,
+    refresh_issue_rollups,
+)
+
+
+class IssueRollupTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="owner", email="owner@plane.so")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        self.states = {
+            group: State.objects.create(
+                name=group.title(), group=group, project=self.project
+            )
+            for group in STATE_GROUPS
+        }
+        self.cycle = Cycle.objects.create(
+            name="Cycle", project=self.project, owned_by=self.user
+        )
+        self.module = Module.objects.create(name="Module", project=self.project)
+
+        self.issues = []
+        for group in ["backlog", "started", "started", "completed", "cancelled"]:
+            issue = Issue.objects.create(
+                name="Issue", project=self.project, state=self.states[group]
+            )
+            CycleIssue.objects.create(
+                cycle=self.cycle, issue=issue, project=self.project
+            )
+            ModuleIssue.objects.create(
+                module=self.module, issue=issue, project=self.project
+            )
+            self.issues.append(issue)
+        IssueAssignee.objects.create(
+            issue=self.issues[0], assignee=self.user, project=self.project
+        )
+
+    def live_counts(self, model, relation, pk):
+        """The counts the cycle and module lists aggregated on every request"""
+        issue = Q(
+            **{
+                f"{relation}__issue__archived_at__isnull": True,
+                f"{relation}__issue__is_draft": False,
+                f"{relation}__issue__deleted_at__isnull": True,
+                f"{relation}__deleted_at__isnull": True,
+            }
+        )
+        return model.objects.filter(pk=pk).aggregate(
+            total_issues=Count(f"{relation}__issue__id", distinct=True, filter=issue),
+            **{
+                f"{group}_issues": Count(
+                    f"{relation}__issue__id",
+                    distinct=True,
+                    filter=issue & Q(**{f"{relation}__issue__state__group": group}),
+                )
+                for group in STATE_GROUPS
+            },
+        )
+
+    def rollup_counts(self, rollup_model, field, pk):
+        return rollup_model.objects.filter(**{field: pk}).values(
+            "total_issues", *[f"{group}_issues" for group in STATE_GROUPS]
+        )[0]
+
+    def assert_rollups_match(self):
+        self.assertEqual(
+            self.rollup_counts(CycleRollup, "cycle_id", self.cycle.id),
+            self.live_counts(Cycle, "issue_cycle", self.cycle.id),
+        )
+        self.assertEqual(
+            self.rollup_counts(ModuleRollup, "module_id", self.module.id),
+            self.live_counts(Module, "issue_module", self.module.id),
+        )
+
+    def test_refresh_rollups(self):
+        refresh_issue_rollups([issue.id for issue in self.issues])
+
+        self.assert_rollups_match()
+        rollup = CycleRollup.objects.get(cycle=self.cycle)
+        self.assertEqual(rollup.total_issues, 5)
+        self.assertEqual(rollup.started_issues, 2)
+        self.assertEqual(rollup.assignee_ids, [self.user.id])
+
+    def test_state_change(self):
+        refresh_issue_rollups([self.issues[0].id])
+        Issue.objects.filter(pk=self.issues[0].id).update(
+            state=self.states["completed"]
+        )
+        refresh_issue_rollups([self.issues[0].id])
+
+        self.assert_rollups_match()
+        self.assertEqual(CycleRollup.objects.get(cycle=self.cycle).completed_issues, 2)
+
+    def test_archive_and_delete(self):
+        refresh_issue_rollups([issue.id for issue in self.issues])
+        Issue.objects.filter(pk=self.issues[3].id).update(
+            archived_at=timezone.now().date()
+        )
+        Issue.objects.filter(pk=self.issues[0].id).delete()
+        refresh_issue_rollups([self.issues[3].id, self.issues[0].id])
+
+        self.assert_rollups_match()
+        rollup = CycleRollup.objects.get(cycle=self.cycle)
+        self.assertEqual(rollup.total_issues, 3)
+        self.assertEqual(rollup.assignee_ids, [])
+
+    def test_removed_relation(self):
+        refresh_cycle_rollups([self.cycle.id])
+        CycleIssue.objects.filter(issue=self.issues[1]).delete()
+        refresh_cycle_rollups([self.cycle.id])
+
+        self.assert_rollups_match()
+        self.assertEqual(CycleRollup.objects.get(cycle=self.cycle).total_issues, 4)
+
+    def test_rebuild_issue_rollups(self):
+        call_command("rebuild_issue_rollups", "--missing", stdout=StringIO())
+
+        self.assert_rollups_match()
+
+        # Existing rollups are only rebuilt without --missing
+        Issue.objects.filter(pk=self.issues[1].id).update(
+            state=self.states["completed"]
+        )
+        call_command("rebuild_issue_rollups", "--missing", stdout=StringIO())
+        self.assertEqual(CycleRollup.objects.get(cycle=self.cycle).completed_issues, 1)
+
+        call_command(
+            "rebuild_issue_rollups",
+            "--project",
+            str(self.project.id),
+            stdout=StringIO(),
+        )
+        self.assert_rollups_match()
+        self.assertEqual(CycleRollup.objects.get(cycle=self.cycle).completed_issues, 2)
@@ -0,0 +1,116 @@
+# Python imports
+import json
+import uuid
+
+# Django imports
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.bgtasks.notification_task import notifications
+from plane.db.models import (
+    EmailNotificationLog,
+    Issue,
+    IssueSubscriber,
+    Notification,
+    Project,
+    ProjectMember,
+    State,
+    User,
+    UserNotificationPreference,
+    Workspace,
+)
+
+
+class NotificationFanOutQueryCountTest(TestCase):
+    def setUp(self):
+        self.actor = self.create_user("actor")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.actor
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        ProjectMember.objects.create(
+            project=self.project, workspace=self.workspace, member=self.actor
+        )
+        self.backlog = State.objects.create(
+            name="Backlog", group="backlog", project=self.project
+        )
+        self.done = State.objects.create(
+            name="Done", group="completed", project=self.project
+        )
+
+    def create_user(self, username):
+        return User.objects.create(username=username, email=f"{username}@plane.so")
+
+    def create_issue(self, subscriber_count):
+        issue = Issue.objects.create(
+            name="Issue", project=self.project, state=self.backlog
+        )
+        for index in range(subscriber_count):
+            user = self.create_user(f"{issue.id.hex[:8]}-{index}")
+            UserNotificationPreference.objects.filter(user=user).update(
+                state_change=True, property_change=True
+            )
+            ProjectMember.objects.create(
+                project=self.project, workspace=self.workspace, member=user
+            )
+            IssueSubscriber.objects.create(
+                project=self.project,
+                workspace=self.workspace,
+                issue=issue,
+                subscriber=user,
+            )
+        return issue
+
+    def activities(self, issue):
+        return json.dumps(
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "verb": "updated",
+                    "field": field,
+                    "actor_id": str(self.actor.id),
+                    "old_value": "Backlog",
+                    "new_value": "Done",
+                    "old_identifier": str(self.backlog.id),
+                    "new_identifier": str(self.done.id),
+                    "issue_comment": None,
+                    "comment": f"updated the {field}",
+                    "issue_detail": {"id": str(issue.id)},
+                    "created_at": "2024-01-01 00:00:00",
+                }
+                for field in ["state", "priority"]
+            ]
+        )
+
+    def send_notifications(self, issue):
+        with CaptureQueriesContext(connection) as context:
+            notifications(
+                type="issue.activity.updated",
+                issue_id=str(issue.id),
+                project_id=str(self.project.id),
+                actor_id=str(self.actor.id),
+                subscriber=False,
+                issue_activities_created=self.activities(issue),
+                requested_data=json.dumps({"state_id": str(self.done.id)}),
+                current_instance=json.dumps({"state_id": str(self.backlog.id)}),
+            )
+        return len(context.captured_queries)
+
+    def test_query_count_does_not_grow_with_subscribers(self):
+        single = self.create_issue(subscriber_count=1)
+        many = self.create_issue(subscriber_count=10)
+
+        single_queries = self.send_notifications(single)
+        many_queries = self.send_notifications(many)
+
+        self.assertEqual(single_queries, many_queries)
+        self.assertEqual(
+            Notification.objects.filter(entity_identifier=many.id).count(), 20
+        )
+        self.assertEqual(
+            EmailNotificationLog.objects.filter(entity_identifier=many.id).count(), 20
+        )
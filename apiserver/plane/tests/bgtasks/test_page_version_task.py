@@ -0,0 +1,58 @@
+# Python imports
+import uuid
+import zlib
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.db.models import PageVersion
+from plane.utils.page_version import (
+    BINARY_DELIMITER,
+    HTML_DELIMITER,
+    apply_delta,
+    compress,
+    make_delta,
+    page_version_description,
+)
+
+
+class PageVersionDeltaTest(SimpleTestCase):
+    def test_delta_rebuilds_the_version(self):
+        base = b"".join(b"<p>paragraph %d</p>" % index for index in range(1000))
+        target = b"<h1>title</h1>" + base[:5000] + base[5100:] + b"<p>end</p>"
+
+        delta = make_delta(base, target, HTML_DELIMITER)
+
+        self.assertEqual(apply_delta(base, delta), target)
+        self.assertLess(len(zlib.compress(delta)) * 10, len(zlib.compress(target)))
+
+    def test_binary_delta_rebuilds_the_version(self):
+        base = bytes(range(256)) * 20
+        for target in [b"", base[::-1], base[:100] + b"\x00\x00" + base[300:]]:
+            delta = make_delta(base, target, BINARY_DELIMITER)
+            self.assertEqual(apply_delta(base, delta), target)
+
+    def test_description_of_a_delta_version(self):
+        snapshot = PageVersion(
+            id=uuid.uuid4(),
+            html_data=compress(b"<p>one</p>"),
+            binary_data=compress(b"\x01\x00\x02"),
+        )
+        version = PageVersion(
+            base=snapshot,
+            html_data=compress(
+                make_delta(b"<p>one</p>", b"<p>one</p><p>two</p>", HTML_DELIMITER)
+            ),
+            binary_data=compress(
+                make_delta(b"\x01\x00\x02", b"\x01\x00\x03", BINARY_DELIMITER)
+            ),
+        )
+
+        self.assertEqual(
+            page_version_description(version), ("<p>one</p><p>two</p>", b"\x01\x00\x03")
+        )
+        self.assertEqual(
+            page_version_description(PageVersion(description_html="<p>old</p>")),
+            ("<p>old</p>", None),
+        )
@@ -0,0 +1,246 @@
+# Python imports
+import hashlib
+import hmac
+import json
+import socket
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Third party imports
+from redis.exceptions import ConnectionError
+
+# Module imports
+from plane.bgtasks.webhook_task import (
+    WEBHOOK_MAX_DEFERRALS,
+    WEBHOOK_MAX_RETRIES,
+    WebhookCircuit,
+    deliver_webhooks,
+    send_webhook,
+    webhook_payload,
+)
+from plane.db.models import Webhook, WebhookLog
+
+
+class ReceiverHandler(BaseHTTPRequestHandler):
+    """Stub receiver, answers /ok, fails on /fail and stalls on /slow"""
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append((self.path, dict(self.headers), body))
+        if self.path == "/slow":
+            time.sleep(1)
+        self.send_response(500 if self.path == "/fail" else 200)
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class Circuit:
+    def __init__(self):
+        self.released = []
+
+    def release(self, success):
+        self.released.append(success)
+
+
+class ReceiverTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ReceiverHandler)
+        cls.server.received = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.received.clear()
+
+    def webhook(self, url):
+        return Webhook(
+            id=uuid.uuid4(), workspace_id=uuid.uuid4(), url=url, secret_key="secret"
+        )
+
+    def unreachable_url(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+
+class WebhookDeliveryTest(ReceiverTestCase):
+    def deliver(self, webhook):
+        shared = json.dumps({"data": {"id": "1"}, "activity": None})
+        payload = webhook_payload(webhook, "issue", "update", shared)
+        circuit = Circuit()
+        logs, failed = send_webhook(webhook, circuit, "issue", "update", [payload], 0)
+        return payload, logs[0], failed, circuit
+
+    def test_payload_is_signed_and_shared(self):
+        webhook = self.webhook(f"{self.base_url}/ok")
+        payload, log, failed, circuit = self.deliver(webhook)
+
+        self.assertFalse(failed)
+        self.assertEqual(log.response_status, "200")
+        self.assertEqual(circuit.released, [True])
+
+        _, headers, body = self.server.received[0]
+        self.assertEqual(body.decode(), payload)
+        self.assertEqual(
+            headers["X-Plane-Signature"],
+            hmac.new(b"secret", body, hashlib.sha256).hexdigest(),
+        )
+        self.assertEqual(
+            json.loads(body),
+            {
+                "event": "issue",
+                "action": "update",
+                "webhook_id": str(webhook.id),
+                "workspace_id": str(webhook.workspace_id),
+                "data": {"id": "1"},
+                "activity": None,
+            },
+        )
+
+    def test_error_response_is_logged(self):
+        _, log, failed, circuit = self.deliver(self.webhook(f"{self.base_url}/fail"))
+
+        self.assertFalse(failed)
+        self.assertEqual(log.response_status, "500")
+        self.assertEqual(circuit.released, [True])
+
+    def test_unreachable_receiver_fails(self):
+        _, log, failed, circuit = self.deliver(self.webhook(self.unreachable_url()))
+
+        self.assertTrue(failed)
+        self.assertEqual(log.response_status, 500)
+        self.assertEqual(circuit.released, [False])
+
+    def test_slow_receiver_is_abandoned(self):
+        started = time.monotonic()
+        with mock.patch("plane.bgtasks.webhook_task.WEBHOOK_TIMEOUT", (1, 0.2)):
+            _, log, failed, circuit = self.deliver(
+                self.webhook(f"{self.base_url}/slow")
+            )
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertTrue(failed)
+        self.assertEqual(circuit.released, [False])
+
+    def test_payloads_are_sent_in_order_over_one_slot(self):
+        webhook = self.webhook(f"{self.base_url}/ok")
+        circuit = Circuit()
+        logs, failed = send_webhook(
+            webhook, circuit, "issue", "update", ['{"field": 1}', '{"field": 2}'], 0
+        )
+
+        self.assertFalse(failed)
+        self.assertEqual(len(logs), 2)
+        self.assertEqual(
+            [body for _, _, body in self.server.received],
+            [b'{"field": 1}', b'{"field": 2}'],
+        )
+        self.assertEqual(circuit.released, [True])
+
+
+class DeliverWebhooksTest(ReceiverTestCase):
+    def deliver(self, webhook, **kwargs):
+        webhooks = mock.MagicMock()
+        webhooks.__iter__.return_value = iter([webhook])
+        with (
+            mock.patch.object(Webhook, "objects") as webhook_objects,
+            mock.patch.object(WebhookLog, "objects"),
+            mock.patch.object(deliver_webhooks, "apply_async") as apply_async,
+            mock.patch(
+                "plane.bgtasks.webhook_task.send_webhook_deactivation_email"
+            ) as deactivation_email,
+        ):
+            webhook_objects.filter.return_value = webhooks
+            deliver_webhooks(
+                webhook_ids=[str(webhook.id)],
+                slug="plane",
+                event="issue",
+                event_data={"id": "1"},
+                action="PATCH",
+                current_site="http://plane.test",
+                **{"activity": None, **kwargs},
+            )
+        return apply_async, webhooks, deactivation_email
+
+    def test_delivered_when_redis_is_unavailable(self):
+        with mock.patch(
+            "plane.bgtasks.webhook_task.redis_client", side_effect=ConnectionError
+        ):
+            apply_async, _, _ = self.deliver(self.webhook(f"{self.base_url}/ok"))
+
+        self.assertEqual(len(self.server.received), 1)
+        apply_async.assert_not_called()
+
+    def test_busy_host_is_deferred(self):
+        with mock.patch.object(WebhookCircuit, "acquire", return_value=30):
+            apply_async, _, _ = self.deliver(self.webhook(f"{self.base_url}/ok"))
+
+        self.assertEqual(self.server.received, [])
+        kwargs = apply_async.call_args.kwargs
+        self.assertEqual(kwargs["countdown"], 30)
+        self.assertEqual(kwargs["kwargs"]["attempt"], 0)
+        self.assertEqual(kwargs["kwargs"]["deferrals"], 1)
+
+    def test_deferrals_count_as_an_attempt(self):
+        with mock.patch.object(WebhookCircuit, "acquire", return_value=30):
+            apply_async, _, _ = self.deliver(
+                self.webhook(f"{self.base_url}/ok"), deferrals=WEBHOOK_MAX_DEFERRALS
+            )
+
+        kwargs = apply_async.call_args.kwargs
+        self.assertEqual(kwargs["kwargs"]["attempt"], 1)
+        self.assertEqual(kwargs["kwargs"]["deferrals"], 0)
+
+    def test_failed_delivery_is_retried_then_deactivated(self):
+        webhook = self.webhook(self.unreachable_url())
+        with mock.patch.object(WebhookCircuit, "acquire", return_value=0):
+            apply_async, _, _ = self.deliver(webhook, attempt=1)
+            kwargs = apply_async.call_args.kwargs
+            self.assertEqual(kwargs["kwargs"]["attempt"], 2)
+            self.assertEqual(kwargs["kwargs"]["webhook_ids"], [str(webhook.id)])
+
+            apply_async, webhooks, deactivation_email = self.deliver(
+                webhook, attempt=WEBHOOK_MAX_RETRIES
+            )
+
+        apply_async.assert_not_called()
+        deactivation_email.assert_called_once()
+
+    def test_activities_are_retried_from_the_first_failure(self):
+        webhook = self.webhook(f"{self.base_url}/ok")
+        activities = [{"field": "name"}, {"field": "priority"}, {"field": "state"}]
+        with (
+            mock.patch.object(WebhookCircuit, "acquire", return_value=0),
+            mock.patch(
+                "plane.bgtasks.webhook_task.post_webhook",
+                side_effect=[
+                    (WebhookLog(response_body="ok"), False),
+                    (WebhookLog(response_body="timeout"), True),
+                ],
+            ) as post_webhook,
+        ):
+            apply_async, _, _ = self.deliver(webhook, activity=activities)
+
+        self.assertEqual(post_webhook.call_count, 2)
+        self.assertEqual(apply_async.call_count, 1)
+        kwargs = apply_async.call_args.kwargs["kwargs"]
+        self.assertEqual(kwargs["activity"], activities[1:])
+        self.assertEqual(kwargs["attempt"], 1)
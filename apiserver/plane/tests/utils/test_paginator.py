@@ -0,0 +1,306 @@
+# Python imports
+import math
+from collections import defaultdict
+from datetime import timedelta
+
+# Django imports
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
+from django.test import TestCase
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Issue, IssueLabel, Label, Project, State, User, Workspace
+from plane.utils.grouper import issue_queryset_grouper
+from plane.utils.paginator import (
+    Cursor,
+    GroupedOffsetPaginator,
+    OffsetPaginator,
+    SeekCursor,
+    SubGroupedOffsetPaginator,
+)
+
+COUNT_FILTER = Q(
+    Q(issue_intake__status=1)
+    | Q(issue_intake__status=-1)
+    | Q(issue_intake__status=2)
+    | Q(issue_intake__isnull=True),
+    archived_at__isnull=True,
+    is_draft=False,
+)
+
+
+def legacy_page(queryset, group_by, count_filter, limit, page):
+    """The hits, next cursor, max hits and totals of an offset page as the
+    paginator computed them with separate queries"""
+    offset = page * limit
+    stop = offset + limit + 1
+    windowed = queryset.annotate(
+        row_number=Window(
+            expression=RowNumber(),
+            partition_by=[F(group_by)],
+            order_by=(F("created_at").desc(nulls_last=True), F("created_at").desc()),
+        )
+    )
+    rows = windowed.filter(row_number__gt=offset, row_number__lt=stop)
+    counts = (
+        queryset.values_list(group_by)
+        .annotate(count=Count("id", filter=count_filter, distinct=True))
+        .order_by()
+    )
+    totals = defaultdict(int)
+    for group, count in counts:
+        totals[str(group)] += 1 if count == 0 else count
+    return {
+        "hits": windowed.count(),
+        "has_next": windowed.filter(row_number__gte=stop).exists(),
+        "max_hits": (
+            math.ceil(max(count for _, count in counts) / limit) if rows.exists() else 0
+        ),
+        "totals": dict(totals),
+        "rows": {
+            (str(id), str(group)) for id, group in rows.values_list("id", group_by)
+        },
+    }
+
+
+class GroupedOffsetPaginatorTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="owner", email="owner@plane.so")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        self.states = [
+            State.objects.create(name=group, group=group, project=self.project)
+            for group in ["backlog", "started", "completed"]
+        ]
+        self.labels = [
+            Label.objects.create(name=name, project=self.project)
+            for name in ["Bug", "Feature"]
+        ]
+
+        backlog, started, _ = self.states
+        for index, state in enumerate([backlog] * 4 + [started] * 2):
+            issue = Issue.objects.create(
+                name="Issue", project=self.project, state=state
+            )
+            # Two labels join two rows per issue into the aggregated queryset
+            for label in self.labels[: index % 3]:
+                IssueLabel.objects.create(
+                    issue=issue, label=label, project=self.project
+                )
+        # Archived issues are listed but left out of the counts
+        Issue.objects.filter(pk=issue.id).update(archived_at=timezone.now().date())
+
+    def paginate(self, queryset, group_by, group_by_fields, count_filter, page):
+        paginator = GroupedOffsetPaginator(
+            queryset=queryset,
+            order_by="-created_at",
+            group_by_field_name=group_by,
+            group_by_fields=group_by_fields,
+            count_filter=count_filter,
+        )
+        cursor_result = paginator.get_result(limit=2, cursor=Cursor(2, page, False))
+        results = paginator.process_results(
+            cursor_result.results.values("id", group_by)
+        )
+        return cursor_result, results
+
+    def assert_matches_legacy(self, queryset, group_by, group_by_fields, count_filter):
+        for page in range(3):
+            with self.subTest(page=page):
+                expected = legacy_page(queryset, group_by, count_filter, 2, page)
+                cursor_result, results = self.paginate(
+                    queryset, group_by, group_by_fields, count_filter, page
+                )
+
+                self.assertEqual(cursor_result.hits, expected["hits"])
+                self.assertEqual(cursor_result.max_hits, expected["max_hits"])
+                self.assertEqual(cursor_result.next.has_results, expected["has_next"])
+                self.assertEqual(
+                    {
+                        (str(result["id"]), group)
+                        for group, value in results.items()
+                        for result in value["results"]
+                    },
+                    expected["rows"],
+                )
+                for group, value in results.items():
+                    self.assertEqual(
+                        value["total_results"], expected["totals"].get(group, 0)
+                    )
+
+    def test_matches_legacy_counts(self):
+        self.assert_matches_legacy(
+            Issue.objects.filter(project=self.project),
+            "state_id",
+            [state.id for state in self.states],
+            None,
+        )
+
+    def test_matches_legacy_counts_with_count_filter(self):
+        self.assert_matches_legacy(
+            Issue.objects.filter(project=self.project),
+            "state_id",
+            [state.id for state in self.states],
+            COUNT_FILTER,
+        )
+
+    def test_matches_legacy_counts_of_aggregated_queryset(self):
+        # The counted rows are folded per issue before they are summed
+        queryset = issue_queryset_grouper(
+            queryset=Issue.objects.filter(project=self.project),
+            group_by="state_id",
+            sub_group_by=None,
+        )
+        self.assert_matches_legacy(
+            queryset, "state_id", [state.id for state in self.states], COUNT_FILTER
+        )
+
+    def test_matches_legacy_counts_of_many_to_many_groups(self):
+        queryset = issue_queryset_grouper(
+            queryset=Issue.objects.filter(project=self.project),
+            group_by="labels__id",
+            sub_group_by=None,
+        )
+        self.assert_matches_legacy(
+            queryset,
+            "labels__id",
+            [label.id for label in self.labels] + ["None"],
+            COUNT_FILTER,
+        )
+
+    def test_seek_max_hits_of_sub_groups(self):
+        # Two issues of every state and priority, four of the backlog
+        Issue.objects.filter(project=self.project).update(priority="high")
+        Issue.objects.filter(
+            pk__in=Issue.objects.filter(state=self.states[0]).values("id")[:2]
+        ).update(priority="low")
+
+        paginator = SubGroupedOffsetPaginator(
+            queryset=Issue.objects.filter(project=self.project),
+            order_by="-created_at",
+            group_by_field_name="state_id",
+            sub_group_by_field_name="priority",
+            group_by_fields=[state.id for state in self.states],
+            sub_group_by_fields=["high", "low"],
+            count_filter=None,
+        )
+        cursor_result = paginator.get_result(limit=2, cursor=SeekCursor(2))
+
+        self.assertEqual(cursor_result.hits, 6)
+        self.assertEqual(cursor_result.max_hits, 1)
+        self.assertFalse(cursor_result.next.has_results)
+
+
+class SeekPaginationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(username="owner", email="owner@plane.so")
+        self.workspace = Workspace.objects.create(
+            name="Plane", slug="plane", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=self.workspace
+        )
+        self.states = [
+            State.objects.create(name=group, group=group, project=self.project)
+            for group in ["backlog", "started"]
+        ]
+
+        # Repeated and missing target dates exercise the ties and the nulls
+        today = timezone.now().date()
+        target_dates = [today, None, today + timedelta(days=1), today, None]
+        target_dates += [today - timedelta(days=1), None, today, None]
+        for index, target_date in enumerate(target_dates):
+            Issue.objects.create(
+                name="Issue",
+                project=self.project,
+                state=self.states[index % 2],
+                target_date=target_date,
+            )
+        self.queryset = Issue.objects.filter(project=self.project)
+
+    def paginator(self, order_by, grouped):
+        if not grouped:
+            return OffsetPaginator(queryset=self.queryset, order_by=order_by)
+        return GroupedOffsetPaginator(
+            queryset=self.queryset,
+            order_by=order_by,
+            group_by_field_name="state_id",
+            group_by_fields=[state.id for state in self.states],
+            count_filter=None,
+        )
+
+    def rows(self, results, grouped):
+        """Ids of the results by group, in page order"""
+        rows = defaultdict(list)
+        for issue in results:
+            rows[issue.state_id if grouped else None].append(issue.id)
+        return rows
+
+    def offset_rows(self, order_by, grouped):
+        rows = defaultdict(list)
+        for page in range(self.queryset.count()):
+            cursor_result = self.paginator(order_by, grouped).get_result(
+                limit=2, cursor=Cursor(2, page, False)
+            )
+            for group, ids in self.rows(cursor_result.results, grouped).items():
+                rows[group].extend(ids)
+        return dict(rows)
+
+    def seek_rows(self, order_by, grouped):
+        rows = defaultdict(list)
+        cursor = SeekCursor(2)
+        while True:
+            cursor_result = self.paginator(order_by, grouped).get_result(
+                limit=2, cursor=cursor
+            )
+            for group, ids in self.rows(cursor_result.results, grouped).items():
+                rows[group].extend(ids)
+            if not cursor_result.next.has_results:
+                return dict(rows)
+            # Cursors reach the client as opaque strings
+            cursor = SeekCursor.from_string(str(cursor_result.next))
+
+    def assert_seek_matches_offset(self, order_by, grouped):
+        seek_rows = self.seek_rows(order_by, grouped)
+
+        self.assertEqual(seek_rows, self.offset_rows(order_by, grouped))
+        ids = [pk for group_ids in seek_rows.values() for pk in group_ids]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(set(ids), set(self.queryset.values_list("id", flat=True)))
+
+    def test_ungrouped_pages(self):
+        for order_by in ["-created_at", "target_date", "-target_date"]:
+            with self.subTest(order_by=order_by):
+                self.assert_seek_matches_offset(order_by, grouped=False)
+
+    def test_grouped_pages(self):
+        for order_by in ["-created_at", "target_date", "-target_date"]:
+            with self.subTest(order_by=order_by):
+                self.assert_seek_matches_offset(order_by, grouped=True)
+
+    def test_pages_on_tied_timestamps(self):
+        # Rows sharing the order key and created_at are told apart by the id,
+        # rows without a target date come last in both directions
+        Issue.objects.filter(project=self.project).update(created_at=timezone.now())
+        issues = list(self.queryset.values("id", "target_date"))
+        for order_by, desc in [("target_date", False), ("-target_date", True)]:
+            with self.subTest(order_by=order_by):
+                # Ties on the order key go by the largest id first
+                dated = [issue for issue in issues if issue["target_date"]]
+                dated.sort(key=lambda issue: issue["id"], reverse=True)
+                dated.sort(key=lambda issue: issue["target_date"], reverse=desc)
+                undated = sorted(
+                    (issue for issue in issues if not issue["target_date"]),
+                    key=lambda issue: issue["id"],
+                    reverse=True,
+                )
+
+                self.assertEqual(
+                    self.seek_rows(order_by, grouped=False),
+                    {None: [issue["id"] for issue in dated + undated]},
+                )
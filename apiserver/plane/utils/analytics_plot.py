@@ -4,7 +4,7 @@ from itertools import groupby
 
 # Django import
 from django.db import models
-from django.db.models import Case, CharField, Count, F, Sum, Value, When, FloatField
+from django.db.models import Case, CharField, Count, F, FloatField, Q, Sum, Value, When
 from django.db.models.functions import (
     Coalesce,
     Concat,
@@ -16,7 +16,7 @@ from django.db.models.functions import (
 from django.utils import timezone
 
 # Module imports
-from plane.db.models import Issue, Project
+from plane.db.models import Issue
 
 
 def annotate_with_monthly_dimension(queryset, field_name, attribute):
@@ -104,38 +104,13 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
 def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_id=None):
     # Total Issues in Cycle or Module
     total_issues = queryset.total_issues
-    # check whether the estimate is a point or not
-    estimate_type = Project.objects.filter(
-        workspace__slug=slug,
-        pk=project_id,
-        estimate__isnull=False,
-        estimate__type="points",
-    ).exists()
-    if estimate_type and plot_type == "points" and cycle_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_cycle__cycle_id=cycle_id,
-            issue_cycle__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
-
-    if estimate_type and plot_type == "points" and module_id:
-        issue_estimates = Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_module__module_id=module_id,
-            issue_module__deleted_at__isnull=True,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
+
+    issues = Issue.issue_objects.filter(workspace__slug=slug, project_id=project_id)
 
     if cycle_id:
+        issues = issues.filter(
+            issue_cycle__cycle_id=cycle_id, issue_cycle__deleted_at__isnull=True
+        )
         if queryset.end_date and queryset.start_date:
             # Get all dates between the two dates
             date_range = [
@@ -145,102 +120,59 @@ def burndown_plot(queryset, slug, project_id, plot_type, cycle_id=None, module_i
         else:
             date_range = []
 
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    issue_cycle__deleted_at__isnull=True,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
-
     if module_id:
+        issues = issues.filter(
+            issue_module__module_id=module_id, issue_module__deleted_at__isnull=True
+        )
         # Get all dates between the two dates
         date_range = [
             (queryset.start_date + timedelta(days=x))
             for x in range((queryset.target_date - queryset.start_date).days + 1)
         ]
 
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    issue_module__deleted_at__isnull=True,
+    chart_data = {str(date): 0 for date in date_range}
+
+    # Issues and estimate points completed per day in a single grouped query,
+    # the issues that are not completed are grouped under no date
+    distribution = (
+        issues.annotate(date=TruncDate("completed_at"))
+        .values("date")
+        .annotate(
+            total_completed=Count("id"),
+            total_points=Sum(
+                Cast("estimate_point__value", FloatField()),
+                filter=Q(estimate_point__estimate__type="points"),
+            ),
+        )
+        .order_by("date")
+    )
+
+    completed = []
+    total_estimate_points = 0
+    for item in distribution:
+        total_points = item["total_points"] or 0
+        total_estimate_points += total_points
+        if item["date"] is not None:
+            completed.append(
+                (
+                    item["date"],
+                    total_points if plot_type == "points" else item["total_completed"],
                 )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
             )
 
-    if plot_type == "points":
-        for date in date_range:
-            cumulative_pending_issues = total_estimate_points
-            total_completed = 0
-            total_completed = sum(
-                float(item["estimate_point__value"])
-                for item in completed_issues_estimate_point_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
-    else:
-        for date in date_range:
-            cumulative_pending_issues = total_issues
-            total_completed = 0
-            total_completed = sum(
-                item["total_completed"]
-                for item in completed_issues_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
+    total = total_estimate_points if plot_type == "points" else total_issues
+
+    # Walk the dates and the sorted completions once for the running total
+    index = 0
+    total_completed = 0
+    today = timezone.now().date()
+    for date in date_range:
+        while index < len(completed) and completed[index][0] <= date:
+            total_completed += completed[index][1]
+            index += 1
+        if date > today:
+            chart_data[str(date)] = None
+        else:
+            chart_data[str(date)] = total - total_completed
 
     return chart_data
@@ -1,5 +1,8 @@
 # Python imports
+import hashlib
+import uuid
 from functools import wraps
+from urllib.parse import urlencode
 
 # Django imports
 from django.conf import settings
@@ -8,6 +11,15 @@ from django.core.cache import cache
 # Third party imports
 from rest_framework.response import Response
 
+# Generation keys outlive the entries they version, a missing generation is
+# re-created with a fresh value so stale entries can never be resurrected
+CACHE_TAG_PREFIX = "cache_tag"
+CACHE_TAG_TIMEOUT = 60 * 60 * 24 * 7
+
+PUBLIC_BOARD_CACHE_TIMEOUT = 60 * 60
+# Bulk writes skip the signals invalidating the group values, they expire soon
+GROUP_VALUES_CACHE_TIMEOUT = 60 * 10
+
 
 def generate_cache_key(custom_path, auth_header=None):
     """Generate a cache key with the given params"""
@@ -18,6 +30,58 @@ def generate_cache_key(custom_path, auth_header=None):
     return key_data
 
 
+def normalize_cache_path(path):
+    """Strip the query string, the api prefix and the slashes from a path"""
+    path = path.split("?")[0].strip("/")
+    return path[len("api/") :] if path.startswith("api/") else path
+
+
+def path_cache_tag(path, user_id=None):
+    """Tag shared by every cached variant of a path, optionally for one user"""
+    tag = f"path:{normalize_cache_path(path)}"
+    return f"{tag}:{user_id}" if user_id else tag
+
+
+def get_cache_tags(path, user_id=None, slug=None, project_id=None):
+    """Return the tags an entry cached for the given request is registered under"""
+    tags = [path_cache_tag(path)]
+    if user_id:
+        tags.extend([path_cache_tag(path, user_id), f"user:{user_id}"])
+    if slug:
+        tags.append(f"workspace:{slug}")
+    if project_id:
+        tags.append(f"project:{project_id}")
+    return tags
+
+
+def get_tag_generations(tags):
+    """Fetch the current generation of every tag in a single round trip"""
+    tag_keys = [f"{CACHE_TAG_PREFIX}:{tag}" for tag in tags]
+    generations = cache.get_many(tag_keys)
+    for tag_key in tag_keys:
+        if tag_key not in generations:
+            generation = uuid.uuid4().hex
+            # Another worker may have created the generation in the meantime
+            if not cache.add(tag_key, generation, CACHE_TAG_TIMEOUT):
+                generation = cache.get(tag_key)
+            generations[tag_key] = generation
+    return [str(generations[tag_key]) for tag_key in tag_keys]
+
+
+def bump_cache_tags(tags):
+    """Invalidate every entry registered under the tags in O(tags)"""
+    cache.set_many(
+        {f"{CACHE_TAG_PREFIX}:{tag}": uuid.uuid4().hex for tag in tags},
+        CACHE_TAG_TIMEOUT,
+    )
+
+
+def versioned_cache_key(key, tags):
+    """Suffix the cache key with the generations of its tags"""
+    generations = ":".join(get_tag_generations(tags))
+    return f"{key}:{hashlib.md5(generations.encode()).hexdigest()}"
+
+
 def cache_response(timeout=60 * 60, path=None, user=True):
     """decorator to create cache per user"""
 
@@ -33,7 +97,16 @@ def cache_response(timeout=60 * 60, path=None, user=True):
                 else None
             )
             custom_path = path if path is not None else request.get_full_path()
-            key = generate_cache_key(custom_path, auth_header)
+            # Register the entry under its path, user, workspace and project
+            tags = get_cache_tags(
+                path=custom_path,
+                user_id=auth_header,
+                slug=kwargs.get("slug"),
+                project_id=kwargs.get("project_id"),
+            )
+            key = versioned_cache_key(
+                generate_cache_key(custom_path, auth_header), tags
+            )
             cached_result = cache.get(key)
 
             if cached_result is not None:
@@ -71,12 +144,24 @@ def invalidate_cache_directly(
         if user
         else None
     )
-    key = generate_cache_key(custom_path, auth_header)
 
-    if multiple:
-        cache.delete_many(keys=cache.keys(f"*{key}*"))
-    else:
-        cache.delete(key)
+    # Bumping the path generation drops every query string variant of the path
+    # (and every user when the cache is not user scoped) without scanning keys,
+    # so `multiple` no longer needs a separate code path
+    bump_cache_tags([path_cache_tag(custom_path, auth_header)])
+
+
+def invalidate_cache_tags(workspace=None, project=None, user=None):
+    """Invalidate every cached response of a workspace, project or user"""
+    tags = []
+    if workspace:
+        tags.append(f"workspace:{workspace}")
+    if project:
+        tags.append(f"project:{project}")
+    if user:
+        tags.append(f"user:{user}")
+    if tags:
+        bump_cache_tags(tags)
 
 
 def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
@@ -96,3 +181,49 @@ def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
         return _wrapped_view
 
     return decorator
+
+
+def public_board_cache_tag(project_id):
+    """Tag of the cached responses of the published board of a project"""
+    return f"public_board:{project_id}"
+
+
+def public_board_cache_key(anchor, query_params):
+    """Cache key of a published board query, the same for any order of the
+    params and of the comma separated values of a filter"""
+    params = sorted(
+        (key, ",".join(sorted(value.split(","))))
+        for key in query_params
+        for value in query_params.getlist(key)
+    )
+    digest = hashlib.md5(urlencode(params).encode()).hexdigest()
+    return f"public_board:{anchor}:{digest}"
+
+
+def invalidate_public_board_cache(project_ids):
+    """Invalidate the cached responses of the published boards of the projects"""
+    bump_cache_tags([public_board_cache_tag(project_id) for project_id in project_ids])
+
+
+def group_values_cache_tag(workspace_id=None, project_id=None):
+    """Tag of the cached group values of a workspace or of one of its projects"""
+    if project_id:
+        return f"group_values:project:{project_id}"
+    return f"group_values:workspace:{workspace_id}"
+
+
+def workspace_id_cache_key(slug):
+    """Key of the workspace id of a slug, the group values of a workspace are
+    tagged by its id so signals can invalidate them without a query"""
+    return f"workspace_id:{slug}"
+
+
+def invalidate_group_values_cache(workspace_id, *project_ids):
+    """Invalidate the cached group values of a workspace and of its projects"""
+    tags = [group_values_cache_tag(workspace_id=workspace_id)]
+    tags.extend(
+        group_values_cache_tag(project_id=project_id)
+        for project_id in project_ids
+        if project_id
+    )
+    bump_cache_tags(tags)
@@ -1,5 +1,6 @@
 # Django imports
 from django.contrib.postgres.aggregates import ArrayAgg
+from django.core.cache import cache
 from django.contrib.postgres.fields import ArrayField
 from django.db.models import Q, UUIDField, Value
 from django.db.models.functions import Coalesce
@@ -13,8 +14,27 @@ from plane.db.models import (
     Project,
     ProjectMember,
     State,
+    Workspace,
     WorkspaceMember,
 )
+from plane.utils.cache import (
+    CACHE_TAG_TIMEOUT,
+    GROUP_VALUES_CACHE_TIMEOUT,
+    group_values_cache_tag,
+    versioned_cache_key,
+    workspace_id_cache_key,
+)
+
+# Group values read from the workspace or project alone, the others depend on
+# the filters of the request
+CACHED_GROUP_FIELDS = [
+    "state_id",
+    "labels__id",
+    "assignees__id",
+    "issue_module__module_id",
+    "cycle_id",
+    "project_id",
+]
 
 
 def issue_queryset_grouper(queryset, group_by, sub_group_by):
@@ -101,7 +121,41 @@ def issue_on_results(issues, group_by, sub_group_by):
     return issues.values(*required_fields)
 
 
+def workspace_id_from_slug(slug):
+    """Id of the workspace of a slug, cached until a workspace is saved with
+    the slug"""
+    key = workspace_id_cache_key(slug)
+    workspace_id = cache.get(key)
+    if workspace_id is None:
+        workspace_id = (
+            Workspace.objects.filter(slug=slug).values_list("id", flat=True).first()
+        )
+        if workspace_id is not None:
+            cache.set(key, workspace_id, CACHE_TAG_TIMEOUT)
+    return workspace_id
+
+
 def issue_group_values(field, slug, project_id=None, filters=dict):
+    if field not in CACHED_GROUP_FIELDS:
+        return query_group_values(field, slug, project_id, filters)
+
+    if project_id:
+        tag = group_values_cache_tag(project_id=project_id)
+    else:
+        workspace_id = workspace_id_from_slug(slug)
+        if workspace_id is None:
+            return query_group_values(field, slug, project_id, filters)
+        tag = group_values_cache_tag(workspace_id=workspace_id)
+
+    key = versioned_cache_key(f"group_values:{field}:{slug}:{project_id}", [tag])
+    values = cache.get(key)
+    if values is None:
+        values = list(query_group_values(field, slug, project_id, filters))
+        cache.set(key, values, GROUP_VALUES_CACHE_TIMEOUT)
+    return values
+
+
+def query_group_values(field, slug, project_id=None, filters=dict):
     if field == "state_id":
         queryset = State.objects.filter(
             is_triage=False, workspace__slug=slug
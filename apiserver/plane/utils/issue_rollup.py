@@ -0,0 +1,153 @@
+# Django imports
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import (
+    Count,
+    F,
+    FloatField,
+    IntegerField,
+    Q,
+    Sum,
+    UUIDField,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleRollup,
+    Issue,
+    Module,
+    ModuleIssue,
+    ModuleRollup,
+)
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+
+ROLLUP_FIELDS = (
+    ["total_issues", "total_estimate_points", "assignee_ids"]
+    + [f"{group}_issues" for group in STATE_GROUPS]
+    + [f"{group}_estimate_points" for group in STATE_GROUPS]
+)
+
+ROLLUP_BATCH_SIZE = 500
+
+# Rollups are refreshed from the issue activities of the cycles and modules the
+# issues are or were in. A change made without an activity, e.g. a queryset
+# update or a state moved to another group, shows up with the next activity of
+# the cycle or module, or when `rebuild_issue_rollups` is run.
+
+
+def rollup_aggregates():
+    """Issue counts and estimate points of every state group"""
+    points = Q(estimate_point__estimate__type="points")
+    value = Cast("estimate_point__value", FloatField())
+    return {
+        "total_issues": Count("id"),
+        "total_estimate_points": Sum(value, filter=points, default=0),
+        **{
+            f"{group}_issues": Count("id", filter=Q(state__group=group))
+            for group in STATE_GROUPS
+        },
+        **{
+            f"{group}_estimate_points": Sum(
+                value, filter=points & Q(state__group=group), default=0
+            )
+            for group in STATE_GROUPS
+        },
+    }
+
+
+def refresh_rollups(model, rollup_model, relation, field, ids):
+    """Recompute the rollups of the given cycles or modules, a few grouped
+    queries per batch however many issues they hold"""
+    ids = sorted({str(pk) for pk in ids if pk})
+    for start in range(0, len(ids), ROLLUP_BATCH_SIZE):
+        # Cycles and modules removed since the activity have nothing to roll up
+        batch = model.all_objects.filter(
+            pk__in=ids[start : start + ROLLUP_BATCH_SIZE]
+        ).values_list("id", flat=True)
+        rollups = {str(pk): rollup_model(**{f"{field}_id": pk}) for pk in batch}
+        if not rollups:
+            continue
+
+        group_key = f"{relation}__{field}_id"
+        issues = Issue.issue_objects.filter(
+            **{
+                f"{group_key}__in": list(rollups),
+                f"{relation}__deleted_at__isnull": True,
+            }
+        )
+
+        for row in issues.values(group_key).annotate(**rollup_aggregates()).order_by():
+            rollup = rollups[str(row.pop(group_key))]
+            for key, value in row.items():
+                setattr(rollup, key, value)
+
+        assignees = (
+            issues.filter(
+                issue_assignee__isnull=False, issue_assignee__deleted_at__isnull=True
+            )
+            .values(group_key)
+            .annotate(
+                assignee_ids=ArrayAgg("issue_assignee__assignee_id", distinct=True)
+            )
+            .order_by()
+        )
+        for row in assignees:
+            rollups[str(row[group_key])].assignee_ids = row["assignee_ids"]
+
+        rollup_model.objects.bulk_create(
+            rollups.values(),
+            update_conflicts=True,
+            unique_fields=[field],
+            update_fields=ROLLUP_FIELDS + ["updated_at"],
+        )
+
+
+def refresh_cycle_rollups(cycle_ids):
+    refresh_rollups(Cycle, CycleRollup, "issue_cycle", "cycle", cycle_ids)
+
+
+def refresh_module_rollups(module_ids):
+    refresh_rollups(Module, ModuleRollup, "issue_module", "module", module_ids)
+
+
+def refresh_issue_rollups(issue_ids, activities=()):
+    """Refresh the rollups of every cycle and module the issues are or were in"""
+    cycle_ids = set(
+        CycleIssue.all_objects.filter(issue_id__in=issue_ids).values_list(
+            "cycle_id", flat=True
+        )
+    )
+    module_ids = set(
+        ModuleIssue.all_objects.filter(issue_id__in=issue_ids).values_list(
+            "module_id", flat=True
+        )
+    )
+    # The relations of issues moved out may already be gone
+    for activity in activities:
+        if activity.field == "cycles":
+            cycle_ids.update([activity.old_identifier, activity.new_identifier])
+        elif activity.field == "modules":
+            module_ids.update([activity.old_identifier, activity.new_identifier])
+
+    refresh_cycle_rollups(cycle_ids)
+    refresh_module_rollups(module_ids)
+
+
+def rollup_annotations(*fields):
+    """Annotations reading the rollup of a cycle or module, zero until the
+    first issue activity of a new cycle or module"""
+    annotations = {}
+    for field in fields:
+        if field == "assignee_ids":
+            default = Value([], output_field=ArrayField(UUIDField()))
+        elif field.endswith("_estimate_points"):
+            default = Value(0, output_field=FloatField())
+        else:
+            default = Value(0, output_field=IntegerField())
+        annotations[field] = Coalesce(F(f"rollup__{field}"), default)
+    return annotations
@@ -2,10 +2,54 @@
 import re
 
 # Django imports
-from django.db.models import Q
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorExact,
+)
+from django.db.models import Q, Value
 
 # Module imports
 
+# Has to match the config of the search indexes on issues, pages, cycles and
+# modules, postgres only uses an expression index when the expression is equal
+SEARCH_CONFIG = "simple"
+
+
+def search_vector(field="name"):
+    """Search document of a field as indexed on the searchable tables"""
+    return SearchVector(field, config=SEARCH_CONFIG)
+
+
+def search_query(query):
+    """Prefix query matching all the terms of the search for type-ahead"""
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
+
+
+def search_filter(query, field="name"):
+    """Predicate matching the query against the search index of the field"""
+    prefix_query = search_query(query)
+    if prefix_query is None:
+        # Nothing to look up in the index, e.g. a query made of punctuation
+        return Q(**{f"{field}__icontains": query})
+    return Q(SearchVectorExact(search_vector(field), prefix_query))
+
+
+def search_rank(query, field="name"):
+    """Rank of the field against the query, to order the search results"""
+    prefix_query = search_query(query)
+    if prefix_query is None:
+        return Value(0.0)
+    return SearchRank(search_vector(field), prefix_query)
+
 
 def search_issues(query, queryset):
     fields = ["name", "sequence_id", "project__identifier"]
@@ -15,6 +59,13 @@ def search_issues(query, queryset):
             sequences = re.findall(r"\b\d+\b", query)
             for sequence_id in sequences:
                 q |= Q(**{"sequence_id": sequence_id})
+        elif field == "name":
+            q |= search_filter(query, field)
         else:
             q |= Q(**{f"{field}__icontains": query})
-    return queryset.filter(q).distinct()
+    return (
+        queryset.filter(q)
+        .annotate(search_rank=search_rank(query))
+        .order_by("-search_rank", "-created_at")
+        .distinct()
+    )
@@ -0,0 +1,167 @@
+# Python imports
+import struct
+import zlib
+from difflib import SequenceMatcher
+from itertools import accumulate
+
+# Django imports
+from django.db import transaction
+
+# Module imports
+from plane.db.models import Page, PageVersion
+
+PAGE_VERSION_LIMIT = 20
+# Versions stored as deltas against a snapshot before the next snapshot
+PAGE_VERSION_SNAPSHOT_INTERVAL = 10
+
+# Deltas are a sequence of copies from the snapshot and inserted bytes
+COPY = struct.Struct(">cII")
+INSERT = struct.Struct(">cI")
+
+# Bytes the descriptions are split after, so unchanged tags and Yjs
+# structs line up between versions
+HTML_DELIMITER = b">"
+BINARY_DELIMITER = b"\x00"
+
+
+def tokenize(data, delimiter):
+    parts = data.split(delimiter)
+    return [part + delimiter for part in parts[:-1]] + [parts[-1]]
+
+
+def make_delta(base, target, delimiter):
+    """Encode the target as copies of token runs of the base and inserts"""
+    base_tokens = tokenize(base, delimiter)
+    target_tokens = tokenize(target, delimiter)
+    offsets = list(accumulate(map(len, base_tokens), initial=0))
+
+    delta = bytearray()
+    matcher = SequenceMatcher(None, base_tokens, target_tokens)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            delta += COPY.pack(b"c", offsets[i1], offsets[i2] - offsets[i1])
+        elif j1 < j2:
+            data = b"".join(target_tokens[j1:j2])
+            delta += INSERT.pack(b"i", len(data)) + data
+    return bytes(delta)
+
+
+def apply_delta(base, delta):
+    data = bytearray()
+    position = 0
+    while position < len(delta):
+        if delta[position : position + 1] == b"c":
+            _, start, length = COPY.unpack_from(delta, position)
+            data += base[start : start + length]
+            position += COPY.size
+        else:
+            _, length = INSERT.unpack_from(delta, position)
+            position += INSERT.size
+            data += delta[position : position + length]
+            position += length
+    return bytes(data)
+
+
+def compress(data):
+    return None if data is None else zlib.compress(data)
+
+
+def decompress(data):
+    return None if data is None else zlib.decompress(data)
+
+
+def snapshot_description(version):
+    """Description html and binary of a version, as bytes"""
+    if version.html_data is None:
+        # Versions saved before the compressed storage
+        binary = version.description_binary
+        html = (version.description_html or "").encode()
+        return html, None if binary is None else bytes(binary)
+
+    html = decompress(version.html_data)
+    binary = decompress(version.binary_data)
+    if version.base_id is None:
+        return html, binary
+
+    base_html, base_binary = snapshot_description(version.base)
+    return (
+        apply_delta(base_html, html),
+        None if binary is None else apply_delta(base_binary or b"", binary),
+    )
+
+
+def page_version_description(version):
+    """Rebuild the description html and binary of a page version"""
+    html, binary = snapshot_description(version)
+    return html.decode(), binary
+
+
+def create_page_version(page_id, user_id):
+    """Store the current description of the page as a new version, as a delta
+    against the last snapshot until the snapshot interval is reached, and
+    drop the versions past the limit"""
+    with transaction.atomic():
+        # Versions of a page are written one at a time
+        page = Page.objects.select_for_update().get(id=page_id)
+        html = (page.description_html or "").encode()
+        binary = (
+            None if page.description_binary is None else bytes(page.description_binary)
+        )
+
+        version = PageVersion(
+            page_id=page_id,
+            workspace_id=page.workspace_id,
+            description_html="",
+            owned_by_id=user_id,
+            last_saved_at=page.updated_at,
+            html_data=compress(html),
+            binary_data=compress(binary),
+        )
+
+        latest = (
+            PageVersion.objects.filter(page_id=page_id, html_data__isnull=False)
+            .order_by("-last_saved_at")
+            .only("id", "base_id")
+            .first()
+        )
+        base_id = latest and (latest.base_id or latest.id)
+        if (
+            base_id
+            and PageVersion.objects.filter(base_id=base_id).count()
+            < PAGE_VERSION_SNAPSHOT_INTERVAL - 1
+        ):
+            base_html, base_binary = snapshot_description(
+                PageVersion.objects.get(pk=base_id)
+            )
+            html_data = compress(make_delta(base_html, html, HTML_DELIMITER))
+            binary_data = (
+                None
+                if binary is None
+                else compress(make_delta(base_binary or b"", binary, BINARY_DELIMITER))
+            )
+            # A page rewritten since the snapshot is better off as a new one
+            delta_size = len(html_data) + len(binary_data or b"")
+            if delta_size < len(version.html_data) + len(version.binary_data or b""):
+                version.base_id = base_id
+                version.html_data = html_data
+                version.binary_data = binary_data
+
+        version.save()
+        prune_page_versions(page_id)
+    return version
+
+
+def prune_page_versions(page_id):
+    """Drop the versions past the limit in a single statement, keeping the
+    snapshots the remaining versions are stored against"""
+    versions = PageVersion.objects.filter(page_id=page_id)
+    kept = versions.order_by("-last_saved_at").values("id")[:PAGE_VERSION_LIMIT]
+    return (
+        versions.exclude(id__in=kept)
+        .exclude(
+            id__in=PageVersion.objects.filter(id__in=kept, base__isnull=False).values(
+                "base_id"
+            )
+        )
+        .delete()
+    )
@@ -1,11 +1,29 @@
 # Python imports
+import base64
+import json
 import math
 from collections import defaultdict
 from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.core.exceptions import ValidationError
+from django.db.models import (
+    Case,
+    Count,
+    F,
+    Func,
+    IntegerField,
+    Max,
+    Q,
+    QuerySet,
+    When,
+    Window,
+)
 from django.db.models.functions import RowNumber
+from django.db.models.query import ValuesIterable
 
 # Third party imports
 from rest_framework.exceptions import ParseError
@@ -55,6 +73,79 @@ class Cursor:
             raise ValueError(f"Invalid cursor format: {e}")
 
 
+def _encode_seek_value(value):
+    # Keep full precision, row comparisons in the seek predicate are exact
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+class SeekCursor(Cursor):
+    """
+    Opaque keyset cursor. It carries the `(order_key, created_at, id)` tuple of
+    the last row returned for every group that still has results, along with
+    the totals computed on the first page so deep pages never re-count.
+    """
+
+    prefix = "seek:"
+
+    def __init__(
+        self,
+        value,
+        positions=None,
+        hits=None,
+        max_hits=None,
+        is_prev=False,
+        has_results=None,
+    ):
+        super().__init__(value, 0, is_prev, has_results)
+        # List of [group values, position] pairs, None on the first page
+        self.positions = positions
+        self.hits = hits
+        self.max_hits = max_hits
+
+    def __str__(self):
+        payload = json.dumps(
+            {"v": self.value, "p": self.positions, "h": self.hits, "m": self.max_hits},
+            default=_encode_seek_value,
+            separators=(",", ":"),
+        )
+        token = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+        return f"{self.prefix}{token}"
+
+    def __repr__(self):
+        return f"{type(self).__name__}: value={self.value} positions={self.positions}"
+
+    @classmethod
+    def from_string(cls, value):
+        """Return the cursor value from the opaque string format"""
+        try:
+            if not value.startswith(cls.prefix):
+                raise ValueError(f"Cursor must start with '{cls.prefix}'")
+            token = value[len(cls.prefix) :]
+            payload = json.loads(
+                base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            )
+            positions = payload.get("p")
+            if positions is not None and not all(
+                isinstance(group, list)
+                and isinstance(position, list)
+                and len(position) == 3
+                for group, position in positions
+            ):
+                raise ValueError("Malformed cursor positions")
+            return cls(
+                int(payload["v"]),
+                positions=positions,
+                hits=payload.get("h"),
+                max_hits=payload.get("m"),
+            )
+        except (TypeError, ValueError, KeyError, AttributeError) as e:
+            raise ValueError(f"Invalid cursor format: {e}")
+
+
 class CursorResult(Sequence):
     def __init__(self, results, next, prev, hits=None, max_hits=None):
         self.results = results
@@ -83,6 +174,13 @@ class CursorResult(Sequence):
 MAX_LIMIT = 1000
 
 
+class WindowSum(Func):
+    # SUM over a window, unlike `Sum` it can take an aggregate of the grouped rows
+    function = "SUM"
+    output_field = IntegerField()
+    window_compatible = True
+
+
 class BadPaginationError(Exception):
     pass
 
@@ -117,6 +215,10 @@ class OffsetPaginator:
         self.on_results = on_results
 
     def get_result(self, limit=1000, cursor=None):
+        # Keyset pagination
+        if isinstance(cursor, SeekCursor):
+            return self.get_seek_result(limit=limit, cursor=cursor)
+
         # offset is page #
         # value is page limit
         if cursor is None:
@@ -178,6 +280,155 @@ class OffsetPaginator:
             max_hits=max_hits,
         )
 
+    def seek_order_by(self):
+        # Total ordering for keyset pagination, `id` breaks the created_at ties
+        ordering = [F("created_at").desc(), F("id").desc()]
+        if self.key:
+            ordering.insert(
+                0,
+                (
+                    F(*self.key).desc(nulls_last=True)
+                    if self.desc
+                    else F(*self.key).asc(nulls_last=True)
+                ),
+            )
+        return ordering
+
+    def seek_fields(self):
+        # Fields making up a row position in the seek ordering
+        return [*self.key, "created_at", "id"] if self.key else ["created_at", "id"]
+
+    def seek_filter(self, position):
+        # Rows strictly after the given (order_key, created_at, id) position
+        key_value, created_at, pk = position
+        tie = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        if not self.key:
+            return tie
+
+        field = self.key[0]
+        # Nulls are always sorted last
+        if key_value is None:
+            return Q(**{f"{field}__isnull": True}) & tie
+
+        lookup = "lt" if self.desc else "gt"
+        return (
+            Q(**{f"{field}__{lookup}": key_value})
+            | Q(**{f"{field}__isnull": True})
+            | (Q(**{field: key_value}) & tie)
+        )
+
+    def seek_group_filter(self, positions, group_fields):
+        # OR of the per group seek predicates, groups without a position are done
+        query = Q()
+        for group_values, position in positions:
+            group_query = Q()
+            for field, value in zip(group_fields, group_values):
+                group_query &= (
+                    Q(**{f"{field}__isnull": True})
+                    if value is None
+                    else Q(**{field: value})
+                )
+            query |= group_query & self.seek_filter(position)
+        return query
+
+    def seek_max_hits(self, queryset, hits, limit):
+        return math.ceil(hits / limit)
+
+    def get_seek_result(self, limit=1000, cursor=None, group_fields=None):
+        """
+        Keyset (seek) pagination, pages are fetched with a predicate on the last
+        seen row instead of an offset so deep pages cost the same as the first
+        one. For grouped pagination every group seeks from its own position.
+        """
+        limit = min(limit, self.max_limit)
+        group_fields = group_fields or []
+
+        queryset = self.queryset
+        try:
+            if cursor.positions is not None:
+                # Every group has been exhausted
+                if not cursor.positions:
+                    queryset = queryset.none()
+                elif group_fields:
+                    queryset = queryset.filter(
+                        self.seek_group_filter(cursor.positions, group_fields)
+                    )
+                else:
+                    queryset = queryset.filter(self.seek_filter(cursor.positions[0][1]))
+        except (ValidationError, ValueError, TypeError):
+            raise BadPaginationError("Invalid cursor position")
+
+        if group_fields:
+            # Number the rows that are left in each group
+            queryset = queryset.annotate(
+                row_number=Window(
+                    expression=RowNumber(),
+                    partition_by=[F(field) for field in group_fields],
+                    order_by=self.seek_order_by(),
+                )
+            )
+            rows = queryset.filter(row_number__lte=limit + 1).values_list(
+                *group_fields, *self.seek_fields(), "row_number"
+            )
+            results = queryset.filter(row_number__lte=limit).order_by(
+                *self.seek_order_by()
+            )
+        else:
+            queryset = queryset.order_by(*self.seek_order_by())
+            rows = (
+                (*row, row_number)
+                for row_number, row in enumerate(
+                    queryset.values_list(*self.seek_fields())[: limit + 1], start=1
+                )
+            )
+            results = queryset[:limit]
+
+        # Keep the last position of every group that has more rows
+        last_positions = {}
+        pending_groups = []
+        for row in rows:
+            row_number = row[-1]
+            group_values = list(row[: len(group_fields)])
+            position = list(row[len(group_fields) : -1])
+            if not self.key:
+                position.insert(0, None)
+            if row_number == limit:
+                last_positions[tuple(group_values)] = position
+            elif row_number > limit:
+                pending_groups.append(group_values)
+
+        positions = [
+            [group_values, last_positions[tuple(group_values)]]
+            for group_values in pending_groups
+        ]
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        # The totals are only computed on the first page and carried forward
+        hits, max_hits = cursor.hits, cursor.max_hits
+        if hits is None:
+            hits = self.queryset.count()
+            max_hits = self.seek_max_hits(self.queryset, hits, limit)
+
+        next_cursor = SeekCursor(
+            limit,
+            positions=positions,
+            hits=hits,
+            max_hits=max_hits,
+            has_results=bool(positions),
+        )
+        # Keyset cursors only move forward
+        prev_cursor = SeekCursor(limit, is_prev=True, has_results=False)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=hits,
+            max_hits=max_hits,
+        )
+
     def process_results(self, results):
         raise NotImplementedError
 
@@ -190,6 +441,9 @@ class GroupedOffsetPaginator(OffsetPaginator):
         "issue_module__module_id": "module_ids",
     }
 
+    # Window totals annotated on every row of an offset page
+    WINDOW_FIELDS = ["window_hits", "window_group_rows", "window_group_count"]
+
     def __init__(
         self,
         queryset,
@@ -209,7 +463,32 @@ class GroupedOffsetPaginator(OffsetPaginator):
         # Set the count filter - this are extra filters that need to be passed to calculate the counts with the filters
         self.count_filter = count_filter
 
+        # Set while an offset page waits to be fetched along with its totals
+        self.cursor_result = None
+        self.total_group_dict = None
+
+    def group_count(self, queryset):
+        # Issues of the group matching the count filter, as a window
+        partition_by = [F(self.group_by_field_name)]
+        if self.count_filter is None:
+            return Window(expression=Count("id"), partition_by=partition_by)
+
+        counted = Case(
+            When(self.count_filter, then=1), default=0, output_field=IntegerField()
+        )
+        if queryset.query.group_by is not None:
+            # An aggregated queryset has one row per issue and group, the
+            # joined rows of the filter are folded into it first
+            counted = Max(counted)
+        return Window(expression=WindowSum(counted), partition_by=partition_by)
+
     def get_result(self, limit=50, cursor=None):
+        # Keyset pagination with a seek predicate per group
+        if isinstance(cursor, SeekCursor):
+            return self.get_seek_result(
+                limit=limit, cursor=cursor, group_fields=[self.group_by_field_name]
+            )
+
         # offset is page #
         # value is page limit
         if cursor is None:
@@ -232,9 +511,8 @@ class GroupedOffsetPaginator(OffsetPaginator):
         if offset < 0:
             raise BadPaginationError("Pagination offset cannot be negative")
 
-        # Compute the results
-        results = {}
-        # Create window for all the groups
+        # Create window for all the groups, the totals are computed by the
+        # same query as the rows of the page
         queryset = queryset.annotate(
             row_number=Window(
                 expression=RowNumber(),
@@ -249,7 +527,12 @@ class GroupedOffsetPaginator(OffsetPaginator):
                     ),
                     F("created_at").desc(),
                 ),
-            )
+            ),
+            window_hits=Window(expression=Count("id")),
+            window_group_rows=Window(
+                expression=Count("id"), partition_by=[F(self.group_by_field_name)]
+            ),
+            window_group_count=self.group_count(queryset),
         )
         # Filter the results by row number
         results = queryset.filter(row_number__gt=offset, row_number__lt=stop).order_by(
@@ -261,53 +544,98 @@ class GroupedOffsetPaginator(OffsetPaginator):
             F("created_at").desc(),
         )
 
-        # Adjust cursors based on the grouped results for pagination
-        next_cursor = Cursor(
-            limit, page + 1, False, queryset.filter(row_number__gte=stop).exists()
+        # The hits, the next cursor and the totals are read from the rows of
+        # the page once they are fetched in `process_results`
+        self.page, self.limit, self.stop = page, limit, stop
+        self.windowed_queryset = queryset
+        self.cursor_result = CursorResult(
+            results=results,
+            next=Cursor(limit, page + 1, False, False),
+            prev=Cursor(limit, page - 1, True, page > 0),
+            hits=0,
+            max_hits=0,
+        )
+        return self.cursor_result
+
+    def seek_max_hits(self, queryset, hits, limit):
+        # Pages needed for the largest group
+        if not hits:
+            return 0
+        return math.ceil(
+            queryset.values(self.group_by_field_name)
+            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
+            .order_by("-count")[0]["count"]
+            / limit
         )
 
-        # Add previous cursors
-        prev_cursor = Cursor(limit, page - 1, True, page > 0)
-
-        # Count the queryset
-        count = queryset.count()
-
-        # Optionally, calculate the total count and max_hits if needed
-        # This might require adjustments based on specific use cases
-        if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(count=Count("id", filter=self.count_filter, distinct=True))
-                .order_by("-count")[0]["count"]
-                / limit
+    def fetch_page(self, results):
+        """Fetch the rows of an offset page along with the window totals and
+        fill in the cursor result, a single query for the first page"""
+        if isinstance(results, QuerySet) and issubclass(
+            results._iterable_class, ValuesIterable
+        ):
+            fields = [*results.query.values_select, *results.query.annotation_select]
+            if self.group_by_field_name not in fields:
+                fields.append(self.group_by_field_name)
+            # Select the window totals left out by the values of `on_results`
+            results = results.all()
+            results.query.set_annotation_mask(None)
+            results = list(results.values(*fields, *self.WINDOW_FIELDS))
+            windows = results
+        else:
+            # Rows fetched in another shape by `on_results` are counted apart
+            results = list(results)
+            windows = list(
+                self.cursor_result.results.values(
+                    self.group_by_field_name, *self.WINDOW_FIELDS
+                )
             )
+
+        hits, has_next, counts = 0, False, {}
+        for window in windows:
+            hits = window.pop("window_hits")
+            has_next = has_next or window.pop("window_group_rows") >= self.stop
+            counts[window[self.group_by_field_name]] = window.pop("window_group_count")
+
+        if self.page:
+            # Groups exhausted before this page are counted separately
+            max_count = self.__set_totals(self.__get_total_queryset())
+            if not windows:
+                hits = self.windowed_queryset.count()
         else:
-            max_hits = 0
-        return CursorResult(
-            results=results,
-            next=next_cursor,
-            prev=prev_cursor,
-            hits=count,
-            max_hits=max_hits,
+            max_count = self.__set_totals(counts.items())
+
+        self.cursor_result.results = results
+        self.cursor_result.hits = hits
+        self.cursor_result.max_hits = (
+            math.ceil(max_count / self.limit) if results else 0
         )
+        self.cursor_result.next.has_results = has_next
+        return results
 
     def __get_total_queryset(self):
         # Get total items for each group
         return (
-            self.queryset.values(self.group_by_field_name)
+            self.queryset.values_list(self.group_by_field_name)
             .annotate(count=Count("id", filter=self.count_filter, distinct=True))
             .order_by()
         )
 
-    def __get_total_dict(self):
+    def __set_totals(self, counts):
         # Convert the total into dictionary of keys as group name and value as the total
-        total_group_dict = {}
-        for group in self.__get_total_queryset():
-            total_group_dict[str(group.get(self.group_by_field_name))] = (
-                total_group_dict.get(str(group.get(self.group_by_field_name)), 0)
-                + (1 if group.get("count") == 0 else group.get("count"))
-            )
-        return total_group_dict
+        self.total_group_dict = {}
+        max_count = 0
+        for group, count in counts:
+            self.total_group_dict[str(group)] = self.total_group_dict.get(
+                str(group), 0
+            ) + (1 if count == 0 else count)
+            max_count = max(max_count, count)
+        return max_count
+
+    def __get_total_dict(self):
+        if self.total_group_dict is None:
+            self.__set_totals(self.__get_total_queryset())
+        return self.total_group_dict
 
     def __get_field_dict(self):
         # Create a field dictionary
@@ -377,6 +705,10 @@ class GroupedOffsetPaginator(OffsetPaginator):
         return processed_results
 
     def process_results(self, results):
+        # Offset pages are fetched here along with their totals
+        if self.cursor_result is not None:
+            results = self.fetch_page(results)
+
         # Process results
         if results:
             if self.group_by_field_name in self.FIELD_MAPPER:
@@ -422,6 +754,14 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         self.count_filter = count_filter
 
     def get_result(self, limit=30, cursor=None):
+        # Keyset pagination with a seek predicate per group and sub group
+        if isinstance(cursor, SeekCursor):
+            return self.get_seek_result(
+                limit=limit,
+                cursor=cursor,
+                group_fields=[self.group_by_field_name, self.sub_group_by_field_name],
+            )
+
         # offset is page #
         # value is page limit
         if cursor is None:
@@ -509,6 +849,18 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             max_hits=max_hits,
         )
 
+    def seek_max_hits(self, queryset, hits, limit):
+        # Pages needed for the largest sub group, every sub group of a group
+        # seeks from its own position
+        if not hits:
+            return 0
+        return math.ceil(
+            queryset.values(self.group_by_field_name, self.sub_group_by_field_name)
+            .annotate(count=Count("id", filter=self.count_filter, distinct=True))
+            .order_by("-count")[0]["count"]
+            / limit
+        )
+
     def __get_group_total_queryset(self):
         # Get group totals
         return (
@@ -698,12 +1050,22 @@ class BasePaginator:
     ):
         """Paginate the request"""
         per_page = self.get_per_page(request, default_per_page, max_per_page)
+        cursor_value = request.GET.get(self.cursor_name)
+
+        # Keyset pagination is opted in with `pagination=seek`
+        if cursor_cls is Cursor and (
+            request.GET.get("pagination") == "seek"
+            or (cursor_value or "").startswith(SeekCursor.prefix)
+        ):
+            cursor_cls = SeekCursor
+
         # Convert the cursor value to integer and float from string
         input_cursor = None
         try:
-            input_cursor = cursor_cls.from_string(
-                request.GET.get(self.cursor_name, f"{per_page}:0:0")
-            )
+            if cursor_cls is SeekCursor and not cursor_value:
+                input_cursor = SeekCursor(per_page)
+            else:
+                input_cursor = cursor_cls.from_string(cursor_value or f"{per_page}:0:0")
         except ValueError:
             raise ParseError(detail="Invalid cursor parameter.")
 
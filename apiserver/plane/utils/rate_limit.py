@@ -0,0 +1,107 @@
+# Python imports
+import math
+from functools import lru_cache
+
+# Third party imports
+from rest_framework.throttling import SimpleRateThrottle
+
+# Module imports
+from plane.settings.redis import redis_client
+from plane.utils.exception_logger import log_exception
+
+# Token bucket refilled continuously at the rate of the throttle, holding up to
+# the rate plus the burst allowance. The bucket is refilled, checked and drawn
+# from in a single round trip so concurrent workers can not overdraw it. The
+# clock is the one of redis, skewed worker clocks can not refill the bucket.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+
+-- Replicated by its writes, a script reading the time is not deterministic
+if redis.replicate_commands then
+    redis.replicate_commands()
+end
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "timestamp")
+local tokens = tonumber(bucket[1])
+local timestamp = tonumber(bucket[2])
+if tokens == nil or timestamp == nil then
+    tokens = capacity
+else
+    tokens = math.min(capacity, tokens + math.max(0, now - timestamp) * refill_rate)
+end
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "timestamp", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / refill_rate) + 1)
+return {allowed, tostring(tokens), tostring(now)}
+"""
+
+
+@lru_cache(maxsize=None)
+def token_bucket():
+    # Runs with EVALSHA, the script is only sent again after a redis restart
+    return redis_client().register_script(TOKEN_BUCKET_SCRIPT)
+
+
+class RedisRateThrottle(SimpleRateThrottle):
+    """Throttle keeping a token bucket per key in redis.
+
+    The bucket is a small hash updated atomically by a script, so the cost of
+    a request does not grow with the rate. `rate` is the sustained rate and
+    `burst` the number of requests allowed on top of it after an idle period.
+    Requests are let through when redis is unavailable.
+    """
+
+    burst = 0
+
+    def get_rate(self):
+        # A scope without a configured rate is not throttled
+        return self.THROTTLE_RATES.get(self.scope)
+
+    @property
+    def capacity(self):
+        return self.num_requests + self.burst
+
+    @property
+    def refill_rate(self):
+        return self.num_requests / self.duration
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        try:
+            allowed, tokens, now = token_bucket()(
+                keys=[self.key], args=[self.capacity, self.refill_rate]
+            )
+        except Exception as e:
+            log_exception(e)
+            return True
+
+        self.tokens = float(tokens)
+        self.now = float(now)
+        return bool(allowed)
+
+    def remaining(self):
+        return int(self.tokens)
+
+    def reset_time(self):
+        """Unix timestamp at which the bucket is full again"""
+        return math.ceil(self.now + (self.capacity - self.tokens) / self.refill_rate)
+
+    def wait(self):
+        if self.tokens >= 1:
+            return None
+        return (1 - self.tokens) / self.refill_rate